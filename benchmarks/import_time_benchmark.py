@@ -0,0 +1,89 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark the time of importing the modules of the SDK.
+
+Each module is imported in a new interpreter, and the median of the import time is
+reported, together with the number of the vendored client modules (`pai.libs`)
+loaded by the import.
+
+Usage::
+
+    python benchmarks/import_time_benchmark.py --repeat 10
+
+    # Exit with a non-zero code if importing `pai.predictor` takes more than 0.5s.
+    python benchmarks/import_time_benchmark.py pai.predictor --max-seconds 0.5
+
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_DEFAULT_MODULES = ["pai", "pai.predictor", "pai.estimator"]
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+libs = [m for m in sys.modules if m.startswith("pai.libs.")]
+print(json.dumps({{"seconds": elapsed, "libs": len(libs)}}))
+"""
+
+
+def measure(module: str):
+    """Import the module in a new interpreter, returns the import time in seconds
+    and the number of the loaded vendored client modules."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", _IMPORT_SCRIPT.format(module=module)]
+    )
+    result = json.loads(output.decode().strip().splitlines()[-1])
+    return result["seconds"], result["libs"]
+
+
+def run(modules, repeat: int, max_seconds: float = None) -> bool:
+    print("{:<20}{:>12}{:>12}{:>12}".format("module", "median(s)", "min(s)", "libs"))
+    passed = True
+    for module in modules:
+        # The first run warms up the bytecode cache.
+        measure(module)
+        results = [measure(module) for _ in range(repeat)]
+        seconds = [r[0] for r in results]
+        median = statistics.median(seconds)
+        print(
+            "{:<20}{:>12.3f}{:>12.3f}{:>12}".format(
+                module, median, min(seconds), results[-1][1]
+            )
+        )
+        if max_seconds is not None and median > max_seconds:
+            passed = False
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=_DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Fail if the median import time of a module exceeds the limit.",
+    )
+    args = parser.parse_args()
+    if not run(args.modules, repeat=args.repeat, max_seconds=args.max_seconds):
+        sys.exit(1)
@@ -0,0 +1,348 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark uploading/downloading directories with many small files to OSS.
+
+The concurrent transfer of `pai.common.oss_utils` is compared against the previous
+implementation, which transfers the files one by one with the resumable API. The
+benchmark runs against a local in-memory OSS stand-in, which adds a fixed latency to
+each request to simulate the round trip to an OSS endpoint.
+
+Usage::
+
+    # 2000 files of 4 KB, with 20ms latency per request.
+    python benchmarks/oss_transfer_benchmark.py --files 2000 --file-size 4096 \
+        --latency 20
+
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+from xml.sax.saxutils import escape
+
+import oss2
+
+from pai.common import oss_utils
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accept the bursts of connections from concurrent transfers.
+    request_queue_size = 256
+
+
+class LocalOssServer(object):
+    """A local in-memory server that implements the subset of the OSS API used by
+    oss2 for object upload/download and listing (path style requests)."""
+
+    def __init__(self, latency: float = 0):
+        self.latency = latency
+        self.objects = {}
+        self.uploads = {}
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = _HTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        return "http://127.0.0.1:{}".format(self._server.server_address[1])
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, avoid the delayed ACK.
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _parse(self):
+                with server._lock:
+                    server.request_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                parsed = urlparse(self.path)
+                _, bucket, key = (parsed.path.split("/", 2) + [""])[:3]
+                query = {k: v[0] for k, v in parse_qs(parsed.query, True).items()}
+                return unquote(key), query
+
+            def _read_body(self):
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def _respond(self, status=200, body=b"", headers=None, head=False):
+                self.send_response(status)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("x-oss-request-id", uuid.uuid4().hex)
+                self.end_headers()
+                if not head:
+                    self.wfile.write(body)
+
+            def _not_found(self, head=False):
+                body = (
+                    b"<?xml version='1.0' encoding='UTF-8'?><Error>"
+                    b"<Code>NoSuchKey</Code><Message>Not found</Message></Error>"
+                )
+                self._respond(404, body, {"Content-Type": "application/xml"}, head)
+
+            def _object_headers(self, data):
+                return {
+                    "ETag": '"{}"'.format(hashlib.md5(data).hexdigest().upper()),
+                    "Last-Modified": formatdate(usegmt=True),
+                    "Content-Type": "application/octet-stream",
+                }
+
+            def do_PUT(self):
+                key, query = self._parse()
+                data = self._read_body()
+                if "uploadId" in query:
+                    server.uploads[query["uploadId"]][int(query["partNumber"])] = data
+                else:
+                    server.objects[key] = data
+                self._respond(headers=self._object_headers(data))
+
+            def do_POST(self):
+                key, query = self._parse()
+                body = self._read_body()
+                if "uploads" in query:
+                    upload_id = uuid.uuid4().hex
+                    server.uploads[upload_id] = {}
+                    result = (
+                        "<InitiateMultipartUploadResult><Bucket>bucket</Bucket>"
+                        f"<Key>{escape(key)}</Key><UploadId>{upload_id}</UploadId>"
+                        "</InitiateMultipartUploadResult>"
+                    )
+                else:
+                    parts = server.uploads.pop(query["uploadId"])
+                    numbers = re.findall(rb"<PartNumber>(\d+)</PartNumber>", body)
+                    data = b"".join(parts[int(n)] for n in numbers)
+                    server.objects[key] = data
+                    result = (
+                        "<CompleteMultipartUploadResult>"
+                        f"<Key>{escape(key)}</Key>"
+                        f"<ETag>{self._object_headers(data)['ETag']}</ETag>"
+                        "</CompleteMultipartUploadResult>"
+                    )
+                self._respond(body=result.encode(), headers={"Content-Type": "xml"})
+
+            def do_HEAD(self):
+                key, _ = self._parse()
+                if key not in server.objects:
+                    return self._not_found(head=True)
+                data = server.objects[key]
+                self.send_response(200)
+                for k, v in self._object_headers(data).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+
+            def do_GET(self):
+                key, query = self._parse()
+                if not key:
+                    return self._list_objects(query)
+                if "uploadId" in query:
+                    return self._list_parts(key, query)
+                if key not in server.objects:
+                    return self._not_found()
+                data = server.objects[key]
+                headers = self._object_headers(data)
+                if "objectMeta" in query:
+                    self.send_response(200)
+                    for k, v in headers.items():
+                        self.send_header(k, v)
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    return
+                match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                if match:
+                    start = int(match.group(1))
+                    end = int(match.group(2) or len(data) - 1)
+                    headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+                    return self._respond(206, data[start : end + 1], headers)
+                self._respond(body=data, headers=headers)
+
+            def _list_parts(self, key, query):
+                parts = server.uploads[query["uploadId"]]
+                result = (
+                    "<ListPartsResult><Bucket>bucket</Bucket>"
+                    f"<Key>{escape(key)}</Key><UploadId>{query['uploadId']}</UploadId>"
+                    "<NextPartNumberMarker>0</NextPartNumberMarker>"
+                    "<IsTruncated>false</IsTruncated>"
+                    + "".join(
+                        "<Part><PartNumber>{}</PartNumber><LastModified>"
+                        "2023-01-01T00:00:00.000Z</LastModified><ETag>{}</ETag>"
+                        "<Size>{}</Size></Part>".format(
+                            n, self._object_headers(data)["ETag"], len(data)
+                        )
+                        for n, data in sorted(parts.items())
+                    )
+                    + "</ListPartsResult>"
+                )
+                self._respond(body=result.encode(), headers={"Content-Type": "xml"})
+
+            def _list_objects(self, query):
+                prefix = query.get("prefix", "")
+                start_after = query.get("continuation-token", "")
+                max_keys = int(query.get("max-keys", 100))
+                keys = sorted(
+                    k
+                    for k in server.objects
+                    if k.startswith(prefix) and k > start_after
+                )
+                truncated = len(keys) > max_keys
+                keys = keys[:max_keys]
+                contents = "".join(
+                    "<Contents><Key>{}</Key><LastModified>2023-01-01T00:00:00.000Z"
+                    '</LastModified><ETag>""</ETag><Type>Normal</Type>'
+                    "<Size>{}</Size><StorageClass>Standard</StorageClass>"
+                    "</Contents>".format(escape(k), len(server.objects[k]))
+                    for k in keys
+                )
+                result = (
+                    "<ListBucketResult><Name>bucket</Name>"
+                    f"<Prefix>{escape(prefix)}</Prefix><MaxKeys>{max_keys}</MaxKeys>"
+                    f"<KeyCount>{len(keys)}</KeyCount>"
+                    f"<IsTruncated>{str(truncated).lower()}</IsTruncated>"
+                    + (
+                        f"<NextContinuationToken>{escape(keys[-1])}"
+                        "</NextContinuationToken>"
+                        if truncated
+                        else ""
+                    )
+                    + contents
+                    + "</ListBucketResult>"
+                )
+                self._respond(body=result.encode(), headers={"Content-Type": "xml"})
+
+        return Handler
+
+
+def legacy_upload(source_dir, oss_path, bucket):
+    for root, _, files in os.walk(source_dir):
+        for name in files:
+            filename = os.path.join(root, name)
+            key = oss_path + os.path.relpath(filename, source_dir).replace(os.sep, "/")
+            oss2.resumable_upload(
+                bucket=bucket,
+                key=key,
+                filename=filename,
+                num_threads=os.cpu_count() * 2,
+            )
+
+
+def legacy_download(oss_path, local_dir, bucket):
+    for obj in oss2.ObjectIteratorV2(bucket=bucket, prefix=oss_path):
+        dest = os.path.join(local_dir, os.path.relpath(obj.key, oss_path))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        oss2.resumable_download(
+            bucket=bucket, key=obj.key, filename=dest, num_threads=os.cpu_count()
+        )
+
+
+def _make_files(root, files, file_size):
+    for i in range(files):
+        path = os.path.join(root, "shard-{:03d}".format(i % 16), f"file-{i}.bin")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(os.urandom(file_size))
+
+
+def run(files: int, file_size: int, latency: float, max_workers: int):
+    server = LocalOssServer(latency=latency / 1000).start()
+    bucket = oss2.Bucket(oss2.AnonymousAuth(), server.endpoint, "bucket")
+    mb = files * file_size / 1024 / 1024
+    print(
+        "{:<20}{:>12}{:>12}{:>12}{:>12}".format(
+            "method", "files", "MB", "seconds", "files/s"
+        )
+    )
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = os.path.join(temp_dir, "source")
+            _make_files(source_dir, files, file_size)
+
+            cases = [
+                ("legacy upload", lambda: legacy_upload(source_dir, "legacy/", bucket)),
+                (
+                    "parallel upload",
+                    lambda: oss_utils.upload(
+                        source_dir, "parallel/", bucket=bucket, max_workers=max_workers
+                    ),
+                ),
+                (
+                    "legacy download",
+                    lambda: legacy_download(
+                        "legacy/", os.path.join(temp_dir, "legacy"), bucket
+                    ),
+                ),
+                (
+                    "parallel download",
+                    lambda: oss_utils.download(
+                        "parallel/",
+                        os.path.join(temp_dir, "parallel"),
+                        bucket=bucket,
+                        max_workers=max_workers,
+                    ),
+                ),
+            ]
+            for name, fn in cases:
+                start = time.perf_counter()
+                fn()
+                elapsed = time.perf_counter() - start
+                print(
+                    "{:<20}{:>12}{:>12.2f}{:>12.2f}{:>12.1f}".format(
+                        name, files, mb, elapsed, files / elapsed
+                    )
+                )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--file-size", type=int, default=4096)
+    parser.add_argument(
+        "--latency", type=float, default=20, help="Latency per request in ms."
+    )
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+    run(
+        files=args.files,
+        file_size=args.file_size,
+        latency=args.latency,
+        max_workers=args.max_workers,
+    )
@@ -0,0 +1,91 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark building and serializing large pipelines.
+
+A pipeline of a fan-out over the partitions is built: each partition is processed by
+a chain of unnamed steps, and all the chains are merged by a final step. The time of
+constructing the pipeline, and of the first and the repeated serialization of the
+pipeline are reported.
+
+Usage::
+
+    python benchmarks/pipeline_build_benchmark.py --steps 10000
+
+"""
+
+import argparse
+import time
+
+from mock import patch
+
+from pai.pipeline import Pipeline
+from pai.pipeline.component import ContainerComponent
+from pai.pipeline.types import PipelineParameter
+
+
+def build_steps(num_steps: int, chain_length: int):
+    component = ContainerComponent(
+        image_uri="python:3",
+        inputs=[PipelineParameter(name="partition", typ=int)],
+        outputs=[PipelineParameter(name="result")],
+        command="echo hello",
+    )
+    steps = []
+    partitions = max((num_steps - 1) // chain_length, 1)
+    for partition in range(partitions):
+        prev = None
+        for _ in range(chain_length):
+            step = component.as_step(
+                inputs={"partition": partition},
+                depends=[prev] if prev else None,
+            )
+            steps.append(step)
+            prev = step
+    merge = component.as_step(name="merge", inputs={"partition": -1})
+    merge.after(*steps[chain_length - 1 :: chain_length])
+    steps.append(merge)
+    return steps
+
+
+def run(num_steps: int, chain_length: int, repeat: int):
+    steps = build_steps(num_steps, chain_length)
+
+    start = time.perf_counter()
+    pipeline = Pipeline(steps=steps)
+    build_seconds = time.perf_counter() - start
+
+    with patch("pai.pipeline.core.get_default_session", return_value=None):
+        start = time.perf_counter()
+        pipeline.to_manifest(identifier="benchmark", version="v1")
+        first_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pipeline.to_manifest(identifier="benchmark", version="v1")
+        repeat_seconds = (time.perf_counter() - start) / repeat
+
+    print("{:<28}{:>10}".format("steps", len(pipeline.steps)))
+    print("{:<28}{:>10.3f}".format("build(s)", build_seconds))
+    print("{:<28}{:>10.3f}".format("to_manifest first(s)", first_seconds))
+    print("{:<28}{:>10.3f}".format("to_manifest repeated(s)", repeat_seconds))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--chain-length", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.steps, chain_length=args.chain_length, repeat=args.repeat)
@@ -0,0 +1,206 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark the encoding/decoding throughput of TensorFlow/PyTorch serializers.
+
+The buffer based codec is compared against the previous implementation, which
+converts the array into a Python list and fills the protobuf repeated fields with it.
+
+Usage::
+
+    # MB/s of float32, int64 and string tensors with TensorFlowSerializer.
+    python benchmarks/serializer_benchmark.py tensorflow --size 1000000
+
+    # Throughput of PyTorchSerializer with batch sizes from 1 to 4096.
+    python benchmarks/serializer_benchmark.py pytorch --features 256
+
+"""
+
+import argparse
+import time
+
+import numpy as np
+from eas_prediction import pytorch_predict_pb2 as pt_pb
+from eas_prediction import tf_request_pb2 as tf_pb
+
+from pai.serializers import PyTorchSerializer, TensorFlowSerializer
+
+_VALUE_FIELDS = {
+    tf_pb.DT_FLOAT: "float_val",
+    tf_pb.DT_INT64: "int64_val",
+    tf_pb.DT_STRING: "string_val",
+}
+
+
+def legacy_serialize(name, data_type, value: np.ndarray) -> bytes:
+    request = tf_pb.PredictRequest()
+    request.inputs[name].dtype = data_type
+    request.inputs[name].array_shape.dim.extend(value.shape)
+    getattr(request.inputs[name], _VALUE_FIELDS[data_type]).extend(
+        np.ravel(value).tolist()
+    )
+    return request.SerializeToString()
+
+
+def legacy_deserialize(data: bytes):
+    response = tf_pb.PredictResponse()
+    response.ParseFromString(data)
+    results = {}
+    for name, output in response.outputs.items():
+        np_dtype = TensorFlowSerializer.NUMPY_DATA_TYPE_MAPPING[
+            tf_pb.ArrayDataType.Name(output.dtype)
+        ]
+        values = getattr(output, _VALUE_FIELDS[output.dtype])
+        results[name] = np.asarray(values, np_dtype).reshape(
+            list(output.array_shape.dim)
+        )
+    return results
+
+
+def legacy_torch_serialize(value: np.ndarray) -> bytes:
+    request = pt_pb.PredictRequest()
+    request.inputs.add()
+    request.inputs[0].dtype = pt_pb.DT_FLOAT
+    request.inputs[0].array_shape.dim.extend(value.shape)
+    request.inputs[0].float_val.extend(np.ravel(value).tolist())
+    return request.SerializeToString()
+
+
+def legacy_torch_deserialize(data: bytes):
+    response = pt_pb.PredictResponse()
+    response.ParseFromString(data)
+    output = response.outputs[0]
+    return np.asarray(output.float_val, np.float32).reshape(
+        list(output.array_shape.dim)
+    )
+
+
+def _timeit(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _make_value(data_type, size):
+    rng = np.random.default_rng(0)
+    if data_type == tf_pb.DT_FLOAT:
+        return rng.random(size, dtype=np.float32)
+    elif data_type == tf_pb.DT_INT64:
+        return rng.integers(-(2**40), 2**40, size=size, dtype=np.int64)
+    else:
+        return np.asarray(["token-%d" % i for i in range(size)]).astype(np.bytes_)
+
+
+def run_tensorflow(size: int, repeat: int):
+    serializer = TensorFlowSerializer()
+    print(
+        "{:<10}{:>12}{:>16}{:>16}{:>16}{:>16}".format(
+            "dtype",
+            "MB",
+            "legacy enc MB/s",
+            "buffer enc MB/s",
+            "legacy dec MB/s",
+            "buffer dec MB/s",
+        )
+    )
+    for data_type in _VALUE_FIELDS:
+        value = _make_value(data_type, size)
+        mb = value.nbytes / 1024 / 1024
+        payload = legacy_serialize("x", data_type, value)
+        response = tf_pb.PredictResponse()
+        request = tf_pb.PredictRequest()
+        request.ParseFromString(payload)
+        response.outputs["x"].CopyFrom(request.inputs["x"])
+        response_bytes = response.SerializeToString()
+
+        legacy_enc = _timeit(
+            lambda: legacy_serialize("x", data_type, value), repeat=repeat
+        )
+        buffer_enc = _timeit(lambda: serializer.serialize({"x": value}), repeat=repeat)
+        legacy_dec = _timeit(lambda: legacy_deserialize(response_bytes), repeat=repeat)
+        buffer_dec = _timeit(
+            lambda: serializer.deserialize(response_bytes), repeat=repeat
+        )
+        print(
+            "{:<10}{:>12.2f}{:>16.1f}{:>16.1f}{:>16.1f}{:>16.1f}".format(
+                tf_pb.ArrayDataType.Name(data_type),
+                mb,
+                mb / legacy_enc,
+                mb / buffer_enc,
+                mb / legacy_dec,
+                mb / buffer_dec,
+            )
+        )
+
+
+def run_pytorch(features: int, repeat: int):
+    serializer = PyTorchSerializer()
+    print(
+        "{:<8}{:>12}{:>16}{:>16}{:>16}{:>16}".format(
+            "batch",
+            "MB",
+            "legacy req/s",
+            "buffer req/s",
+            "legacy MB/s",
+            "buffer MB/s",
+        )
+    )
+    rng = np.random.default_rng(0)
+    for batch_size in (1, 8, 64, 512, 4096):
+        value = rng.random((batch_size, features), dtype=np.float32)
+        mb = value.nbytes / 1024 / 1024
+        response = pt_pb.PredictResponse()
+        request = pt_pb.PredictRequest()
+        request.ParseFromString(legacy_torch_serialize(value))
+        response.outputs.add().CopyFrom(request.inputs[0])
+        response_bytes = response.SerializeToString()
+
+        def _legacy():
+            legacy_torch_serialize(value)
+            legacy_torch_deserialize(response_bytes)
+
+        def _buffer():
+            serializer.serialize(value)
+            serializer.deserialize(response_bytes)
+
+        legacy = _timeit(_legacy, repeat=repeat)
+        buffer = _timeit(_buffer, repeat=repeat)
+        print(
+            "{:<8}{:>12.3f}{:>16.1f}{:>16.1f}{:>16.1f}{:>16.1f}".format(
+                batch_size,
+                mb,
+                1 / legacy,
+                1 / buffer,
+                mb / legacy,
+                mb / buffer,
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    subparsers = parser.add_subparsers(dest="serializer", required=True)
+    tf_parser = subparsers.add_parser("tensorflow")
+    tf_parser.add_argument("--size", type=int, default=1000000)
+    torch_parser = subparsers.add_parser("pytorch")
+    torch_parser.add_argument("--features", type=int, default=256)
+    args = parser.parse_args()
+    if args.serializer == "tensorflow":
+        run_tensorflow(size=args.size, repeat=args.repeat)
+    else:
+        run_pytorch(features=args.features, repeat=args.repeat)
@@ -12,4 +12,37 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import importlib
+
 from .version import VERSION as __version__
+
+# Commonly used symbols are exposed at the package level, and imported on the first
+# access, so that `import pai` does not import the service clients.
+_LAZY_IMPORTS = {
+    "Session": "pai.session",
+    "get_default_session": "pai.session",
+    "setup_default_session": "pai.session",
+    "Predictor": "pai.predictor",
+    "AsyncPredictor": "pai.predictor",
+    "LocalPredictor": "pai.predictor",
+    "Estimator": "pai.estimator",
+    "AlgorithmEstimator": "pai.estimator",
+    "Processor": "pai.processor",
+    "Model": "pai.model",
+    "RegisteredModel": "pai.model",
+}
+
+__all__ = ["__version__"] + list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -11,47 +11,60 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import importlib
+import typing
 from typing import Optional, Union
 
 from alibabacloud_credentials.client import Client as CredentialClient
-from alibabacloud_sts20150401.client import Client as StsClient
 
-from ..common.consts import DEFAULT_NETWORK_TYPE, PAI_VPC_ENDPOINT, Network
-from ..common.utils import is_domain_connectable
-from ..libs.alibabacloud_pai_dsw20220101.client import Client as DswClient
-from .algorithm import AlgorithmAPI
+from ..common.consts import DEFAULT_NETWORK_TYPE, Network
+from ..common.network_utils import is_vpc_network
 from .base import PAIRestResourceTypes, ServiceName, WorkspaceScopedResourceAPI
 from .client_factory import ClientFactory
-from .code_source import CodeSourceAPI
-from .dataset import DatasetAPI
-from .experiment import ExperimentAPI
-from .image import ImageAPI
-from .job import JobAPI
-from .model import ModelAPI
-from .pipeline import PipelineAPI
-from .pipeline_run import PipelineRunAPI
-from .service import ServiceAPI
-from .tensorboard import TensorBoardAPI
-from .training_job import TrainingJobAPI
-from .workspace import WorkspaceAPI
 
+if typing.TYPE_CHECKING:
+    from alibabacloud_sts20150401.client import Client as StsClient
+
+    from ..libs.alibabacloud_pai_dsw20220101.client import Client as DswClient
+    from .algorithm import AlgorithmAPI
+    from .code_source import CodeSourceAPI
+    from .dataset import DatasetAPI
+    from .experiment import ExperimentAPI
+    from .image import ImageAPI
+    from .job import JobAPI
+    from .model import ModelAPI
+    from .pipeline import PipelineAPI
+    from .pipeline_run import PipelineRunAPI
+    from .service import ServiceAPI
+    from .tensorboard import TensorBoardAPI
+    from .training_job import TrainingJobAPI
+    from .workspace import WorkspaceAPI
+
+# The resource API classes are imported on the first use, which avoids importing
+# the vendored client and model modules when the APIs are not used.
 _RESOURCE_API_MAPPING = {
-    PAIRestResourceTypes.DlcJob: JobAPI,
-    PAIRestResourceTypes.CodeSource: CodeSourceAPI,
-    PAIRestResourceTypes.Dataset: DatasetAPI,
-    PAIRestResourceTypes.Image: ImageAPI,
-    PAIRestResourceTypes.Service: ServiceAPI,
-    PAIRestResourceTypes.Model: ModelAPI,
-    PAIRestResourceTypes.Workspace: WorkspaceAPI,
-    PAIRestResourceTypes.Algorithm: AlgorithmAPI,
-    PAIRestResourceTypes.TrainingJob: TrainingJobAPI,
-    PAIRestResourceTypes.Pipeline: PipelineAPI,
-    PAIRestResourceTypes.PipelineRun: PipelineRunAPI,
-    PAIRestResourceTypes.TensorBoard: TensorBoardAPI,
-    PAIRestResourceTypes.Experiment: ExperimentAPI,
+    PAIRestResourceTypes.DlcJob: ("job", "JobAPI"),
+    PAIRestResourceTypes.CodeSource: ("code_source", "CodeSourceAPI"),
+    PAIRestResourceTypes.Dataset: ("dataset", "DatasetAPI"),
+    PAIRestResourceTypes.Image: ("image", "ImageAPI"),
+    PAIRestResourceTypes.Service: ("service", "ServiceAPI"),
+    PAIRestResourceTypes.Model: ("model", "ModelAPI"),
+    PAIRestResourceTypes.Workspace: ("workspace", "WorkspaceAPI"),
+    PAIRestResourceTypes.Algorithm: ("algorithm", "AlgorithmAPI"),
+    PAIRestResourceTypes.TrainingJob: ("training_job", "TrainingJobAPI"),
+    PAIRestResourceTypes.Pipeline: ("pipeline", "PipelineAPI"),
+    PAIRestResourceTypes.PipelineRun: ("pipeline_run", "PipelineRunAPI"),
+    PAIRestResourceTypes.TensorBoard: ("tensorboard", "TensorBoardAPI"),
+    PAIRestResourceTypes.Experiment: ("experiment", "ExperimentAPI"),
 }
 
 
+def _get_resource_api_class(resource_type):
+    module_name, class_name = _RESOURCE_API_MAPPING[resource_type]
+    module = importlib.import_module("." + module_name, __package__)
+    return getattr(module, class_name)
+
+
 class ResourceAPIsContainerMixin(object):
     """ResourceAPIsContainerMixin provides Resource Operation APIs."""
 
@@ -82,9 +95,7 @@ class ResourceAPIsContainerMixin(object):
             self.network = Network.from_string(DEFAULT_NETWORK_TYPE)
         else:
             self.network = (
-                Network.VPC
-                if is_domain_connectable(PAI_VPC_ENDPOINT.format(self._region_id))
-                else Network.PUBLIC
+                Network.VPC if is_vpc_network(self._region_id) else Network.PUBLIC
             )
 
     def _acs_credential_client(self):
@@ -126,18 +137,18 @@ class ResourceAPIsContainerMixin(object):
         return self._get_acs_client(ServiceName.PAI_STUDIO)
 
     @property
-    def _acs_sts_client(self) -> StsClient:
+    def _acs_sts_client(self) -> "StsClient":
         return self._get_acs_client(ServiceName.STS)
 
     @property
-    def _acs_dsw_client(self) -> DswClient:
+    def _acs_dsw_client(self) -> "DswClient":
         return self._get_acs_client(ServiceName.PAI_DSW)
 
     def get_api_by_resource(self, resource_type):
         if resource_type in self.api_container:
             return self.api_container[resource_type]
 
-        api_cls = _RESOURCE_API_MAPPING[resource_type]
+        api_cls = _get_resource_api_class(resource_type)
         acs_client = self._get_acs_client(api_cls.BACKEND_SERVICE_NAME)
         if issubclass(api_cls, WorkspaceScopedResourceAPI):
             api = api_cls(
@@ -146,7 +157,7 @@ class ResourceAPIsContainerMixin(object):
                 header=self.header,
                 runtime=self.runtime,
             )
-        elif api_cls == ServiceAPI:
+        elif resource_type == PAIRestResourceTypes.Service:
             # for PAI-EAS service api, we need to pass region_id.
             api = api_cls(
                 acs_client=acs_client,
@@ -164,56 +175,56 @@ class ResourceAPIsContainerMixin(object):
         return api
 
     @property
-    def job_api(self) -> JobAPI:
+    def job_api(self) -> "JobAPI":
         """Returns JobAPI for job operation."""
         return self.get_api_by_resource(PAIRestResourceTypes.DlcJob)
 
     @property
-    def tensorboard_api(self) -> TensorBoardAPI:
+    def tensorboard_api(self) -> "TensorBoardAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.TensorBoard)
 
     @property
-    def code_source_api(self) -> CodeSourceAPI:
+    def code_source_api(self) -> "CodeSourceAPI":
         """Return CodeSource API for code_source operation"""
         return self.get_api_by_resource(PAIRestResourceTypes.CodeSource)
 
     @property
-    def dataset_api(self) -> DatasetAPI:
+    def dataset_api(self) -> "DatasetAPI":
         """Return Dataset API for dataset operation"""
         return self.get_api_by_resource(PAIRestResourceTypes.Dataset)
 
     @property
-    def image_api(self) -> ImageAPI:
+    def image_api(self) -> "ImageAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Image)
 
     @property
-    def model_api(self) -> ModelAPI:
+    def model_api(self) -> "ModelAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Model)
 
     @property
-    def service_api(self) -> ServiceAPI:
+    def service_api(self) -> "ServiceAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Service)
 
     @property
-    def workspace_api(self) -> WorkspaceAPI:
+    def workspace_api(self) -> "WorkspaceAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Workspace)
 
     @property
-    def algorithm_api(self) -> AlgorithmAPI:
+    def algorithm_api(self) -> "AlgorithmAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Algorithm)
 
     @property
-    def training_job_api(self) -> TrainingJobAPI:
+    def training_job_api(self) -> "TrainingJobAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.TrainingJob)
 
     @property
-    def pipeline_api(self) -> PipelineAPI:
+    def pipeline_api(self) -> "PipelineAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Pipeline)
 
     @property
-    def pipeline_run_api(self) -> PipelineRunAPI:
+    def pipeline_run_api(self) -> "PipelineRunAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.PipelineRun)
 
     @property
-    def experiment_api(self) -> ExperimentAPI:
+    def experiment_api(self) -> "ExperimentAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Experiment)
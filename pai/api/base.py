@@ -12,8 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+import os
+import threading
+import time
 from abc import ABCMeta
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import six
 from alibabacloud_tea_openapi.client import Client
@@ -25,6 +30,11 @@ from ..common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Default TTL in seconds of the cached responses of the GET/describe actions, set
+# environment variable PAI_API_CACHE_TTL to 0 to disable the cache.
+_DEFAULT_CACHE_TTL = float(os.environ.get("PAI_API_CACHE_TTL", 2))
+_DEFAULT_CACHE_MAX_SIZE = 256
+
 
 class ServiceName(object):
     # Service provided by PAI.
@@ -56,11 +66,88 @@ class PAIRestResourceTypes(object):
     Experiment = "Experiment"
 
 
+class _TTLCache(object):
+    """A thread-safe LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, ttl: float, max_size: int = _DEFAULT_CACHE_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key) -> Tuple[bool, Any]:
+        """Returns a tuple of (found, value) of the key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+
+def _make_cache_key(method_: str, args, kwargs) -> str:
+    def _to_primitive(value):
+        if isinstance(value, TeaModel):
+            return value.to_map()
+        return value
+
+    return json.dumps(
+        [
+            method_,
+            [_to_primitive(arg) for arg in args],
+            {k: _to_primitive(v) for k, v in kwargs.items()},
+        ],
+        sort_keys=True,
+        default=repr,
+    )
+
+
 class ResourceAPI(with_metaclass(ABCMeta, object)):
     """Class that provide APIs to operate the resource."""
 
     BACKEND_SERVICE_NAME = None
 
+    # Client methods of the idempotent GET/describe actions whose responses are
+    # cached for `cache_ttl` seconds. A resource API opts in to the cache by
+    # listing the methods.
+    _cached_methods: Tuple[str, ...] = ()
+    # Client methods that modify the resources, which invalidate the cached
+    # responses of the resource API.
+    _invalidating_method_prefixes: Tuple[str, ...] = (
+        "create",
+        "update",
+        "start",
+        "stop",
+        "delete",
+        "release",
+    )
+    cache_ttl: float = _DEFAULT_CACHE_TTL
+
     def __init__(
         self,
         acs_client: Client,
@@ -81,12 +168,38 @@ class ResourceAPI(with_metaclass(ABCMeta, object)):
         self.acs_client = acs_client
         self.header = header
         self.runtime = runtime
+        self._cache = (
+            _TTLCache(ttl=self.cache_ttl)
+            if self._cached_methods and self.cache_ttl > 0
+            else None
+        )
+
+    @property
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Hit/miss counters and the size of the response cache, returns None if the
+        resource API does not cache responses."""
+        return self._cache.stats() if self._cache else None
+
+    def invalidate_cache(self):
+        """Invalidate the cached responses of the resource API."""
+        if self._cache:
+            self._cache.clear()
 
     def _make_extra_request_options(self):
         """Returns headers and runtime for client."""
         return self.header or dict(), self.runtime or RuntimeOptions()
 
     def _do_request(self, method_: str, *args, **kwargs):
+        cache_key = None
+        if self._cache:
+            if method_ in self._cached_methods:
+                cache_key = _make_cache_key(method_, args, kwargs)
+                found, value = self._cache.get(cache_key)
+                if found:
+                    return value
+            elif method_.startswith(self._invalidating_method_prefixes):
+                self._cache.clear()
+
         headers, runtime = self._make_extra_request_options()
         if "headers" not in kwargs:
             kwargs["headers"] = headers
@@ -94,7 +207,10 @@ class ResourceAPI(with_metaclass(ABCMeta, object)):
             kwargs["runtime"] = runtime
         request_method = getattr(self.acs_client, method_)
 
-        return request_method(*args, **kwargs).body
+        body = request_method(*args, **kwargs).body
+        if cache_key is not None:
+            self._cache.put(cache_key, body)
+        return body
 
     def get_api_object_by_resource_id(self, resource_id):
         raise NotImplementedError
@@ -14,21 +14,15 @@
 
 from __future__ import absolute_import
 
+import importlib
 from typing import Optional
 
 from alibabacloud_credentials.client import Client as CredentialClient
-from alibabacloud_sts20150401.client import Client as StsClient
 from alibabacloud_tea_openapi.models import Config
 
 from ..common.consts import Network
 from ..common.logging import get_logger
 from ..common.utils import http_user_agent
-from ..libs.alibabacloud_aiworkspace20210204.client import Client as WorkspaceClient
-from ..libs.alibabacloud_eas20210701.client import Client as EasClient
-from ..libs.alibabacloud_pai_dlc20201203.client import Client as DlcClient
-from ..libs.alibabacloud_pai_dsw20220101.client import Client as DswClient
-from ..libs.alibabacloud_paiflow20210202.client import Client as FlowClient
-from ..libs.alibabacloud_paistudio20220112.client import Client as PaiClient
 from .base import ServiceName
 
 _logger = get_logger(__name__)
@@ -37,16 +31,26 @@ DEFAULT_SERVICE_ENDPOINT_PATTERN = "{}.{}.aliyuncs.com"
 
 
 class ClientFactory(object):
-    ClientByServiceName = {
-        ServiceName.PAI_DLC: DlcClient,
-        ServiceName.PAI_EAS: EasClient,
-        ServiceName.PAI_WORKSPACE: WorkspaceClient,
-        ServiceName.PAIFLOW: FlowClient,
-        ServiceName.PAI_STUDIO: PaiClient,
-        ServiceName.STS: StsClient,
-        ServiceName.PAI_DSW: DswClient,
+    # Modules of the API clients, which are imported on the first use because the
+    # vendored client and model modules are large.
+    ClientModuleByServiceName = {
+        ServiceName.PAI_DLC: "pai.libs.alibabacloud_pai_dlc20201203.client",
+        ServiceName.PAI_EAS: "pai.libs.alibabacloud_eas20210701.client",
+        ServiceName.PAI_WORKSPACE: "pai.libs.alibabacloud_aiworkspace20210204.client",
+        ServiceName.PAIFLOW: "pai.libs.alibabacloud_paiflow20210202.client",
+        ServiceName.PAI_STUDIO: "pai.libs.alibabacloud_paistudio20220112.client",
+        ServiceName.STS: "alibabacloud_sts20150401.client",
+        ServiceName.PAI_DSW: "pai.libs.alibabacloud_pai_dsw20220101.client",
     }
 
+    @classmethod
+    def get_client_class(cls, service_name: str):
+        """Import and return the API client class of the service."""
+        module_name = cls.ClientModuleByServiceName.get(service_name)
+        if not module_name:
+            raise ValueError(f"Not supported service: {service_name}")
+        return importlib.import_module(module_name).Client
+
     @staticmethod
     def _is_inner_client(acs_client):
         return acs_client.get_region_id() == "center"
@@ -75,7 +79,7 @@ class ClientFactory(object):
             user_agent=http_user_agent(),
             **kwargs,
         )
-        client = cls.ClientByServiceName.get(service_name)(config)
+        client = cls.get_client_class(service_name)(config)
         return client
 
     @classmethod
@@ -50,6 +50,10 @@ class ServiceAPI(ResourceAPI):
     _list_groups_method = "list_group_with_options"
     _describe_machine_method = "describe_machine_spec_with_options"
 
+    # Describe calls are cached briefly, which are made by every predictor created
+    # and the waiters polling the service status.
+    _cached_methods = (_get_method, _get_group_method, _describe_machine_method)
+
     def __init__(self, region_id, acs_client, **kwargs):
         super(ServiceAPI, self).__init__(acs_client=acs_client, **kwargs)
         self.region_id = region_id
@@ -56,12 +56,16 @@ class TrainingJobAPI(WorkspaceScopedResourceAPI):
         sort_by: str = None,
         status: str = None,
         training_job_name: str = None,
+        training_job_id: str = None,
+        labels: Optional[Dict[str, str]] = None,
     ) -> PaginatedResult:
         request = ListTrainingJobsRequest(
             page_size=page_size,
             page_number=page_number,
             status=status,
             training_job_name=training_job_name,
+            training_job_id=training_job_id,
+            labels=labels,
             order=order,
             sort_by=sort_by,
         )
@@ -0,0 +1,267 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Content-addressed cache of the source code uploaded to OSS.
+
+The source directory is identified by the digest of its content, and is uploaded
+to an OSS path derived from the digest. A job submitted with a source directory
+whose content has been uploaded reuses the OSS path instead of uploading it again.
+
+Files matching the patterns in the `.paiignore` file under the source directory,
+which uses the syntax of `.gitignore`, are neither hashed nor uploaded. The digests
+of the files are kept in a local manifest, so that only the modified files are
+hashed again.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import posixpath
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import oss2
+
+from .consts import DEFAULT_CACHE_DIR
+from .logging import get_logger
+from .oss_utils import _upload_files
+
+logger = get_logger(__name__)
+
+PAI_IGNORE_FILE = ".paiignore"
+
+# Suffix of the object written after all source files are uploaded, which marks the
+# code of the digest as complete.
+_DIGEST_MARKER_SUFFIX = ".complete"
+_MANIFEST_VERSION = 2
+_HASH_CHUNK_SIZE = 1024 * 1024
+# The digest of a file modified shortly before it is hashed is not reused, because
+# a later modification in the same timestamp granularity does not change the mtime.
+_RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+_upload_locks: Dict[str, threading.Lock] = {}
+_upload_locks_lock = threading.Lock()
+
+
+class _IgnoreRule(object):
+    """A pattern in the `.paiignore` file."""
+
+    def __init__(self, pattern: str):
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # Pattern contains a slash is matched against the path relative to the
+        # source directory, otherwise it is matched against the name at any level.
+        self.anchored = "/" in pattern
+        self.pattern = pattern.lstrip("/")
+
+    def match(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.anchored:
+            return fnmatch.fnmatchcase(rel_path, self.pattern) or (
+                self.pattern.startswith("**/")
+                and fnmatch.fnmatchcase(rel_path, self.pattern[3:])
+            )
+        return fnmatch.fnmatchcase(posixpath.basename(rel_path), self.pattern)
+
+
+def load_ignore_rules(source_dir: str) -> List[_IgnoreRule]:
+    """Load the ignore rules from the `.paiignore` file under the source
+    directory."""
+    path = os.path.join(source_dir, PAI_IGNORE_FILE)
+    if not os.path.isfile(path):
+        return []
+    rules = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                rules.append(_IgnoreRule(line))
+    return rules
+
+
+def _is_ignored(rules: List[_IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.match(rel_path, is_dir):
+            ignored = not rule.negated
+    return ignored
+
+
+def list_source_files(source_dir: str) -> List[str]:
+    """List the files under the source directory that are not ignored by the
+    `.paiignore` file.
+
+    Returns:
+        List[str]: Sorted paths of the files, relative to the source directory in
+            POSIX format.
+    """
+    rules = load_ignore_rules(source_dir)
+    files = []
+    for root, dir_names, file_names in os.walk(source_dir):
+        rel_root = os.path.relpath(root, source_dir).replace(os.sep, "/")
+        rel_root = "" if rel_root == "." else rel_root + "/"
+        # Ignored directories are not traversed.
+        dir_names[:] = [
+            d for d in dir_names if not _is_ignored(rules, rel_root + d, is_dir=True)
+        ]
+        files.extend(
+            rel_root + name
+            for name in file_names
+            if not _is_ignored(rules, rel_root + name, is_dir=False)
+        )
+    return sorted(files)
+
+
+def _manifest_path(source_dir: str) -> str:
+    key = hashlib.sha1(os.path.abspath(source_dir).encode()).hexdigest()
+    return os.path.join(DEFAULT_CACHE_DIR, "code", key + ".json")
+
+
+def _load_manifest(source_dir: str) -> Dict[str, List]:
+    try:
+        with open(_manifest_path(source_dir), "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == _MANIFEST_VERSION:
+            return manifest["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _save_manifest(source_dir: str, files: Dict[str, List]):
+    path = _manifest_path(source_dir)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "version": _MANIFEST_VERSION,
+                    "source_dir": os.path.abspath(source_dir),
+                    "files": files,
+                },
+                f,
+            )
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug("Failed to save the code manifest %s: %s", path, e)
+
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def compute_source_digest(source_dir: str) -> Tuple[str, List[str]]:
+    """Compute the digest of the content of the source directory.
+
+    The digest covers the relative path, the executable bit and the content of the
+    files that are not ignored. The digest of a file is reused from the local
+    manifest if its size and modification time are not changed.
+
+    Returns:
+        Tuple[str, List[str]]: The digest of the source directory, and the relative
+            paths of the files.
+    """
+    cached = _load_manifest(source_dir)
+    manifest = {}
+    tree_hash = hashlib.sha256()
+    files = list_source_files(source_dir)
+    for rel_path in files:
+        path = os.path.join(source_dir, rel_path)
+        stat = os.stat(path)
+        executable = bool(stat.st_mode & 0o111)
+        entry = cached.get(rel_path)
+        if (
+            entry
+            and entry[:2] == [stat.st_size, stat.st_mtime_ns]
+            and entry[3] - stat.st_mtime_ns > _RACY_MTIME_WINDOW_NS
+        ):
+            manifest[rel_path] = entry
+        else:
+            manifest[rel_path] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+                _hash_file(path),
+                time.time_ns(),
+            ]
+        file_digest = manifest[rel_path][2]
+        tree_hash.update(
+            "{}\0{}\0{}\n".format(rel_path, int(executable), file_digest).encode()
+        )
+    if manifest != cached:
+        _save_manifest(source_dir, manifest)
+    return tree_hash.hexdigest(), files
+
+
+def _get_upload_lock(key: str) -> threading.Lock:
+    with _upload_locks_lock:
+        return _upload_locks.setdefault(key, threading.Lock())
+
+
+def upload_source_dir(
+    source_dir: str,
+    oss_dir: str,
+    bucket: oss2.Bucket,
+    digest: Optional[str] = None,
+) -> str:
+    """Upload the source directory to a content-addressed OSS path.
+
+    The source files are uploaded to `{oss_dir}{digest}/`, unless the code of the
+    same digest has been uploaded.
+
+    Args:
+        source_dir (str): Local source directory.
+        oss_dir (str): OSS directory that stores the uploaded source code.
+        bucket (oss2.Bucket): OSS bucket used to store the source code.
+        digest (str, optional): Digest of the source directory, computed if not
+            provided.
+
+    Returns:
+        str: OSS URI of the directory of the uploaded source code.
+    """
+    files = None
+    if not digest:
+        digest, files = compute_source_digest(source_dir)
+    if not oss_dir.endswith("/"):
+        oss_dir += "/"
+    code_dir = f"{oss_dir}{digest}/"
+    marker_key = f"{oss_dir}{digest}{_DIGEST_MARKER_SUFFIX}"
+    code_uri = f"oss://{bucket.bucket_name}/{code_dir}"
+
+    with _get_upload_lock(code_uri):
+        if bucket.object_exists(marker_key):
+            logger.info(
+                "Source code is not changed, reuse the uploaded code: %s", code_uri
+            )
+            return code_uri
+        if files is None:
+            files = list_source_files(source_dir)
+        _upload_files(
+            [(os.path.join(source_dir, f), code_dir + f) for f in files],
+            oss_bucket=bucket,
+            desc=f"Uploading: {source_dir}",
+        )
+        bucket.put_object(marker_key, digest)
+    return code_uri
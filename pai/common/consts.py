@@ -19,6 +19,12 @@ DEFAULT_CONFIG_PATH = os.environ.get(
     "PAI_CONFIG_PATH", os.path.join(os.path.expanduser("~"), ".pai", "config.json")
 )
 
+# Default directory for the local caches of the SDK, such as the manifest of the
+# uploaded source code.
+DEFAULT_CACHE_DIR = os.environ.get(
+    "PAI_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".pai", "cache")
+)
+
 # Default network type used to connect to PAI services
 DEFAULT_NETWORK_TYPE = os.environ.get("PAI_NETWORK_TYPE", None)
 
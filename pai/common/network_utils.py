@@ -0,0 +1,167 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Cached reachability probes of the VPC endpoints of a region.
+
+The SDK chooses the VPC endpoints of PAI and OSS if they are connectable from the
+host. The probes of a region run concurrently at most once per process, and the
+results are persisted under the PAI config directory, keyed by the region and the
+network identity of the host, so that the following processes on the same host
+reuse them until they expire.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from .consts import DEFAULT_CONFIG_PATH, PAI_VPC_ENDPOINT
+from .logging import get_logger
+from .utils import is_domain_connectable
+
+logger = get_logger(__name__)
+
+# OSS Endpoint document:
+# https://help.aliyun.com/document_detail/31837.html
+OSS_ENDPOINT = "oss-{}.aliyuncs.com"
+OSS_INTERNAL_ENDPOINT = "oss-{}-internal.aliyuncs.com"
+
+# Seconds that the persisted probe results are valid.
+_DEFAULT_PROBE_CACHE_TTL = float(os.environ.get("PAI_NETWORK_PROBE_TTL") or 3600)
+_PROBE_TIMEOUT = 1
+_PROBE_CACHE_VERSION = 1
+_PROBE_ENDPOINTS = {
+    "pai_vpc": PAI_VPC_ENDPOINT,
+    "oss_internal": OSS_INTERNAL_ENDPOINT,
+}
+
+_probe_results: Dict[str, Dict[str, bool]] = {}
+_probe_locks: Dict[str, threading.Lock] = {}
+_probe_locks_lock = threading.Lock()
+
+
+def _probe_cache_path() -> str:
+    return os.path.join(os.path.dirname(DEFAULT_CONFIG_PATH), "network_probe.json")
+
+
+def _host_network_identity() -> str:
+    """Returns an identity of the network of the host, which is the hostname and
+    the local address used to connect to the outside network."""
+    address = ""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Connecting a UDP socket does not send any packet, it only selects the
+        # local address by the routing table.
+        sock.connect(("100.100.100.200", 80))
+        address = sock.getsockname()[0]
+    except OSError:
+        pass
+    finally:
+        sock.close()
+    return hashlib.sha1(
+        "{}|{}".format(socket.gethostname(), address).encode()
+    ).hexdigest()
+
+
+def _load_probe_cache() -> Dict[str, Dict]:
+    try:
+        with open(_probe_cache_path(), "r") as f:
+            cache = json.load(f)
+        if cache.get("version") == _PROBE_CACHE_VERSION:
+            return cache["entries"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _save_probe_cache(key: str, results: Dict[str, bool]):
+    path = _probe_cache_path()
+    now = time.time()
+    entries = {
+        k: v
+        for k, v in _load_probe_cache().items()
+        if now - v.get("timestamp", 0) < _DEFAULT_PROBE_CACHE_TTL
+    }
+    entries[key] = {"timestamp": now, "results": results}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": _PROBE_CACHE_VERSION, "entries": entries}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug("Failed to save the network probe results %s: %s", path, e)
+
+
+def _probe(region_id: str) -> Dict[str, bool]:
+    endpoints = {
+        name: pattern.format(region_id) for name, pattern in _PROBE_ENDPOINTS.items()
+    }
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {
+            name: executor.submit(
+                is_domain_connectable, endpoint, timeout=_PROBE_TIMEOUT
+            )
+            for name, endpoint in endpoints.items()
+        }
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def probe_region_endpoints(region_id: str) -> Dict[str, bool]:
+    """Returns whether the VPC endpoints of the region are connectable.
+
+    Args:
+        region_id (str): ID of the region.
+
+    Returns:
+        Dict[str, bool]: Reachability of the PAI VPC endpoint (`pai_vpc`) and the
+            OSS internal endpoint (`oss_internal`).
+    """
+    with _probe_locks_lock:
+        lock = _probe_locks.setdefault(region_id, threading.Lock())
+    with lock:
+        if region_id in _probe_results:
+            return _probe_results[region_id]
+        key = "{}|{}".format(region_id, _host_network_identity())
+        entry = _load_probe_cache().get(key)
+        if (
+            entry
+            and time.time() - entry.get("timestamp", 0) < _DEFAULT_PROBE_CACHE_TTL
+            and set(entry.get("results", {})) == set(_PROBE_ENDPOINTS)
+        ):
+            results = entry["results"]
+        else:
+            results = _probe(region_id)
+            logger.debug("Network probe results of %s: %s", region_id, results)
+            _save_probe_cache(key, results)
+        _probe_results[region_id] = results
+        return results
+
+
+def is_vpc_network(region_id: str) -> bool:
+    """Returns True if the PAI VPC endpoint of the region is connectable."""
+    return probe_region_endpoints(region_id)["pai_vpc"]
+
+
+def get_default_oss_endpoint(region_id: str) -> str:
+    """Returns the OSS internal endpoint of the region if it is connectable,
+    otherwise the internet endpoint."""
+    if probe_region_endpoints(region_id)["oss_internal"]:
+        return OSS_INTERNAL_ENDPOINT.format(region_id)
+    return OSS_ENDPOINT.format(region_id)
@@ -0,0 +1,243 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Local cache of the OSS objects used by the local runs.
+
+An object is cached in a file keyed by its bucket and object key, and validated by
+the ETag and the size of the object, which are returned by the listing of the
+objects, so that an unchanged object is not downloaded again. The cached files are
+hardlinked to the local directory that materializes the OSS path, and the least
+recently used files are evicted when the cache exceeds its size budget.
+"""
+
+import hashlib
+import os
+import re
+import tarfile
+import uuid
+from typing import List, Optional, Tuple
+
+import oss2
+
+from .consts import DEFAULT_CACHE_DIR
+from .logging import get_logger
+from .oss_utils import _download_files
+from .utils import link_or_copy
+
+logger = get_logger(__name__)
+
+# Size budget of the cache in bytes, the least recently used objects are evicted
+# when the cache exceeds the budget.
+_DEFAULT_OSS_CACHE_SIZE = int(
+    os.environ.get("PAI_OSS_CACHE_SIZE") or 20 * 1024 * 1024 * 1024
+)
+_ETAG_NOT_ALLOWED_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+_TEMP_FILE_SUFFIX = ".tmp"
+
+
+class OssObjectCache(object):
+    """A local cache of OSS objects shared by the local runs.
+
+    Example::
+
+        cache = OssObjectCache()
+        # Objects unchanged since the last run are linked from the cache.
+        cache.materialize("path/to/data/", "/tmp/data", bucket=bucket)
+
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = None):
+        """OssObjectCache initializer.
+
+        Args:
+            cache_dir (str, optional): Directory of the cached objects, default to
+                the `oss` directory under the cache directory of the SDK.
+            max_size (int, optional): Size budget of the cache in bytes, could be
+                configured by the environment variable `PAI_OSS_CACHE_SIZE`.
+        """
+        self.cache_dir = cache_dir or os.path.join(DEFAULT_CACHE_DIR, "oss")
+        self.max_size = max_size if max_size is not None else _DEFAULT_OSS_CACHE_SIZE
+
+    def _object_dir(self, bucket_name: str, object_key: str) -> str:
+        key = hashlib.sha1(f"{bucket_name}/{object_key}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _object_path(self, bucket_name: str, object_key: str, etag: str) -> str:
+        return os.path.join(
+            self._object_dir(bucket_name, object_key),
+            _ETAG_NOT_ALLOWED_CHARS.sub("_", etag),
+        )
+
+    def _list_objects(
+        self, bucket: oss2.Bucket, oss_path: str
+    ) -> Tuple[bool, List[Tuple[str, str, int]]]:
+        """List the objects of the OSS path, returns whether the path is a
+        directory, and the (object_key, etag, size) of the objects."""
+        if not oss_path.endswith("/"):
+            try:
+                meta = bucket.get_object_meta(oss_path)
+                return False, [(oss_path, meta.etag, meta.content_length)]
+            except oss2.exceptions.NotFound:
+                oss_path += "/"
+        objects = [
+            (obj.key, obj.etag, obj.size)
+            for obj in oss2.ObjectIteratorV2(bucket=bucket, prefix=oss_path)
+            if not obj.key.endswith("/")
+        ]
+        return True, objects
+
+    def fetch(
+        self,
+        bucket: oss2.Bucket,
+        objects: List[Tuple[str, str, int]],
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Make sure the objects are cached, download the missing or the changed
+        objects concurrently.
+
+        Args:
+            bucket (oss2.Bucket): OSS bucket of the objects.
+            objects (List[Tuple[str, str, int]]): Tuples of (object_key, etag, size)
+                of the objects.
+            max_workers (int, optional): The maximum number of objects downloaded
+                concurrently.
+
+        Returns:
+            List[str]: Paths of the cached files of the objects.
+        """
+        paths, missing = [], []
+        for object_key, etag, size in objects:
+            path = self._object_path(bucket.bucket_name, object_key, etag)
+            paths.append(path)
+            try:
+                if os.path.getsize(path) == size:
+                    # Mark the object as recently used.
+                    os.utime(path)
+                    continue
+            except OSError:
+                pass
+            temp_path = "{}.{}{}".format(path, uuid.uuid4().hex, _TEMP_FILE_SUFFIX)
+            missing.append((path, temp_path, object_key, size))
+
+        if missing:
+            logger.debug(
+                "Download %s of %s objects to the cache.", len(missing), len(objects)
+            )
+            try:
+                _download_files(
+                    [(temp_path, key, size) for _, temp_path, key, size in missing],
+                    oss_bucket=bucket,
+                    desc=f"Downloading to cache: {bucket.bucket_name}",
+                    max_workers=max_workers,
+                )
+            except Exception:
+                for _, temp_path, _, _ in missing:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                raise
+            for path, temp_path, _, _ in missing:
+                os.replace(temp_path, path)
+                self._remove_stale(path)
+            self.evict(keep=set(paths))
+        return paths
+
+    def _remove_stale(self, path: str):
+        """Remove the files of the previous versions of the object."""
+        object_dir = os.path.dirname(path)
+        for name in os.listdir(object_dir):
+            stale = os.path.join(object_dir, name)
+            if stale != path and not name.endswith(_TEMP_FILE_SUFFIX):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def evict(self, keep: Optional[set] = None):
+        """Evict the least recently used objects until the cache fits in the size
+        budget.
+
+        Args:
+            keep (set, optional): Paths of the cached files that are not evicted.
+        """
+        keep = keep or set()
+        entries, total = [], 0
+        for root, _, file_names in os.walk(self.cache_dir):
+            for name in file_names:
+                if name.endswith(_TEMP_FILE_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total += stat.st_size
+                if path not in keep:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def materialize(
+        self,
+        oss_path: str,
+        local_path: str,
+        bucket: oss2.Bucket,
+        un_tar: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> str:
+        """Materialize the OSS objects to the local path from the cache.
+
+        The cached files are hardlinked to the local path, and should be read-only
+        for the users, such as being mounted read-only to a container. The arguments
+        have the same meaning as :func:`pai.common.oss_utils.download`.
+
+        Args:
+            oss_path (str): Object key of a single OSS object or a OSS directory.
+            local_path (str): Local directory used to store the data.
+            bucket (oss2.Bucket): OSS bucket of the data.
+            un_tar (bool): Whether to extract the data if `oss_path` point to a
+                single file that has a suffix "tar.gz".
+            max_workers (int, optional): The maximum number of objects downloaded
+                concurrently.
+
+        Returns:
+            str: A local file path for the materialized data.
+        """
+        is_dir, objects = self._list_objects(bucket, oss_path)
+        paths = self.fetch(bucket, objects, max_workers=max_workers)
+
+        os.makedirs(local_path, exist_ok=True)
+        if not is_dir and un_tar and oss_path.endswith(".tar.gz"):
+            with tarfile.open(paths[0], "r:gz") as tar:
+                tar.extractall(path=local_path)
+            return local_path
+
+        prefix = oss_path.rstrip("/") + "/"
+        dests = []
+        for (object_key, _, _), path in zip(objects, paths):
+            if is_dir:
+                dest = os.path.join(local_path, os.path.relpath(object_key, prefix))
+            else:
+                dest = os.path.join(local_path, os.path.basename(object_key))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            if os.path.lexists(dest):
+                os.remove(dest)
+            dests.append(link_or_copy(path, dest))
+        return local_path if is_dir else dests[0]
@@ -15,11 +15,16 @@
 from __future__ import absolute_import
 
 import glob
+import gzip
+import io
 import os.path
 import pathlib
 import tarfile
-import tempfile
-from typing import Optional, Tuple, Union
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 import oss2
@@ -32,10 +37,169 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Objects smaller than the threshold are transferred with a single request, and
+# larger objects are transferred in parts concurrently.
+_DEFAULT_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+_DEFAULT_TRANSFER_ATTEMPTS = 3
+# Size of the parts of the streaming tar.gz upload, and size of the chunks of the
+# data compressed concurrently.
+_DEFAULT_STREAMING_PART_SIZE = 16 * 1024 * 1024
+_DEFAULT_COMPRESS_CHUNK_SIZE = 4 * 1024 * 1024
+# The credentials used to sign the OSS requests are reused until the refresh
+# interval elapses, or shortly before the expiration of the STS credentials.
+_DEFAULT_CREDENTIAL_REFRESH_INTERVAL = 15 * 60
+_CREDENTIAL_EXPIRATION_MARGIN = 3 * 60
+
+
+class _ObjectProgress(object):
+    """Progress callback of an object transfer, which reports the progress to the
+    progress bar shared by the concurrent transfers."""
+
+    def __init__(self, pbar: tqdm, lock: threading.Lock):
+        self._pbar = pbar
+        self._lock = lock
+        self._consumed = 0
+
+    def __call__(self, consumed_bytes, total_bytes=None):
+        with self._lock:
+            self._pbar.update(n=consumed_bytes - self._consumed)
+            self._consumed = consumed_bytes
+
+    def rollback(self):
+        """Rollback the progress of a failed transfer attempt."""
+        self(0)
+
+
+def _is_retryable_error(e: Exception) -> bool:
+    if isinstance(e, oss2.exceptions.RequestError):
+        return True
+    elif isinstance(e, oss2.exceptions.ServerError):
+        return e.status >= 500 or e.status == 429
+    return isinstance(e, (ConnectionError, TimeoutError))
+
+
+def _transfer_objects(
+    transfer_fn: Callable[[str, str, int, _ObjectProgress], None],
+    tasks: List[Tuple[str, str, int]],
+    desc: str,
+    max_workers: Optional[int] = None,
+    max_attempts: int = _DEFAULT_TRANSFER_ATTEMPTS,
+):
+    """Transfer objects concurrently with one aggregated progress bar.
+
+    Args:
+        transfer_fn (Callable): Function that transfers an object, with arguments
+            (filename, object_key, size, progress_callback).
+        tasks (List[Tuple[str, str, int]]): Tuples of (filename, object_key, size)
+            of the objects to transfer.
+        desc (str): Description of the progress bar.
+        max_workers (int, optional): The maximum number of objects transferred
+            concurrently.
+        max_attempts (int): The maximum number of attempts to transfer an object,
+            an attempt is retried only if the error is transient.
+    """
+    # By default, the concurrency matches the size of the connection pool used by
+    # the OSS bucket, so that the connections are reused across the transfers.
+    max_workers = max_workers or oss2.defaults.connection_pool_size
+    max_workers = max(min(max_workers, len(tasks)), 1)
+    lock = threading.Lock()
+
+    with tqdm(
+        total=sum(size for _, _, size in tasks),
+        unit="B",
+        unit_scale=True,
+        desc=desc,
+    ) as pbar:
+
+        def _transfer(filename, object_key, size):
+            progress = _ObjectProgress(pbar, lock)
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    transfer_fn(filename, object_key, size, progress)
+                    break
+                except Exception as e:
+                    progress.rollback()
+                    if attempt == max_attempts or not _is_retryable_error(e):
+                        raise
+                    logger.warning(
+                        "Failed to transfer object %s (attempt %s/%s), retrying: %s",
+                        object_key,
+                        attempt,
+                        max_attempts,
+                        e,
+                    )
+                    time.sleep(min(0.5 * 2 ** (attempt - 1), 5))
+            # Mark the progress of the object as completed.
+            progress(size)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_transfer, *task) for task in tasks]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+def _upload_files(
+    files: List[Tuple[str, str]],
+    oss_bucket: oss2.Bucket,
+    desc: str,
+    max_workers: Optional[int] = None,
+):
+    """Upload local files to OSS, small files are uploaded with a single PUT request,
+    and large files are uploaded with multipart upload."""
+
+    def _upload(filename, object_key, size, progress):
+        if size < _DEFAULT_MULTIPART_THRESHOLD:
+            oss_bucket.put_object_from_file(
+                object_key, filename, progress_callback=progress
+            )
+        else:
+            oss2.resumable_upload(
+                bucket=oss_bucket,
+                key=object_key,
+                filename=filename,
+                progress_callback=progress,
+                multipart_threshold=_DEFAULT_MULTIPART_THRESHOLD,
+                num_threads=os.cpu_count() * 2,
+            )
+
+    tasks = [
+        (filename, object_key, os.path.getsize(filename))
+        for filename, object_key in files
+    ]
+    _transfer_objects(_upload, tasks, desc=desc, max_workers=max_workers)
+
+
+def _download_files(
+    objects: List[Tuple[str, str, int]],
+    oss_bucket: oss2.Bucket,
+    desc: str,
+    max_workers: Optional[int] = None,
+):
+    """Download OSS objects to local files, small objects are downloaded with a
+    single GET request, and large objects are downloaded in ranges concurrently."""
+
+    def _download(filename, object_key, size, progress):
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        if size < _DEFAULT_MULTIPART_THRESHOLD:
+            oss_bucket.get_object_to_file(
+                object_key, filename, progress_callback=progress
+            )
+        else:
+            oss2.resumable_download(
+                bucket=oss_bucket,
+                key=object_key,
+                filename=filename,
+                progress_callback=progress,
+                multiget_threshold=_DEFAULT_MULTIPART_THRESHOLD,
+                num_threads=os.cpu_count(),
+            )
 
-class _ProgressCallbackTqdm(tqdm):
-    def __call__(self, consumed_bytes, total_bytes):
-        self.update(n=consumed_bytes - self.n)
+    _transfer_objects(_download, objects, desc=desc, max_workers=max_workers)
 
 
 def _upload_with_progress(
@@ -43,22 +207,11 @@ def _upload_with_progress(
     object_key,
     oss_bucket: oss2.Bucket,
 ):
-    local_file_size = os.path.getsize(filename)
-    with _ProgressCallbackTqdm(
-        total=local_file_size,
-        unit="B",
-        unit_scale=True,
+    _upload_files(
+        [(filename, object_key)],
+        oss_bucket=oss_bucket,
         desc=f"Uploading file: {filename}",
-    ) as pbar:
-        oss2.resumable_upload(
-            bucket=oss_bucket,
-            key=object_key,
-            filename=filename,
-            progress_callback=pbar,
-            num_threads=os.cpu_count() * 2,
-        )
-        # Mark the progress as completed.
-        pbar.update(n=pbar.total - pbar.n)
+    )
 
 
 def _download_with_progress(
@@ -67,21 +220,11 @@ def _download_with_progress(
     oss_bucket: oss2.Bucket,
 ):
     total = oss_bucket.get_object_meta(object_key).content_length
-    with _ProgressCallbackTqdm(
-        total=total,
-        unit="B",
-        unit_scale=True,
+    _download_files(
+        [(filename, object_key, total)],
+        oss_bucket=oss_bucket,
         desc=f"Downloading file: {filename}",
-    ) as pbar:
-        oss2.resumable_download(
-            bucket=oss_bucket,
-            key=object_key,
-            filename=filename,
-            progress_callback=pbar,
-            num_threads=os.cpu_count(),
-        )
-        # Mark the progress as completed.
-        pbar.update(n=pbar.total - pbar.n)
+    )
 
 
 def is_oss_uri(uri: Union[str, bytes]) -> bool:
@@ -247,22 +390,194 @@ class OssUriObj(object):
         return is_dir, dir_path, file_name
 
 
-def _tar_file(source_file, target=None):
-    source_file = (
-        source_file if os.path.isabs(source_file) else os.path.abspath(source_file)
-    )
-    if not os.path.exists(source_file):
-        raise ValueError("source file not exists: %s", source_file)
-    if os.path.isdir(source_file):
-        arcname = ""
+class _StreamingTarGzUploader(io.RawIOBase):
+    """A writable stream that compresses the data written to it and uploads the
+    compressed data to an OSS object on the fly.
+
+    The data is compressed in chunks concurrently, each chunk as a member of a
+    multi-member gzip stream, which is a valid gzip file and decompressed as a whole
+    by gzip/tar tools. The compressed data is uploaded in parts with multipart upload
+    once it exceeds a part size, or with a single PUT request if it is small.
+    The amount of the data kept in memory is bounded by the number of workers.
+    """
+
+    def __init__(
+        self,
+        bucket: oss2.Bucket,
+        object_key: str,
+        max_workers: Optional[int] = None,
+        part_size: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        compresslevel: int = 6,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ):
+        super(_StreamingTarGzUploader, self).__init__()
+        self.bucket = bucket
+        self.object_key = object_key
+        self._part_size = part_size or _DEFAULT_STREAMING_PART_SIZE
+        self._chunk_size = chunk_size or _DEFAULT_COMPRESS_CHUNK_SIZE
+        self._compresslevel = compresslevel
+        self._progress_callback = progress_callback
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        self._raw = bytearray()
+        self._compressed = bytearray()
+        self._compress_futures: "deque[Future]" = deque()
+        self._upload_futures: "deque[Future]" = deque()
+        self._upload_id: Optional[str] = None
+        self._parts: List[oss2.models.PartInfo] = []
+
+    def writable(self):
+        return True
+
+    def write(self, data) -> int:
+        self._raw += data
+        while len(self._raw) >= self._chunk_size:
+            chunk = bytes(self._raw[: self._chunk_size])
+            del self._raw[: self._chunk_size]
+            self._compress_futures.append(self._executor.submit(self._compress, chunk))
+            self._drain()
+        if self._progress_callback:
+            self._progress_callback(len(data))
+        return len(data)
+
+    def _compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self._compresslevel, mtime=0)
+
+    def _drain(self, flush: bool = False):
+        """Move the compressed chunks into the part buffer in order, and upload the
+        parts that are full."""
+        while self._compress_futures and (
+            flush
+            or self._compress_futures[0].done()
+            or len(self._compress_futures) > self._max_workers
+        ):
+            self._compressed += self._compress_futures.popleft().result()
+            while len(self._compressed) >= self._part_size:
+                part = bytes(self._compressed[: self._part_size])
+                del self._compressed[: self._part_size]
+                self._upload_part(part)
+
+    def _upload_part(self, data: bytes):
+        if self._upload_id is None:
+            self._upload_id = self.bucket.init_multipart_upload(
+                self.object_key
+            ).upload_id
+        part_number = len(self._parts) + len(self._upload_futures) + 1
+        self._upload_futures.append(
+            self._executor.submit(
+                self.bucket.upload_part,
+                self.object_key,
+                self._upload_id,
+                part_number,
+                data,
+            )
+        )
+        # Limit the number of parts in memory.
+        while len(self._upload_futures) > self._max_workers:
+            self._collect_part()
+
+    def _collect_part(self):
+        result = self._upload_futures.popleft().result()
+        self._parts.append(oss2.models.PartInfo(len(self._parts) + 1, result.etag))
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._raw:
+                self._compress_futures.append(
+                    self._executor.submit(self._compress, bytes(self._raw))
+                )
+                self._raw = bytearray()
+            self._drain(flush=True)
+            if self._upload_id is None:
+                self.bucket.put_object(self.object_key, bytes(self._compressed))
+            else:
+                if self._compressed:
+                    self._upload_part(bytes(self._compressed))
+                while self._upload_futures:
+                    self._collect_part()
+                self.bucket.complete_multipart_upload(
+                    self.object_key, self._upload_id, self._parts
+                )
+        except BaseException:
+            self.abort()
+            raise
+        self._executor.shutdown(wait=True)
+        super(_StreamingTarGzUploader, self).close()
+
+    def abort(self):
+        """Abort the upload, the uploaded parts are deleted."""
+        if self.closed:
+            return
+        for future in list(self._compress_futures) + list(self._upload_futures):
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        if self._upload_id is not None:
+            try:
+                self.bucket.abort_multipart_upload(self.object_key, self._upload_id)
+            except oss2.exceptions.OssError as e:
+                logger.warning("Failed to abort the multipart upload: %s", e)
+        super(_StreamingTarGzUploader, self).close()
+
+
+def _upload_tar_gz(
+    source_path: str,
+    object_key: str,
+    bucket: oss2.Bucket,
+    max_workers: Optional[int] = None,
+):
+    """Archive the source file/directory into a tar.gz file and upload it to OSS,
+    without writing the archive to local disk."""
+    source_path = os.path.abspath(source_path)
+    arcname = "" if os.path.isdir(source_path) else os.path.basename(source_path)
+    if os.path.isdir(source_path):
+        total = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(source_path)
+            for name in names
+        )
     else:
-        arcname = os.path.basename(source_file)
+        total = os.path.getsize(source_path)
 
-    if not target:
-        target = tempfile.mktemp()
-    with tarfile.open(target, "w:gz") as tar:
-        tar.add(name=source_file, arcname=arcname)
-    return target
+    with tqdm(
+        total=total, unit="B", unit_scale=True, desc=f"Uploading: {source_path}"
+    ) as pbar:
+        uploader = _StreamingTarGzUploader(
+            bucket,
+            object_key,
+            max_workers=max_workers,
+            # Count the file content only, tar headers are not counted.
+            progress_callback=lambda n: pbar.update(min(n, pbar.total - pbar.n)),
+        )
+        try:
+            with tarfile.open(fileobj=uploader, mode="w|") as tar:
+                tar.add(name=source_path, arcname=arcname)
+        except BaseException:
+            uploader.abort()
+            raise
+        uploader.close()
+
+
+def _download_tar_gz(object_key: str, local_path: str, bucket: oss2.Bucket):
+    """Download a tar.gz object from OSS and extract it while streaming, without
+    writing the archive to local disk."""
+    total = bucket.get_object_meta(object_key).content_length
+    with tqdm(
+        total=total, unit="B", unit_scale=True, desc=f"Downloading: {object_key}"
+    ) as pbar:
+
+        def _progress(consumed_bytes, total_bytes):
+            pbar.update(consumed_bytes - pbar.n)
+
+        stream = bucket.get_object(object_key, progress_callback=_progress)
+        # GzipFile supports the multi-member gzip stream.
+        with gzip.GzipFile(fileobj=stream, mode="rb") as gz, tarfile.open(
+            fileobj=gz, mode="r|"
+        ) as tar:
+            tar.extractall(path=local_path)
 
 
 def _get_bucket_and_path(
@@ -296,6 +611,7 @@ def upload(
     oss_path: Union[str, OssUriObj],
     bucket: Optional[oss2.Bucket] = None,
     is_tar: Optional[bool] = False,
+    max_workers: Optional[int] = None,
 ) -> str:
     """Upload local source file/directory to OSS.
 
@@ -313,6 +629,9 @@ def upload(
         bucket (oss2.Bucket): OSS bucket used to store the upload data. If it is not
             provided, OSS bucket of the default session will be used.
         is_tar (bool): Whether to compress the file before uploading (default: False).
+        max_workers (int, optional): The maximum number of files uploaded
+            concurrently while uploading a directory, or the number of threads
+            compressing and uploading the archive if `is_tar` is True.
 
     Returns:
         str: A string in OSS URI format. If the source_path is directory, return the
@@ -327,20 +646,19 @@ def upload(
         raise RuntimeError("Source path is not exist: {}".format(source_path))
 
     if is_tar:
-        # compress the local data and upload the compressed source data.
-        with tempfile.TemporaryDirectory() as dir_name:
-            temp_tar_path = _tar_file(
-                source_path, os.path.join(dir_name, "source.tar.gz")
-            )
-            dest_path = (
-                os.path.join(oss_path, os.path.basename(temp_tar_path))
-                if oss_path.endswith("/")
-                else oss_path
-            )
-            _upload_with_progress(
-                filename=temp_tar_path, object_key=dest_path, oss_bucket=bucket
-            )
-            return "oss://{}/{}".format(bucket.bucket_name, dest_path)
+        # compress the local data and upload the compressed data while streaming.
+        dest_path = (
+            os.path.join(oss_path, "source.tar.gz")
+            if oss_path.endswith("/")
+            else oss_path
+        )
+        _upload_tar_gz(
+            source_path,
+            object_key=dest_path,
+            bucket=bucket,
+            max_workers=max_workers,
+        )
+        return "oss://{}/{}".format(bucket.bucket_name, dest_path)
     elif not source_path_obj.is_dir():
         # if source path is a file, just invoke bucket.put_object.
 
@@ -364,14 +682,20 @@ def upload(
         if not oss_path.endswith("/"):
             oss_path += "/"
 
-        files = [f for f in source_files if not os.path.isdir(f)]
-        for file_path in files:
-            file_path_obj = pathlib.Path(file_path)
-            file_relative_path = file_path_obj.relative_to(source_path_obj).as_posix()
-            object_key = oss_path + file_relative_path
-            _upload_with_progress(
-                filename=file_path, object_key=object_key, oss_bucket=bucket
+        files = [
+            (
+                f,
+                oss_path + pathlib.Path(f).relative_to(source_path_obj).as_posix(),
             )
+            for f in source_files
+            if not os.path.isdir(f)
+        ]
+        _upload_files(
+            files,
+            oss_bucket=bucket,
+            desc=f"Uploading: {source_path}",
+            max_workers=max_workers,
+        )
         return "oss://{}/{}".format(bucket.bucket_name, oss_path)
 
 
@@ -380,6 +704,7 @@ def download(
     local_path: str,
     bucket: Optional[oss2.Bucket] = None,
     un_tar=False,
+    max_workers: Optional[int] = None,
 ):
     """Download OSS objects to local path.
 
@@ -391,6 +716,8 @@ def download(
             is not provided, OSS bucket of the default session will be used.
         un_tar (bool, optional): Whether to decompress the downloaded data. It is only
             work for `oss_path` point to a single file that has a suffix "tar.gz".
+        max_workers (int, optional): The maximum number of objects downloaded
+            concurrently while downloading a directory.
 
     Returns:
         str: A local file path for the downloaded data.
@@ -409,31 +736,27 @@ def download(
             bucket=bucket,
             prefix=oss_path,
         )
-        keys = [obj.key for obj in iterator if not obj.key.endswith("/")]
-        for key in tqdm(keys, desc=f"Downloading: {oss_path}"):
-            rel_path = os.path.relpath(key, oss_path)
-            dest = os.path.join(local_path, rel_path)
-            os.makedirs(os.path.dirname(dest), exist_ok=True)
-            _download_with_progress(
-                dest,
-                object_key=key,
-                oss_bucket=bucket,
+        objects = [
+            (
+                os.path.join(local_path, os.path.relpath(obj.key, oss_path)),
+                obj.key,
+                obj.size,
             )
+            for obj in iterator
+            if not obj.key.endswith("/")
+        ]
+        _download_files(
+            objects,
+            oss_bucket=bucket,
+            desc=f"Downloading: {oss_path}",
+            max_workers=max_workers,
+        )
         return local_path
     else:
         # The `oss_path` represents a single file in OSS bucket.
         if oss_path.endswith(".tar.gz") and un_tar:
             # currently, only tar.gz format is supported for un_tar after downloading.
-            with tempfile.TemporaryDirectory() as temp_dir:
-                target_path = os.path.join(temp_dir, os.path.basename(oss_path))
-                _download_with_progress(
-                    target_path,
-                    object_key=oss_path,
-                    oss_bucket=bucket,
-                )
-                with tarfile.open(name=target_path, mode="r") as t:
-                    t.extractall(path=local_path)
-
+            _download_tar_gz(oss_path, local_path=local_path, bucket=bucket)
             return local_path
         else:
             os.makedirs(local_path, exist_ok=True)
@@ -448,14 +771,76 @@ def download(
 
 
 class CredentialProviderWrapper(CredentialsProvider):
-    """A wrapper class for the credential provider of OSS."""
+    """A wrapper class for the credential provider of OSS.
+
+    The credentials are fetched from the credential client once and reused by the
+    signed requests, until the refresh interval elapses or the STS credentials are
+    about to expire.
+    """
 
-    def __init__(self, config: Union[CredentialConfig] = None):
+    def __init__(
+        self,
+        config: Union[CredentialConfig] = None,
+        refresh_interval: Optional[float] = None,
+    ):
         self.client = CredentialClient(config)
+        self._refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else _DEFAULT_CREDENTIAL_REFRESH_INTERVAL
+        )
+        self._credentials = None
+        self._refresh_at = 0
+        self._lock = threading.Lock()
 
     def get_credentials(self) -> Credentials:
-        return Credentials(
-            access_key_id=self.client.get_access_key_id(),
-            access_key_secret=self.client.get_access_key_secret(),
-            security_token=self.client.get_security_token(),
-        )
+        if self._credentials is None or time.time() >= self._refresh_at:
+            with self._lock:
+                if self._credentials is None or time.time() >= self._refresh_at:
+                    self._refresh_credentials()
+        return self._credentials
+
+    def _refresh_credentials(self):
+        now = time.time()
+        credentials, expiration = self._fetch_credentials()
+        refresh_at = now + self._refresh_interval
+        if expiration:
+            refresh_at = min(refresh_at, expiration - _CREDENTIAL_EXPIRATION_MARGIN)
+        self._credentials, self._refresh_at = credentials, refresh_at
+
+    def _fetch_credentials(self) -> Tuple[Credentials, Optional[float]]:
+        """Fetch the credentials from the credential client, returns the credentials
+        and the expiration timestamp of the STS credentials if it is known."""
+        cloud_credential = self.client.cloud_credential
+        provider = getattr(cloud_credential, "provider", None)
+        if provider is not None and hasattr(provider, "get_credentials"):
+            # alibabacloud-credentials>=1.0: the credentials returned by the
+            # provider carry the expiration of the STS credentials.
+            credential = provider.get_credentials()
+            credentials = Credentials(
+                access_key_id=credential.get_access_key_id(),
+                access_key_secret=credential.get_access_key_secret(),
+                security_token=credential.get_security_token(),
+            )
+            get_expiration = getattr(credential, "get_expiration", None)
+            expiration = get_expiration() if get_expiration else None
+        elif hasattr(self.client, "get_credential"):
+            credential = self.client.get_credential()
+            credentials = Credentials(
+                access_key_id=credential.access_key_id,
+                access_key_secret=credential.access_key_secret,
+                security_token=credential.security_token,
+            )
+            # The credential classes of alibabacloud-credentials<1.0 keep the
+            # expiration of the STS credentials as an attribute.
+            expiration = getattr(cloud_credential, "expiration", None)
+        else:
+            credentials = Credentials(
+                access_key_id=self.client.get_access_key_id(),
+                access_key_secret=self.client.get_access_key_secret(),
+                security_token=self.client.get_security_token(),
+            )
+            expiration = None
+        if isinstance(expiration, (int, float)) and not isinstance(expiration, bool):
+            return credentials, float(expiration)
+        return credentials, None
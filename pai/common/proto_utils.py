@@ -0,0 +1,433 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Protobuf wire format helpers for the EAS tensor messages.
+
+The `ArrayProto` messages used by the TensorFlow and PyTorch processors (see
+`eas_prediction.tf_request_pb2` and `eas_prediction.pytorch_predict_pb2`) share the
+same field numbers and store numeric values in packed repeated fields. The payload of
+a packed fixed-width field is exactly the little-endian buffer of the array, and the
+payload of a packed varint field can be built with vectorized NumPy operations, so
+tensors can be encoded and decoded without creating a Python object per element.
+"""
+
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
+
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_FIXED64 = 1
+WIRE_TYPE_LENGTH_DELIMITED = 2
+WIRE_TYPE_FIXED32 = 5
+
+# Field numbers of the ArrayProto message.
+ARRAY_PROTO_DTYPE_FIELD = 1
+ARRAY_PROTO_SHAPE_FIELD = 2
+ARRAY_PROTO_FLOAT_FIELD = 3
+ARRAY_PROTO_DOUBLE_FIELD = 4
+ARRAY_PROTO_INT_FIELD = 5
+ARRAY_PROTO_STRING_FIELD = 6
+ARRAY_PROTO_INT64_FIELD = 7
+ARRAY_PROTO_BOOL_FIELD = 8
+
+# Field number of the `dim` field in the ArrayShape message.
+ARRAY_SHAPE_DIM_FIELD = 1
+
+# Field numbers of a map entry message.
+MAP_ENTRY_KEY_FIELD = 1
+MAP_ENTRY_VALUE_FIELD = 2
+
+# Values of the ArrayDataType enum, which are the same in the TensorFlow and PyTorch
+# processor protocols.
+DT_INVALID = 0
+DT_FLOAT = 1
+DT_DOUBLE = 2
+DT_INT32 = 3
+DT_UINT8 = 4
+DT_INT16 = 5
+DT_INT8 = 6
+DT_STRING = 7
+DT_INT64 = 9
+DT_BOOL = 10
+DT_QINT8 = 11
+DT_QUINT8 = 12
+DT_QINT32 = 13
+DT_QINT16 = 15
+DT_QUINT16 = 16
+DT_UINT16 = 17
+
+_INT_VAL_DATA_TYPES = (
+    DT_INT8,
+    DT_INT16,
+    DT_INT32,
+    DT_UINT8,
+    DT_UINT16,
+    DT_QINT8,
+    DT_QINT16,
+    DT_QINT32,
+    DT_QUINT8,
+    DT_QUINT16,
+)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def value_field_for_data_type(data_type: int) -> int:
+    """Returns the ArrayProto field number holding values of the given data type."""
+    if data_type == DT_FLOAT:
+        return ARRAY_PROTO_FLOAT_FIELD
+    elif data_type == DT_DOUBLE:
+        return ARRAY_PROTO_DOUBLE_FIELD
+    elif data_type in _INT_VAL_DATA_TYPES:
+        return ARRAY_PROTO_INT_FIELD
+    elif data_type == DT_INT64:
+        return ARRAY_PROTO_INT64_FIELD
+    elif data_type == DT_BOOL:
+        return ARRAY_PROTO_BOOL_FIELD
+    elif data_type == DT_STRING:
+        return ARRAY_PROTO_STRING_FIELD
+    raise ValueError(f"Not supported ArrayProto data type: {data_type}")
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a single integer as a protobuf varint.
+
+    Negative values are encoded as their 64-bit two's complement, which is how
+    protobuf encodes negative int32 and int64 values.
+    """
+    if value < 0:
+        value += 1 << 64
+    if value < 0x80:
+        return bytes((value,))
+    buf = bytearray()
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+    return bytes(buf)
+
+
+def decode_varint(buf: BytesLike, pos: int) -> Tuple[int, int]:
+    """Decode a varint from the buffer at the given position.
+
+    Returns:
+        Tuple[int, int]: The decoded (unsigned) value and the position after it.
+    """
+    result = 0
+    shift = 0
+    end = len(buf)
+    while True:
+        if pos >= end:
+            raise ValueError("Truncated varint in protobuf message.")
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Too many bytes when decoding varint.")
+
+
+def encode_varint_array(values: np.ndarray) -> bytes:
+    """Encode an integer array as the payload of a packed varint field.
+
+    The encoding is vectorized: each value is split into (at most 10) 7-bit groups
+    in a 2-D byte matrix, and the bytes that belong to the value are selected with a
+    boolean mask.
+    """
+    values = np.ascontiguousarray(values).reshape(-1)
+    if values.size == 0:
+        return b""
+    if values.dtype == np.bool_:
+        return values.view(np.uint8).tobytes()
+    if values.dtype.kind not in ("i", "u"):
+        raise ValueError(f"Cannot encode non integer array as varint: {values.dtype}")
+    if values.dtype.kind == "u" and values.dtype.itemsize == 8:
+        v = values.astype(np.uint64, copy=False)
+    else:
+        # Negative values are sign extended to 64 bits, as required by protobuf.
+        v = values.astype(np.int64, copy=False).view(np.uint64)
+
+    if v.max() < 0x80:
+        return v.astype(np.uint8).tobytes()
+
+    # Only build as many 7-bit groups as required by the largest value.
+    max_length = (int(v.max()).bit_length() + 6) // 7
+    seven = np.uint64(7)
+    groups = np.empty((v.size, max_length), dtype=np.uint8)
+    lengths = np.ones(v.size, dtype=np.int64)
+    rest = v.copy()
+    for i in range(max_length):
+        groups[:, i] = rest & np.uint64(0x7F)
+        rest >>= seven
+        if i < max_length - 1:
+            lengths += rest != 0
+    columns = np.arange(max_length)
+    # Set the continuation bit on every byte except the last one of each value.
+    groups[columns < (lengths - 1)[:, None]] |= 0x80
+    return groups[columns < lengths[:, None]].tobytes()
+
+
+def decode_varint_array(buf: BytesLike) -> np.ndarray:
+    """Decode the payload of a packed varint field into an uint64 array."""
+    b = np.frombuffer(buf, dtype=np.uint8)
+    if b.size == 0:
+        return np.empty(0, dtype=np.uint64)
+    if b.max() < 0x80:
+        return b.astype(np.uint64)
+
+    ends = np.flatnonzero(b < 0x80)
+    if ends.size == 0 or ends[-1] != b.size - 1:
+        raise ValueError("Truncated varint in packed protobuf field.")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    if lengths.max() > 10:
+        raise ValueError("Too many bytes when decoding varint.")
+    group_index = np.arange(b.size) - np.repeat(starts, lengths)
+    payload = (b & 0x7F).astype(np.uint64) << (
+        group_index.astype(np.uint64) * np.uint64(7)
+    )
+    return np.bitwise_or.reduceat(payload, starts)
+
+
+def iter_fields(buf: BytesLike) -> Iterator[Tuple[int, int, Union[int, memoryview]]]:
+    """Iterate the fields of a serialized protobuf message.
+
+    Yields:
+        Tuple[int, int, Union[int, memoryview]]: Tuple of (field_number, wire_type,
+            value). The value is an int for varint fields, and a zero-copy memoryview
+            on the buffer for length-delimited and fixed-width fields.
+    """
+    buf = memoryview(buf).cast("B") if not isinstance(buf, memoryview) else buf
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = decode_varint(buf, pos)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == WIRE_TYPE_VARINT:
+            value, pos = decode_varint(buf, pos)
+        elif wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = decode_varint(buf, pos)
+            value = buf[pos : pos + length]
+            pos += length
+        elif wire_type == WIRE_TYPE_FIXED64:
+            value = buf[pos : pos + 8]
+            pos += 8
+        elif wire_type == WIRE_TYPE_FIXED32:
+            value = buf[pos : pos + 4]
+            pos += 4
+        else:
+            raise ValueError(f"Not supported protobuf wire type: {wire_type}")
+        if pos > end:
+            raise ValueError("Truncated protobuf message.")
+        yield field_number, wire_type, value
+
+
+def _tag(field_number: int, wire_type: int) -> bytes:
+    return encode_varint((field_number << 3) | wire_type)
+
+
+def encode_length_delimited(field_number: int, parts: List[BytesLike]) -> List:
+    """Prefix the given payload parts with the tag and length of a length-delimited
+    field.
+
+    The parts are returned as a list so that nested messages can be assembled and
+    joined into the final message with a single copy. Each part should be bytes or
+    a byte formatted memoryview, so its length is its size in bytes.
+    """
+    size = sum(map(len, parts))
+    return [
+        _tag(field_number, WIRE_TYPE_LENGTH_DELIMITED) + encode_varint(size)
+    ] + list(parts)
+
+
+def _as_wire_buffer(value: np.ndarray, dtype: str) -> memoryview:
+    """Returns a zero-copy byte view on the contiguous little-endian buffer of value."""
+    arr = np.ascontiguousarray(value, dtype=dtype).reshape(-1)
+    return memoryview(arr.view(np.uint8))
+
+
+_SMALL_VARINTS = [bytes((i,)) for i in range(0x80)]
+
+
+def _encode_string_values(value: np.ndarray) -> List[bytes]:
+    tag = _tag(ARRAY_PROTO_STRING_FIELD, WIRE_TYPE_LENGTH_DELIMITED)
+    items = value.reshape(-1).tolist()
+    if value.dtype.kind == "U":
+        items = [item.encode() for item in items]
+    elif value.dtype.kind != "S":
+        items = [
+            item
+            if isinstance(item, bytes)
+            else item.encode()
+            if isinstance(item, str)
+            else str(item).encode()
+            for item in items
+        ]
+    small_varints = _SMALL_VARINTS
+    return [
+        tag
+        + (small_varints[len(item)] if len(item) < 0x80 else encode_varint(len(item)))
+        + item
+        for item in items
+    ]
+
+
+def encode_array_proto(data_type: int, shape, value: np.ndarray) -> List:
+    """Encode a numpy array as a serialized ArrayProto message.
+
+    Args:
+        data_type (int): ArrayDataType of the array.
+        shape: Shape of the array.
+        value (np.ndarray): The array to be encoded.
+
+    Returns:
+        List: Parts of the serialized message, which can be joined with
+            `b"".join(parts)`. Numeric values are referenced as zero-copy views on
+            the array buffer.
+    """
+    parts = []
+    if data_type != DT_INVALID:
+        parts.append(_tag(ARRAY_PROTO_DTYPE_FIELD, WIRE_TYPE_VARINT))
+        parts.append(encode_varint(data_type))
+
+    dims = encode_varint_array(np.asarray(shape, dtype=np.int64))
+    shape_msg = encode_length_delimited(ARRAY_SHAPE_DIM_FIELD, [dims]) if dims else []
+    parts.extend(encode_length_delimited(ARRAY_PROTO_SHAPE_FIELD, shape_msg))
+
+    field_number = value_field_for_data_type(data_type)
+    if value.size == 0:
+        return parts
+    if field_number == ARRAY_PROTO_STRING_FIELD:
+        parts.extend(_encode_string_values(value))
+        return parts
+
+    if field_number == ARRAY_PROTO_FLOAT_FIELD:
+        payload = _as_wire_buffer(value, "<f4")
+    elif field_number == ARRAY_PROTO_DOUBLE_FIELD:
+        payload = _as_wire_buffer(value, "<f8")
+    elif field_number == ARRAY_PROTO_BOOL_FIELD:
+        payload = encode_varint_array(value.astype(np.bool_, copy=False))
+    else:
+        if value.dtype.kind not in ("i", "u", "b"):
+            value = value.astype(np.int64)
+        payload = encode_varint_array(value)
+    parts.extend(encode_length_delimited(field_number, [payload]))
+    return parts
+
+
+def _decode_numeric_chunk(field_number: int, wire_type: int, value) -> np.ndarray:
+    if field_number == ARRAY_PROTO_FLOAT_FIELD:
+        if wire_type not in (WIRE_TYPE_LENGTH_DELIMITED, WIRE_TYPE_FIXED32):
+            raise ValueError(f"Unexpected wire type for float values: {wire_type}")
+        return np.frombuffer(value, dtype="<f4")
+    elif field_number == ARRAY_PROTO_DOUBLE_FIELD:
+        if wire_type not in (WIRE_TYPE_LENGTH_DELIMITED, WIRE_TYPE_FIXED64):
+            raise ValueError(f"Unexpected wire type for double values: {wire_type}")
+        return np.frombuffer(value, dtype="<f8")
+
+    if wire_type == WIRE_TYPE_VARINT:
+        arr = np.asarray([value], dtype=np.uint64)
+    elif wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+        arr = decode_varint_array(value)
+    else:
+        raise ValueError(f"Unexpected wire type for varint values: {wire_type}")
+
+    if field_number == ARRAY_PROTO_BOOL_FIELD:
+        return arr != 0
+    return arr.view(np.int64)
+
+
+def decode_array_proto(
+    buf: BytesLike,
+) -> Tuple[int, List[int], Union[np.ndarray, List[bytes]]]:
+    """Decode a serialized ArrayProto message.
+
+    Values stored in fixed-width fields (float and double) are returned as read-only
+    zero-copy views on the given buffer.
+
+    Returns:
+        Tuple[int, List[int], Union[np.ndarray, List[bytes]]]: Tuple of (data_type,
+            shape, values). The values are a flat array in the wire representation
+            (float32, float64, int64 or bool), or a list of bytes for string
+            values.
+    """
+    data_type = DT_INVALID
+    shape = []
+    chunks = []
+    strings = []
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number == ARRAY_PROTO_DTYPE_FIELD:
+            data_type = value
+        elif field_number == ARRAY_PROTO_SHAPE_FIELD:
+            for _, dim_wire_type, dim in iter_fields(value):
+                if dim_wire_type == WIRE_TYPE_VARINT:
+                    shape.append(dim)
+                else:
+                    shape.extend(decode_varint_array(dim).view(np.int64).tolist())
+        elif field_number == ARRAY_PROTO_STRING_FIELD:
+            strings.append(value.tobytes())
+        elif ARRAY_PROTO_FLOAT_FIELD <= field_number <= ARRAY_PROTO_BOOL_FIELD:
+            chunks.append(_decode_numeric_chunk(field_number, wire_type, value))
+
+    # Negative dimensions are decoded as two's complement.
+    shape = [dim - (1 << 64) if dim >= (1 << 63) else dim for dim in shape]
+
+    if data_type in (DT_INVALID, DT_STRING):
+        return data_type, shape, strings
+    if not chunks:
+        return (
+            data_type,
+            shape,
+            _decode_numeric_chunk(
+                value_field_for_data_type(data_type), WIRE_TYPE_LENGTH_DELIMITED, b""
+            ),
+        )
+    values = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+    return data_type, shape, values
+
+
+def iter_map_entries(
+    buf: BytesLike, field_number: int
+) -> Iterator[Tuple[str, memoryview]]:
+    """Iterate entries of a `map<string, Message>` field in a serialized message.
+
+    Yields:
+        Tuple[str, memoryview]: The key and the serialized value message of each map
+            entry.
+    """
+    for number, wire_type, entry in iter_fields(buf):
+        if number != field_number or wire_type != WIRE_TYPE_LENGTH_DELIMITED:
+            continue
+        key, value = "", memoryview(b"")
+        for entry_field, _, entry_value in iter_fields(entry):
+            if entry_field == MAP_ENTRY_KEY_FIELD:
+                key = entry_value.tobytes().decode("utf-8")
+            elif entry_field == MAP_ENTRY_VALUE_FIELD:
+                value = entry_value
+        yield key, value
+
+
+def encode_map_entry(field_number: int, key: str, value_parts: List) -> List:
+    """Encode an entry of a `map<string, Message>` field.
+
+    Returns:
+        List: Parts of the serialized map entry field.
+    """
+    key_parts = encode_length_delimited(MAP_ENTRY_KEY_FIELD, [key.encode("utf-8")])
+    entry = key_parts + encode_length_delimited(MAP_ENTRY_VALUE_FIELD, value_parts)
+    return encode_length_delimited(field_number, entry)
@@ -16,13 +16,18 @@ from __future__ import absolute_import
 
 import functools
 import importlib.util
+import itertools
+import os
 import random
 import re
+import shutil
 import socket
 import string
 import sys
 import time
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Union
@@ -38,6 +43,9 @@ from pai.version import VERSION
 
 DEFAULT_PLAIN_TEXT_ALLOW_CHARACTERS = string.ascii_letters + string.digits + "_"
 
+# Max number of the pages fetched concurrently by make_list_resource_iterator.
+_DEFAULT_LIST_PREFETCH_PAGES = 8
+
 
 def is_iterable(arg):
     try:
@@ -73,11 +81,20 @@ def snake_to_camel(name):
     return "".join([w.title() for w in name.split("_")])
 
 
-def make_list_resource_iterator(method: Callable, **kwargs):
+def make_list_resource_iterator(
+    method: Callable, prefetch_pages: Optional[int] = None, **kwargs
+):
     """Wrap resource list method as an iterator.
 
+    Once the first page reveals the total count of the resources, the following
+    pages are fetched concurrently, at most `prefetch_pages` pages ahead of the
+    consumer, and the items are yielded in order. The pages are fetched one after
+    another if the method does not return the total count.
+
     Args:
         method: Resource List method.
+        prefetch_pages (int, optional): Max number of pages fetched concurrently.
+            Default to 8, pages are fetched serially if it is 1.
         **kwargs: arguments for the method.
 
     Yields:
@@ -88,15 +105,18 @@ def make_list_resource_iterator(method: Callable, **kwargs):
 
     page_number = kwargs.get("page_number", 1)
     page_size = kwargs.get("page_size", 10)
+    prefetch_pages = (
+        _DEFAULT_LIST_PREFETCH_PAGES if prefetch_pages is None else prefetch_pages
+    )
 
-    while True:
-        kwargs.update(page_number=page_number, page_size=page_size)
-        result = method(**kwargs)
+    def _fetch(page_number):
+        result = method(**dict(kwargs, page_number=page_number, page_size=page_size))
         if isinstance(result, PaginatedResult):
-            total_count = result.total_count
-            result = result.items
-        else:
-            total_count = None
+            return result.items, result.total_count
+        return result, None
+
+    result, total_count = _fetch(page_number)
+    while True:
         for item in result:
             yield item
 
@@ -104,8 +124,31 @@ def make_list_resource_iterator(method: Callable, **kwargs):
             return
         if total_count and page_number * page_size >= total_count:
             return
-
+        if total_count and prefetch_pages > 1:
+            break
         page_number += 1
+        result, total_count = _fetch(page_number)
+
+    last_page_number = (total_count + page_size - 1) // page_size
+    pending_pages = iter(range(page_number + 1, last_page_number + 1))
+    futures = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch_pages)
+    try:
+        for n in itertools.islice(pending_pages, prefetch_pages):
+            futures.append(executor.submit(_fetch, n))
+        while futures:
+            result, _ = futures.popleft().result()
+            for n in itertools.islice(pending_pages, 1):
+                futures.append(executor.submit(_fetch, n))
+            for item in result:
+                yield item
+            # The resources may be deleted while listing.
+            if len(result) < page_size:
+                return
+    finally:
+        for fut in futures:
+            fut.cancel()
+        executor.shutdown(wait=False)
 
 
 def to_plain_text(
@@ -379,3 +422,13 @@ def name_from_base(base_name: str, sep: str = "-") -> str:
     return "{base_name}{sep}{timestamp}".format(
         base_name=base_name, sep=sep, timestamp=timestamp(sep=sep, utc=False)
     )
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """Hardlink the file to the destination, fallback to copy if hardlink is not
+    supported, such as the files are on different filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
@@ -14,8 +14,11 @@
 
 import yaml
 
+# Use the LibYAML based dumper if it is available, which is much faster.
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-class NoAliasDumper(yaml.SafeDumper):
+
+class NoAliasDumper(_SafeDumper):
     def ignore_aliases(self, data):
         return True
 
@@ -27,6 +27,7 @@ from .job import (
     HyperParameterDefinition,
     LocalTrainingJob,
     TrainingJob,
+    TrainingJobBatch,
     UriOutput,
     _TrainingJobSubmitter,
 )
@@ -776,6 +777,7 @@ class Estimator(EstimatorBase):
         wait: bool = True,
         show_logs: bool = True,
         job_name: Optional[str] = None,
+        copy_inputs: bool = False,
     ) -> Union[TrainingJob, LocalTrainingJob]:
         """Submit a training job with the given input data.
 
@@ -793,6 +795,10 @@ class Estimator(EstimatorBase):
             show_logs (bool): Specifies whether to show the logs produced by the
                 training job (Default True).
             job_name (str, optional): The name of the training job.
+            copy_inputs (bool): Specifies whether to copy the local input data to a
+                temporary directory for a local training job. By default, the local
+                input data is mounted read-only to the container without copying.
+                (Default False).
 
         Returns:
             :class:`pai.job.TrainingJob` or :class:`pai.job.LocalTrainingJob`: A
@@ -811,6 +817,7 @@ class Estimator(EstimatorBase):
                 inputs=inputs,
                 instance_type=self.instance_type,
                 wait=wait,
+                copy_inputs=copy_inputs,
             )
         return self._fit(
             inputs=inputs,
@@ -871,12 +878,108 @@ class Estimator(EstimatorBase):
             show_logs=show_logs,
         )
 
+    def fit_many(
+        self,
+        hyperparameters_list: List[Dict[str, Any]],
+        inputs: Dict[str, Any] = None,
+        outputs: Dict[str, Any] = None,
+        max_concurrency: int = 8,
+        wait: bool = False,
+        job_name: Optional[str] = None,
+    ) -> TrainingJobBatch:
+        """Submit a batch of training jobs, one for each of the given
+        hyperparameters, such as the trials of a hyperparameter sweep.
+
+        The source code and the inputs are prepared once and shared by all the
+        training jobs, and the jobs are submitted concurrently.
+
+        Args:
+            hyperparameters_list (List[Dict[str, Any]]): Hyperparameters of each of
+                the training jobs, which override the hyperparameters of the
+                estimator.
+            inputs (Dict[str, Any]): A dictionary representing the input data for
+                the training jobs, see :meth:`fit` for details.
+            outputs (Dict[str, Any]): A dictionary representing the output locations
+                for the training jobs, see :meth:`fit` for details. Output channels
+                not specified are stored under a separate path for each job.
+            max_concurrency (int): Maximum number of the training jobs submitted
+                concurrently (Default 8).
+            wait (bool): Specifies whether to block until all the training jobs are
+                completed (Default False).
+            job_name (str, optional): The base name of the training jobs, the name of
+                each job is suffixed with its index in the batch.
+
+        Returns:
+            :class:`pai.job.TrainingJobBatch`: The submitted training jobs, in the
+                order of the given hyperparameters.
+
+        """
+        if is_local_run_instance_type(self.instance_type):
+            raise ValueError(
+                "Submitting a batch of training jobs is not supported for the local"
+                " instance type."
+            )
+        if not hyperparameters_list:
+            raise ValueError("No hyperparameters are provided.")
+        inputs = inputs or dict()
+        self._prepare_for_training()
+        base_job_name = self.job_name(job_name=job_name)
+
+        code_input = self._build_code_input(base_job_name, source_dir=self.source_dir)
+        algo_spec = self._build_algorithm_spec(
+            code_input=code_input,
+            inputs=inputs,
+        )
+        inputs = self.build_inputs(
+            inputs=inputs,
+            input_channels=algo_spec.input_channels,
+        )
+        outputs = dict(outputs or {})
+        if self.checkpoints_path:
+            outputs.update({DEFAULT_CHECKPOINT_CHANNEL_NAME: self.checkpoints_path})
+
+        job_configs = []
+        for idx, hps in enumerate(hyperparameters_list):
+            job_name = f"{base_job_name}-{idx}"
+            job_configs.append(
+                dict(
+                    job_name=job_name,
+                    algorithm_spec=algo_spec,
+                    instance_spec=self.instance_spec,
+                    instance_type=self.instance_type,
+                    instance_count=self.instance_count,
+                    resource_id=self.resource_id,
+                    hyperparameters={**(self.hyperparameters or {}), **hps},
+                    environments=self.environments,
+                    requirements=self.requirements,
+                    max_run_time=self.max_run_time,
+                    inputs=inputs,
+                    outputs=self.build_outputs(
+                        job_name=job_name,
+                        output_channels=algo_spec.output_channels,
+                        outputs=outputs,
+                    ),
+                    user_vpc_config=(
+                        self.user_vpc_config if self.user_vpc_config else None
+                    ),
+                    experiment_config=(
+                        self.experiment_config if self.experiment_config else None
+                    ),
+                    labels=self.labels,
+                )
+            )
+        batch = self._submit_many(job_configs, max_concurrency=max_concurrency)
+        if wait:
+            batch.wait()
+        return batch
+
     def _local_run(
         self,
         job_name,
         instance_type: str,
         inputs: Dict[str, Any] = None,
         wait: bool = True,
+        copy_inputs: bool = False,
     ) -> "LocalTrainingJob":
         if self.instance_count > 1:
             raise RuntimeError("Local training job only supports single instance.")
@@ -886,6 +989,7 @@ class Estimator(EstimatorBase):
             inputs=inputs,
             job_name=job_name,
             instance_type=instance_type,
+            copy_inputs=copy_inputs,
         )
         training_job.run()
         if wait:
@@ -16,6 +16,7 @@ import webbrowser
 from typing import Iterator, Optional
 
 from .common.logging import get_logger
+from .common.utils import make_list_resource_iterator
 from .session import Session, get_default_session
 from .tensorboard import TensorBoard
 
@@ -176,25 +177,17 @@ class Experiment(object):
             Iterator[Experiment]: Experiment iterator.
         """
         session = session or get_default_session()
-        page_size = 50
-        page_number = 1
-        while True:
-            result = session.experiment_api.list(
-                name=name,
-                page_size=page_size,
-                page_number=page_number,
-            ).items
-            if not result:
-                break
-
-            for item in result:
-                yield cls(
-                    session=session,
-                    experiment_id=item["ExperimentId"],
-                    name=item["Name"],
-                    artifact_uri=item["ArtifactUri"],
-                )
-            page_number += 1
+        for item in make_list_resource_iterator(
+            session.experiment_api.list,
+            name=name,
+            page_size=50,
+        ):
+            yield cls(
+                session=session,
+                experiment_id=item["ExperimentId"],
+                name=item["Name"],
+                artifact_uri=item["ArtifactUri"],
+            )
 
     def tensorboard_data(self) -> str:
         """Output TensorBoard logs path.
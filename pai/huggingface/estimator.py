@@ -18,6 +18,7 @@ from ..api.image import ImageLabel
 from ..common.logging import get_logger
 from ..common.utils import to_semantic_version
 from ..estimator import Estimator
+from ..image import ImageScope, _find_images, _image_label_values
 from ..session import Session
 
 logger = get_logger(__name__)
@@ -236,20 +237,16 @@ class HuggingFaceEstimator(Estimator):
                 ImageLabel.framework_version("Transformers", self.transformers_version)
             )
 
-        resp = self.session.image_api.list(
-            labels=labels,
-            workspace_id=0,
-            verbose=True,
-        )
+        images = _find_images(ImageScope.TRAINING, labels=labels, session=self.session)
 
-        if resp.total_count == 0:
+        if not images:
             raise ValueError(
                 "No official image found for Transformers version:"
                 f" {self.transformers_version}. Currently supported versions are:"
                 f" {self._get_supported_tf_versions_for_training()}"
             )
 
-        image = resp.items[0]["ImageUri"]
+        image = images[0]["ImageUri"]
         return image
 
     def _get_supported_tf_versions_for_training(self) -> List[str]:
@@ -263,20 +260,13 @@ class HuggingFaceEstimator(Estimator):
             ImageLabel.framework_version("PyTorch", "*"),
             ImageLabel.framework_version("Transformers", "*"),
         ]
-        list_image_labels = self.session.image_api.list_labels(
-            label_keys=label_keys,
-            label_filter=label_filter,
-            workspace_id=0,
+        return _image_label_values(
+            ImageScope.TRAINING,
+            label_key=label_keys,
+            labels=label_filter,
+            session=self.session,
         )
 
-        res = []
-        for label in list_image_labels:
-            if label["Value"] not in res:
-                res.append(label["Value"])
-
-        res.sort(key=lambda x: to_semantic_version(x))
-        return res
-
     def _get_latest_tf_version_for_training(self) -> str:
         """Return the latest Transformers version for training."""
         res = self._get_supported_tf_versions_for_training()
@@ -16,7 +16,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from ..common.logging import get_logger
 from ..common.utils import to_semantic_version
-from ..image import ImageLabel
+from ..image import ImageLabel, ImageScope, _find_images, _image_label_values
 from ..model._model import (
     DefaultServiceConfig,
     ModelBase,
@@ -222,21 +222,18 @@ class HuggingFaceModel(ModelBase):
             )
 
         name = "huggingface-inference:"
-        resp = self.session.image_api.list(
-            name=name,
-            labels=labels,
-            workspace_id=0,
-            verbose=True,
+        images = _find_images(
+            ImageScope.INFERENCE, labels=labels, name=name, session=self.session
         )
 
-        if resp.total_count == 0:
+        if not images:
             raise ValueError(
                 "No official image found for Transformers version:"
                 f" {self.transformers_version}. Currently supported versions are:"
                 f" {self._get_supported_tf_versions_for_inference()}"
             )
 
-        image = resp.items[0]["ImageUri"]
+        image = images[0]["ImageUri"]
         return image
 
     def _get_supported_tf_versions_for_inference(self) -> List[str]:
@@ -250,23 +247,13 @@ class HuggingFaceModel(ModelBase):
             ImageLabel.framework_version("Transformers", "*"),
         ]
         name = "huggingface-inference:"
-        list_images = self.session.image_api.list(
-            name=name,
+        return _image_label_values(
+            ImageScope.INFERENCE,
+            label_key="system.framework.Transformers",
             labels=labels,
-            verbose=True,
-            workspace_id=0,
-        ).items
-
-        res = []
-        for image in list_images:
-            for label in image["Labels"]:
-                if (
-                    label["Key"] == "system.framework.Transformers"
-                    and label["Value"] not in res
-                ):
-                    res.append(label["Value"])
-        res.sort(key=lambda x: to_semantic_version(x))
-        return res
+            name=name,
+            session=self.session,
+        )
 
     def _get_latest_tf_version_for_inference(self) -> str:
         """Return the latest transformers version for inference."""
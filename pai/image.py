@@ -12,10 +12,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 from .api.image import SUPPORTED_IMAGE_FRAMEWORKS, ImageLabel
+from .common.consts import DEFAULT_CONFIG_PATH
 from .common.logging import get_logger
 from .common.utils import make_list_resource_iterator, to_semantic_version
 from .session import Session, get_default_session
@@ -39,6 +46,16 @@ _PAI_IMAGE_TAG_PATTERN_INFERENCE = re.compile(
 # Regex expression pattern for PAI Docker Image URI.
 _PAI_IMAGE_URI_PATTERN = re.compile(r"([\S]+)/([\S]+)/([\S]+):([\S]+)")
 
+# Seconds that the persisted image catalog is used without checking for updates.
+_DEFAULT_IMAGE_CATALOG_TTL = float(os.environ.get("PAI_IMAGE_CATALOG_TTL") or 6 * 3600)
+# Seconds after which the image catalog is fetched again, even if it looks unchanged.
+_IMAGE_CATALOG_MAX_AGE = 7 * 24 * 3600
+# Minimum seconds between the forced refreshes of the image catalog.
+_IMAGE_CATALOG_MIN_REFRESH_INTERVAL = 60
+_IMAGE_CATALOG_VERSION = 1
+_IMAGE_CATALOG_FIELDS = ("ImageId", "Name", "ImageUri", "Labels")
+_CHIP_TYPE_LABEL_KEY = "system.chipType"
+
 
 class ImageInfo(object):
     """This class represents information for an image provided by PAI.
@@ -208,6 +225,250 @@ def _list_images(
     return gen
 
 
+class _ImageCatalog(object):
+    """Official images of a scope in a region, indexed for the lookups.
+
+    The images are kept in the order returned by the service, newest first.
+    """
+
+    def __init__(
+        self, image_scope: str, images: List[Dict[str, Any]], fetched_at: float = 0
+    ):
+        self.image_scope = image_scope
+        self.images = images
+        self.fetched_at = fetched_at
+        self._infos: List[ImageInfo] = []
+        self._version_index: Dict[Tuple[str, str, str], ImageInfo] = {}
+        self._latest_index: Dict[Tuple[str, str], ImageInfo] = {}
+        self._label_index = defaultdict(set)
+
+        for idx, item in enumerate(images):
+            labels = {lb["Key"]: lb["Value"] for lb in item.get("Labels") or []}
+            for key, value in labels.items():
+                self._label_index[f"{key}={value}"].add(idx)
+                self._label_index[f"{key}=*"].add(idx)
+
+            info = _make_image_info(image_obj=item, image_scope=image_scope)
+            if not info:
+                continue
+            self._infos.append(info)
+            fw_name = info.framework_name.lower()
+            accelerator = (labels.get(_CHIP_TYPE_LABEL_KEY) or "").upper()
+            self._version_index.setdefault(
+                (fw_name, accelerator, info.framework_version), info
+            )
+            if not info.framework_version:
+                continue
+            latest = self._latest_index.get((fw_name, accelerator))
+            if not latest or to_semantic_version(
+                info.framework_version
+            ) > to_semantic_version(latest.framework_version):
+                self._latest_index[(fw_name, accelerator)] = info
+
+    def get(
+        self, framework_name: str, accelerator_type: str, framework_version: str
+    ) -> Optional[ImageInfo]:
+        """Returns the image of the framework version, or the latest version if
+        framework_version is 'latest'."""
+        key = (framework_name.lower(), accelerator_type.upper())
+        if framework_version.lower() == "latest":
+            return self._latest_index.get(key)
+        return self._version_index.get(key + (framework_version,))
+
+    def framework_versions(
+        self, framework_name: str, accelerator_type: str
+    ) -> List[str]:
+        """Returns the versions of the framework provided by the images."""
+        return [
+            version
+            for fw_name, accelerator, version in self._version_index
+            if fw_name == framework_name.lower()
+            and accelerator == accelerator_type.upper()
+            and version
+        ]
+
+    def list(self, framework_name: Optional[str] = None) -> List[ImageInfo]:
+        """Returns the images of the framework, or all the recognized images."""
+        if not framework_name:
+            return list(self._infos)
+        return [
+            img
+            for img in self._infos
+            if img.framework_name.lower() == framework_name.lower()
+        ]
+
+    def find(self, labels: List[str], name: Optional[str] = None) -> List[Dict]:
+        """Returns the images that have all the given labels.
+
+        Args:
+            labels (List[str]): Labels in the form of 'key=value', a label with value
+                '*' matches any value of the key.
+            name (str, optional): A substring of the name or URI of the images.
+
+        Returns:
+            List[Dict]: The matched images, newest first.
+        """
+        indices = set(range(len(self.images)))
+        for label in labels:
+            indices &= self._label_index.get(label, set())
+        images = [self.images[idx] for idx in sorted(indices)]
+        if name:
+            images = [
+                img for img in images if name in img["Name"] or name in img["ImageUri"]
+            ]
+        return images
+
+    def label_values(
+        self, label_key: str, labels: List[str], name: Optional[str] = None
+    ) -> List[str]:
+        """Returns the distinct values of the label key, of the images matched by
+        :meth:`find`, sorted by the semantic version."""
+        values = set()
+        for img in self.find(labels, name=name):
+            for lb in img.get("Labels") or []:
+                if lb["Key"] == label_key:
+                    values.add(lb["Value"])
+        return sorted(values, key=to_semantic_version)
+
+
+_image_catalogs: Dict[str, Tuple[float, _ImageCatalog]] = {}
+_image_catalogs_lock = threading.Lock()
+
+
+def _image_catalog_path() -> str:
+    return os.path.join(os.path.dirname(DEFAULT_CONFIG_PATH), "image_catalog.json")
+
+
+def _load_image_catalog_cache() -> Dict[str, Dict]:
+    try:
+        with open(_image_catalog_path(), "r") as f:
+            cache = json.load(f)
+        if cache.get("version") == _IMAGE_CATALOG_VERSION:
+            return cache["entries"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _save_image_catalog_cache(key: str, entry: Dict[str, Any]):
+    path = _image_catalog_path()
+    entries = _load_image_catalog_cache()
+    entries[key] = entry
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": _IMAGE_CATALOG_VERSION, "entries": entries}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug("Failed to save the image catalog %s: %s", path, e)
+
+
+def _image_catalog_fingerprint(labels: List[str], session: Session) -> List[Any]:
+    """Returns the total count and the ID of the newest image of the catalog, used
+    to check whether the catalog is changed without listing all the images."""
+    res = session.image_api.list(
+        labels=labels,
+        workspace_id=0,
+        order="DESC",
+        sort_by="GmtCreateTime",
+        page_number=1,
+        page_size=1,
+    )
+    newest = res.items[0].get("ImageId") if res.items else None
+    return [res.total_count, newest]
+
+
+def _get_image_catalog(
+    image_scope: str, session: Optional[Session] = None, refresh: bool = False
+) -> _ImageCatalog:
+    """Returns the catalog of the official images of the scope.
+
+    The catalog is fetched once and persisted under the PAI config directory. Once
+    the TTL expires, the catalog is fetched again only if the total count or the
+    newest image of the catalog is changed.
+    """
+    session = session or get_default_session()
+    image_scope = image_scope.lower()
+    labels = [ImageLabel.OFFICIAL_LABEL, ImageScope.to_image_label(image_scope)]
+    key = "{}|{}".format(session.region_id, image_scope)
+
+    with _image_catalogs_lock:
+        now = time.time()
+        loaded_at, catalog = _image_catalogs.get(key, (0, None))
+        if catalog:
+            if now - catalog.fetched_at < _IMAGE_CATALOG_MIN_REFRESH_INTERVAL:
+                return catalog
+            if not refresh and now - loaded_at < _DEFAULT_IMAGE_CATALOG_TTL:
+                return catalog
+
+        entry = None if refresh else _load_image_catalog_cache().get(key)
+        if entry and now - entry.get("checked_at", 0) >= _DEFAULT_IMAGE_CATALOG_TTL:
+            if now - entry.get("fetched_at", 0) < _IMAGE_CATALOG_MAX_AGE and entry.get(
+                "fingerprint"
+            ) == _image_catalog_fingerprint(labels, session=session):
+                entry["checked_at"] = now
+                _save_image_catalog_cache(key, entry)
+            else:
+                entry = None
+        if not entry or "images" not in entry:
+            fingerprint = _image_catalog_fingerprint(labels, session=session)
+            images = [
+                {k: item.get(k) for k in _IMAGE_CATALOG_FIELDS}
+                for item in _list_images(labels=labels, session=session, page_size=100)
+            ]
+            entry = {
+                "fetched_at": now,
+                "checked_at": now,
+                "fingerprint": fingerprint,
+                "images": images,
+            }
+            _save_image_catalog_cache(key, entry)
+
+        catalog = _ImageCatalog(
+            image_scope, entry["images"], fetched_at=entry["fetched_at"]
+        )
+        _image_catalogs[key] = (now, catalog)
+        return catalog
+
+
+def _find_images(
+    image_scope: str,
+    labels: List[str],
+    name: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> List[Dict]:
+    """Returns the official images of the scope that have all the given labels,
+    see :meth:`_ImageCatalog.find`."""
+    images = _get_image_catalog(image_scope, session=session).find(labels, name=name)
+    if not images:
+        # The images may be released after the catalog is fetched.
+        images = _get_image_catalog(image_scope, session=session, refresh=True).find(
+            labels, name=name
+        )
+    return images
+
+
+def _image_label_values(
+    image_scope: str,
+    label_key: str,
+    labels: List[str],
+    name: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> List[str]:
+    """Returns the distinct values of the label key of the official images of the
+    scope, see :meth:`_ImageCatalog.label_values`."""
+    values = _get_image_catalog(image_scope, session=session).label_values(
+        label_key, labels, name=name
+    )
+    if not values:
+        # The images may be released after the catalog is fetched.
+        values = _get_image_catalog(
+            image_scope, session=session, refresh=True
+        ).label_values(label_key, labels, name=name)
+    return values
+
+
 def retrieve(
     framework_name: str,
     framework_version: str,
@@ -259,63 +520,37 @@ def retrieve(
             f" {', '.join(SUPPORTED_IMAGE_FRAMEWORKS)}",
         )
 
-    # label filter used to list official images of specific scope.
-    labels = [ImageLabel.OFFICIAL_LABEL, ImageScope.to_image_label(image_scope)]
-
     # if accelerator_type is not specified, use CPU image by default.
     if not accelerator_type or accelerator_type.lower() == "cpu":
-        labels.append(ImageLabel.DEVICE_TYPE_CPU)
+        accelerator_type = "CPU"
     elif accelerator_type.lower() == "gpu":
-        labels.append(ImageLabel.DEVICE_TYPE_GPU)
+        accelerator_type = "GPU"
     else:
         raise ValueError(
             f"Given accelerator type ({accelerator_type}) is not supported, only"
             f" CPU and GPU is supported."
         )
 
-    resp = _list_images(name=framework_name, labels=labels, session=session)
-
-    # extract image properties, such as framework version, py_version, os_version, etc,
-    # from image tag.
-    candidates = []
-    for image_item in resp:
-        image_info = _make_image_info(
-            image_obj=image_item,
-            image_scope=image_scope,
-        )
-        if image_info.framework_name.lower() != framework_name.lower():
-            continue
-        candidates.append(image_info)
-
-    if not candidates:
+    catalog = _get_image_catalog(image_scope, session=session)
+    img = catalog.get(framework_name, accelerator_type, framework_version)
+    if not img:
+        # The image may be released after the catalog is fetched.
+        catalog = _get_image_catalog(image_scope, session=session, refresh=True)
+        img = catalog.get(framework_name, accelerator_type, framework_version)
+    if img:
+        return img
+
+    supported_versions = catalog.framework_versions(framework_name, accelerator_type)
+    if not supported_versions:
         raise RuntimeError(
             f"Not found any image that satisfy the requirements: framework_name="
             f"{framework_name}, accelerator={accelerator_type}"
         )
-
-    if framework_version.lower() == "latest":
-        # select the latest framework version.
-        candidates = sorted(
-            candidates,
-            key=lambda img: to_semantic_version(img.framework_version),
-            reverse=True,
-        )
-        return candidates[0]
-    else:
-        # find the image with the specific framework version.
-        img = next(
-            (img for img in candidates if img.framework_version == framework_version),
-            None,
-        )
-        if not img:
-            supported_versions = [img.framework_version for img in candidates]
-            raise RuntimeError(
-                f"Not found the specific framework: framework_name={framework_name}, "
-                f"framework_version={framework_version}, supported versions for the"
-                f" framework are {','.join(supported_versions)} "
-            )
-        else:
-            return img
+    raise RuntimeError(
+        f"Not found the specific framework: framework_name={framework_name}, "
+        f"framework_version={framework_version}, supported versions for the"
+        f" framework are {','.join(supported_versions)} "
+    )
 
 
 def list_images(
@@ -343,20 +578,4 @@ def list_images(
     else:
         framework_name = framework_name.strip().lower()
 
-    labels = [
-        ImageScope.to_image_label(image_scope),
-        ImageLabel.OFFICIAL_LABEL,
-    ]
-    images = _list_images(labels=labels, session=session)
-
-    images = [
-        _make_image_info(
-            item,
-            image_scope=image_scope,
-        )
-        for item in images
-    ]
-    if framework_name:
-        return [img for img in images if img.framework_name.lower() == framework_name]
-    else:
-        return images
+    return _get_image_catalog(image_scope, session=session).list(framework_name)
@@ -26,7 +26,11 @@ from ._training_job import (
     SpotSpec,
     SpotStrategy,
     TrainingJob,
+    TrainingJobBatch,
+    TrainingJobLogRecord,
+    TrainingJobLogStream,
     TrainingJobStatus,
+    TrainingJobWatcher,
     UriInput,
     UriOutput,
     UserVpcConfig,
@@ -37,6 +41,10 @@ __all__ = [
     "TrainingJob",
     "ModelRecipeSpec",
     "TrainingJobStatus",
+    "TrainingJobWatcher",
+    "TrainingJobBatch",
+    "TrainingJobLogStream",
+    "TrainingJobLogRecord",
     "Channel",
     "HyperParameterDefinition",
     "OssLocation",
@@ -12,7 +12,6 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import distutils.dir_util
 import json
 import os
 import posixpath
@@ -22,13 +21,14 @@ import shutil
 import tempfile
 import textwrap
 import typing
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from pai.session import Session
 
 from ..common.consts import INSTANCE_TYPE_LOCAL_GPU
 from ..common.docker_utils import ContainerRun, run_container
 from ..common.logging import get_logger
+from ..common.oss_cache import OssObjectCache
 from ..common.oss_utils import OssUriObj, download, is_oss_uri
 
 if typing.TYPE_CHECKING:
@@ -82,7 +82,15 @@ sh {0}
 
 
 class LocalTrainingJob(object):
-    """A class that represents a local training job running with docker container."""
+    """A class that represents a local training job running with docker container.
+
+    Local input data is bind mounted read-only to the training container, and OSS
+    input data is linked from the local cache of the OSS objects, so a job starts
+    without copying the data. The source code is copied to a writable working
+    directory, so files written by the job do not change the source directory on
+    the host. Set ``copy_inputs`` to True to run the job with a writable copy of
+    the input data, isolated from the files on the host.
+    """
 
     def __init__(
         self,
@@ -91,9 +99,11 @@ class LocalTrainingJob(object):
         instance_type: str = None,
         temp_dir: str = None,
         job_name: str = None,
+        copy_inputs: bool = False,
     ):
         self.estimator = estimator
         self.inputs = inputs
+        self.copy_inputs = copy_inputs
         self.tmp_dir = temp_dir or tempfile.mkdtemp()
         self.job_name = job_name
         self.instance_type = instance_type
@@ -174,6 +184,8 @@ class LocalTrainingJob(object):
         user_code_dir = os.path.join(self.tmp_dir, "user_code")
         if is_oss_uri(self.estimator.source_dir):
             raise RuntimeError("OSS source code is not supported in local training.")
+        # The source code is copied rather than hardlinked, a file rewritten in
+        # place by the job would change the source file on the host otherwise.
         shutil.copytree(self.estimator.source_dir, user_code_dir)
         volumes[user_code_dir] = {
             "bind": _TrainingJobConfig.WORKING_DIR,
@@ -181,12 +193,7 @@ class LocalTrainingJob(object):
         }
 
         # 2. Prepare input data for training job.
-        input_data = self.prepare_input_data()
-        for host_path, container_path in input_data.items():
-            volumes[host_path] = {
-                "bind": container_path,
-                "mode": "rw",
-            }
+        volumes.update(self._prepare_input_volumes())
 
         # 3. Prepare input config files, such as hyperparameters.json,
         # training-job.json, etc.
@@ -242,45 +249,83 @@ class LocalTrainingJob(object):
             f.write(json.dumps({k: str(v) for k, v in hps.items()}))
 
     def prepare_input_data(self) -> Dict[str, str]:
-        """Prepare input data config."""
-        input_data_configs = {}
+        """Prepare input data config.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping the host paths of the input data to
+                the paths in the training container.
+        """
+        return {
+            host_path: volume["bind"]
+            for host_path, volume in self._prepare_input_volumes().items()
+        }
 
+    def _prepare_input_volumes(self) -> Dict[str, Dict[str, str]]:
+        """Prepare the volumes of the input channels for the training container."""
+        volumes = {}
         for name, input_data in self.inputs.items():
-            local_channel_path = os.path.join(self.tmp_dir, f"input/data/{name}")
-            os.makedirs(local_channel_path, exist_ok=True)
-            input_data_configs[local_channel_path] = posixpath.join(
-                _TrainingJobConfig.INPUT_DATA_DIR, name
+            host_path, container_path, mode = self._prepare_input_channel(
+                name, input_data, mounted=volumes
             )
-            if is_oss_uri(input_data):
-                oss_uri_obj = OssUriObj(input_data)
-                oss_bucket = self.session.get_oss_bucket(oss_uri_obj.bucket_name)
-                os.makedirs(local_channel_path, exist_ok=True)
+            volumes[host_path] = {"bind": container_path, "mode": mode}
+        return volumes
+
+    def _prepare_input_channel(
+        self, name: str, input_data: str, mounted: Dict[str, Any]
+    ) -> Tuple[str, str, str]:
+        """Prepare the input data of a channel, returns the host path, the container
+        path and the mount mode of the channel."""
+        channel_path = posixpath.join(_TrainingJobConfig.INPUT_DATA_DIR, name)
+        local_channel_path = os.path.join(self.tmp_dir, f"input/data/{name}")
+
+        if is_oss_uri(input_data):
+            oss_uri_obj = OssUriObj(input_data)
+            oss_bucket = self.session.get_oss_bucket(oss_uri_obj.bucket_name)
+            os.makedirs(local_channel_path, exist_ok=True)
+            if self.copy_inputs:
                 download(
                     oss_uri_obj.object_key,
                     local_path=local_channel_path,
                     bucket=oss_bucket,
                 )
-                input_data_configs[local_channel_path] = posixpath.join(
-                    _TrainingJobConfig.INPUT_DATA_DIR, name
-                )
-            else:
-                # If the input data is local files, copy the input data to a
-                # temporary directory.
-                if not os.path.exists(input_data):
-                    raise ValueError(
-                        "Input data not exists: name={} input_data={}".format(
-                            name, input_data
-                        )
-                    )
-                elif os.path.isdir(input_data):
-                    distutils.dir_util.copy_tree(input_data, local_channel_path)
-                else:
-                    shutil.copy(
-                        input_data,
-                        os.path.join(local_channel_path, os.path.basename(input_data)),
-                    )
+                return local_channel_path, channel_path, "rw"
+            # Objects are linked from the local cache, unchanged objects are not
+            # downloaded again.
+            OssObjectCache().materialize(
+                oss_uri_obj.object_key,
+                local_path=local_channel_path,
+                bucket=oss_bucket,
+            )
+            return local_channel_path, channel_path, "ro"
 
-        return input_data_configs
+        if not os.path.exists(input_data):
+            raise ValueError(
+                "Input data not exists: name={} input_data={}".format(name, input_data)
+            )
+        input_data = os.path.abspath(input_data)
+        is_dir = os.path.isdir(input_data)
+        # Volumes are keyed by the host path, a path used by multiple channels is
+        # mounted once, and copied for the other channels.
+        if not self.copy_inputs and input_data not in mounted:
+            if is_dir:
+                return input_data, channel_path, "ro"
+            return (
+                input_data,
+                posixpath.join(channel_path, os.path.basename(input_data)),
+                "ro",
+            )
+
+        # If the job is run with isolated inputs, copy the input data to a
+        # temporary directory.
+        os.makedirs(local_channel_path, exist_ok=True)
+        if is_dir:
+            shutil.copytree(input_data, local_channel_path, dirs_exist_ok=True)
+        else:
+            shutil.copy(
+                input_data,
+                os.path.join(local_channel_path, os.path.basename(input_data)),
+            )
+        return local_channel_path, channel_path, "rw"
 
     def wait(self, show_logs: bool = True):
         self._container_run.watch(show_logs=show_logs)
@@ -12,19 +12,35 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import heapq
 import os
 import posixpath
+import re
+import threading
 import time
 import typing
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_pascal
 from Tea.exceptions import TeaException
 
-from ..api.base import PaginatedResult
+from ..common.code_cache import upload_source_dir
 from ..common.consts import StoragePathCategory
 from ..common.logging import get_logger
 from ..common.oss_utils import OssUriObj, is_oss_uri, upload
@@ -32,6 +48,7 @@ from ..common.utils import (
     is_dataset_id,
     is_filesystem_uri,
     is_odps_table_uri,
+    make_list_resource_iterator,
     name_from_base,
     print_table,
     random_str,
@@ -55,6 +72,33 @@ DEFAULT_OUTPUT_MODEL_CHANNEL_NAME = "model"
 DEFAULT_CHECKPOINT_CHANNEL_NAME = "checkpoints"
 DEFAULT_TENSORBOARD_CHANNEL_NAME = "tensorboard"
 
+# Directory under the TrainingSrc storage path that stores the content-addressed
+# source code.
+_CODE_CACHE_DIR_NAME = "code_cache"
+
+# Page size of the list request used to refresh the status of the watched jobs, and
+# max number of the pages scanned per refresh.
+_WATCHER_LIST_PAGE_SIZE = 100
+_WATCHER_MAX_LIST_PAGES = 5
+# The watched jobs fail with the error if the refreshes fail consecutively for the
+# given times, such as the credentials are expired.
+_WATCHER_MAX_REFRESH_FAILURES = 3
+
+# Default maximum number of concurrent requests to create the training jobs of a
+# batch.
+_DEFAULT_SUBMIT_CONCURRENCY = 8
+
+# Bounds of the page size of the log requests of a worker.
+_MIN_LOG_PAGE_SIZE = 20
+_MAX_LOG_PAGE_SIZE = 100
+# Max seconds to drain the logs after the log stream is stopped.
+_LOG_DRAIN_TIMEOUT = 10
+# Seconds between the discoveries of the instances of the training job.
+_LOG_WORKER_TTL = 30
+_LOG_TIMESTAMP_PATTERN = re.compile(
+    r"^\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d{3}(?:\d{3})?)?)"
+)
+
 
 class SpotStrategy(str, Enum):
     SpotWithPriceLimit = "SpotWithPriceLimit"
@@ -420,8 +464,11 @@ class TrainingJob(BaseAPIModel):
         else:
             job_log_printer = None
         try:
-            while not self.is_completed():
-                time.sleep(interval)
+            if not self.is_completed():
+                # Jobs waited concurrently in the session share a watcher, which
+                # refreshes their status with a single list request.
+                watcher = _get_session_watcher(session, interval=interval)
+                self._update_status(watcher.watch(self).result())
         finally:
             if job_log_printer:
                 job_log_printer.stop(wait=True)
@@ -461,7 +508,12 @@ class TrainingJob(BaseAPIModel):
         training_job = type(self).model_validate(
             session.training_job_api.get(training_job_id=self.training_job_id)
         )
+        self._update_status(training_job)
+
+    def _update_status(self, training_job: "TrainingJob"):
         self.status = training_job.status
+        self.reason_code = training_job.reason_code
+        self.reason_message = training_job.reason_message
 
     def is_succeeded(self):
         """Return True if the training job is succeeded"""
@@ -478,83 +530,583 @@ class TrainingJob(BaseAPIModel):
         return self.status in TrainingJobStatus.completed_status()
 
 
-class _TrainingJobLogPrinter(object):
-    """A class used to print logs for a training job"""
+class TrainingJobWatcher(object):
+    """Watch the status of multiple training jobs.
 
-    executor = ThreadPoolExecutor(5)
+    A background thread refreshes the status of all the watched jobs with a single
+    list request per tick, optionally filtered by the labels of the jobs. Jobs not
+    found in the listed jobs are refreshed one by one. The interval between the
+    ticks grows while the status of the jobs does not change, and is reset once a
+    status changes. If the refreshes keep failing, the futures of the watched jobs
+    fail with the error. The jobs are removed from the watcher once their futures
+    are resolved.
+
+    Examples::
+
+        watcher = TrainingJobWatcher(interval=5)
+        futures = [watcher.watch(job) for job in jobs]
+        for fut in futures:
+            job = fut.result()
+            print(job.training_job_id, job.status)
+
+    """
 
     def __init__(
-        self, training_job_id: str, page_size=10, session: Optional[Session] = None
+        self,
+        session: Optional[Session] = None,
+        interval: float = 5,
+        max_interval: float = 60,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """TrainingJobWatcher initializer.
+
+        Args:
+            session (Session, optional): A PAI session instance used to refresh the
+                status of the jobs.
+            interval (float): Minimum interval in seconds between the refreshes.
+            max_interval (float): Maximum interval in seconds between the
+                refreshes, while the status of the jobs does not change.
+            labels (Dict[str, str], optional): Labels of the watched jobs, used to
+                filter the listed jobs.
+        """
+        self.session = session or get_default_session()
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.labels = labels
+        self._futures: Dict[str, Future] = {}
+        self._statuses: Dict[str, str] = {}
+        self._current_interval = interval
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def watch(
+        self,
+        training_job: Union[str, "TrainingJob"],
+        callback: Optional[Callable[["TrainingJob"], None]] = None,
+    ) -> Future:
+        """Watch a training job until it is completed.
+
+        Args:
+            training_job (Union[str, TrainingJob]): The training job or its ID.
+            callback (Callable[[TrainingJob], None], optional): A function called
+                with the completed training job.
+
+        Returns:
+            Future: A future resolved with the completed training job.
+        """
+        job_id = (
+            training_job
+            if isinstance(training_job, str)
+            else training_job.training_job_id
+        )
+        with self._lock:
+            fut = self._futures.get(job_id)
+            if fut is None:
+                fut = self._futures[job_id] = Future()
+            self._current_interval = self.interval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TrainingJobWatcher", daemon=True
+                )
+                self._thread.start()
+        if callback:
+
+            def _on_done(f: Future):
+                if not f.cancelled() and f.exception() is None:
+                    callback(f.result())
+
+            fut.add_done_callback(_on_done)
+        return fut
+
+    @property
+    def pending_jobs(self) -> List[str]:
+        """IDs of the watched jobs that are not completed."""
+        with self._lock:
+            return [job_id for job_id, fut in self._futures.items() if not fut.done()]
+
+    def _run(self):
+        failures = 0
+        while True:
+            with self._lock:
+                # Jobs whose futures are cancelled by the callers are not watched.
+                for job_id in [j for j, fut in self._futures.items() if fut.done()]:
+                    del self._futures[job_id]
+                    self._statuses.pop(job_id, None)
+                pending = list(self._futures)
+                if not pending:
+                    self._thread = None
+                    return
+            try:
+                changed = self._refresh(pending)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if failures >= _WATCHER_MAX_REFRESH_FAILURES:
+                    self._fail(pending, e)
+                    failures = 0
+                    continue
+                logger.warning("Failed to refresh the status of training jobs: %s", e)
+                changed = False
+            with self._lock:
+                self._current_interval = (
+                    self.interval
+                    if changed
+                    else min(self._current_interval * 1.5, self.max_interval)
+                )
+                interval = self._current_interval
+            time.sleep(interval)
+
+    def _fail(self, job_ids: List[str], error: Exception):
+        """Fail the watched jobs with the error, the jobs could be watched again."""
+        logger.error(
+            "Failed to refresh the status of training jobs %s times: %s",
+            _WATCHER_MAX_REFRESH_FAILURES,
+            error,
+        )
+        with self._lock:
+            futures = [self._futures.pop(job_id, None) for job_id in job_ids]
+            for job_id in job_ids:
+                self._statuses.pop(job_id, None)
+        for fut in futures:
+            if fut and not fut.done():
+                fut.set_exception(error)
+
+    def _list_jobs(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        api = self.session.training_job_api
+        if len(job_ids) == 1:
+            return {job_ids[0]: api.get(training_job_id=job_ids[0])}
+
+        remains = set(job_ids)
+        jobs = {}
+        # The watched jobs are usually the recently created ones, the newest jobs
+        # are listed first, and the pages are scanned one after another so that
+        # the scan stops once all the watched jobs are found.
+        items = make_list_resource_iterator(
+            api.list,
+            labels=self.labels,
+            page_size=_WATCHER_LIST_PAGE_SIZE,
+            sort_by="GmtCreateTime",
+            order="DESC",
+            prefetch_pages=1,
+        )
+        try:
+            for idx, item in enumerate(items):
+                job_id = item.get("TrainingJobId")
+                if job_id in remains:
+                    jobs[job_id] = item
+                    remains.remove(job_id)
+                if (
+                    not remains
+                    or idx + 1 >= _WATCHER_LIST_PAGE_SIZE * _WATCHER_MAX_LIST_PAGES
+                ):
+                    break
+        finally:
+            items.close()
+        for job_id in remains:
+            jobs[job_id] = api.get(training_job_id=job_id)
+        return jobs
+
+    def _refresh(self, job_ids: List[str]) -> bool:
+        """Refresh the status of the jobs, returns True if any status changed."""
+        changed = False
+        terminal_status = set(TrainingJobStatus.completed_status()) | set(
+            TrainingJobStatus.failed_status()
+        )
+        for job_id, item in self._list_jobs(job_ids).items():
+            job = TrainingJob.model_validate(item)
+            if self._statuses.get(job_id) != job.status:
+                self._statuses[job_id] = job.status
+                changed = True
+            if job.status in terminal_status:
+                # The completed jobs are not watched anymore, and could be watched
+                # again with a new future.
+                with self._lock:
+                    fut = self._futures.pop(job_id, None)
+                    self._statuses.pop(job_id, None)
+                if fut and not fut.done():
+                    fut.set_result(job)
+        return changed
+
+
+_session_watchers: "weakref.WeakKeyDictionary[Session, TrainingJobWatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+_session_watchers_lock = threading.Lock()
+
+
+def _get_session_watcher(session: Session, interval: float) -> TrainingJobWatcher:
+    with _session_watchers_lock:
+        watcher = _session_watchers.get(session)
+        if watcher is None:
+            watcher = _session_watchers[session] = TrainingJobWatcher(
+                session=session, interval=interval
+            )
+        watcher.interval = min(watcher.interval, interval)
+        return watcher
+
+
+class TrainingJobBatch(object):
+    """A batch of training jobs submitted together, such as the trials of a
+    hyperparameter sweep.
+
+    Examples::
+
+        batch = est.fit_many([{"lr": 0.1}, {"lr": 0.01}], max_concurrency=8)
+        print(batch.throughput)
+        batch.wait()
+        for job in batch:
+            print(job.training_job_id, job.status)
+
+    """
+
+    def __init__(
+        self,
+        training_jobs: List["TrainingJob"],
+        submit_seconds: float,
+        session: Optional[Session] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """TrainingJobBatch initializer.
+
+        Args:
+            training_jobs (List[TrainingJob]): The submitted training jobs.
+            submit_seconds (float): Seconds taken to submit the training jobs.
+            session (Session, optional): A PAI session instance used to refresh the
+                status of the jobs.
+            labels (Dict[str, str], optional): Labels of the training jobs, used to
+                filter the listed jobs while waiting for the jobs.
+        """
+        self.training_jobs = list(training_jobs)
+        self.submit_seconds = submit_seconds
+        self.session = session or get_default_session()
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.training_jobs)
+
+    def __iter__(self):
+        return iter(self.training_jobs)
+
+    def __getitem__(self, index) -> "TrainingJob":
+        return self.training_jobs[index]
+
+    def __repr__(self):
+        return "TrainingJobBatch(jobs={}, submit_seconds={:.2f})".format(
+            len(self.training_jobs), self.submit_seconds
+        )
+
+    @property
+    def throughput(self) -> float:
+        """Number of the training jobs submitted per second."""
+        if not self.submit_seconds:
+            return float(len(self.training_jobs))
+        return len(self.training_jobs) / self.submit_seconds
+
+    @property
+    def failed_jobs(self) -> List["TrainingJob"]:
+        """Training jobs that are failed or stopped."""
+        return [
+            job
+            for job in self.training_jobs
+            if job.status in TrainingJobStatus.failed_status()
+        ]
+
+    def wait(self, interval: int = 5) -> "TrainingJobBatch":
+        """Block until all the training jobs are completed.
+
+        Args:
+            interval (int): Minimum interval in seconds to refresh the status of the
+                jobs.
+
+        Returns:
+            TrainingJobBatch: The batch itself, with the status of the jobs updated.
+        """
+        watcher = TrainingJobWatcher(
+            session=self.session, interval=interval, labels=self.labels
+        )
+        futures = [(job, watcher.watch(job)) for job in self.training_jobs]
+        for job, fut in futures:
+            job._update_status(fut.result())
+        self.report()
+        return self
+
+    def report(self):
+        """Print the status of the training jobs to stdout."""
+        print(
+            f"Jobs status report, total jobs count: {len(self.training_jobs)}, "
+            f"failed jobs count: {len(self.failed_jobs)}"
+        )
+        print_table(
+            ["JobName", "JobID", "Status"],
+            [
+                [job.training_job_name, job.training_job_id, job.status]
+                for job in self.training_jobs
+            ],
+        )
+
+
+_log_stream_executor = ThreadPoolExecutor(8)
+
+
+class TrainingJobLogRecord(object):
+    """A log line produced by a worker of the training job."""
+
+    def __init__(
+        self, worker_id: Optional[str], message: str, timestamp: Optional[datetime]
     ):
+        self.worker_id = worker_id
+        self.message = message
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return "TrainingJobLogRecord(worker_id={!r}, message={!r})".format(
+            self.worker_id, self.message
+        )
+
+    def __str__(self):
+        return self.message
+
+
+def _parse_log_timestamp(message: str) -> Optional[datetime]:
+    m = _LOG_TIMESTAMP_PATTERN.match(message)
+    if not m:
+        return None
+    try:
+        return datetime.fromisoformat(m.group(1).replace(" ", "T"))
+    except ValueError:
+        return None
+
+
+class _WorkerLogCursor(object):
+    """Offset of the next log line of a worker, and the page size adapted to the
+    volume of the logs of the worker."""
+
+    def __init__(self, worker_id: Optional[str]):
+        self.worker_id = worker_id
+        self.offset = 0
+        self.page_size = _MIN_LOG_PAGE_SIZE
+        self.last_timestamp = datetime.min
+
+
+class TrainingJobLogStream(object):
+    """Stream the logs of the workers of a training job.
+
+    The stream keeps an offset cursor per worker, so a page of logs is never
+    fetched twice. The page size of a worker grows while its pages are full, and
+    shrinks while it produces few logs. Logs fetched from the workers in a round
+    are merged in the order of their timestamps.
+
+    Examples::
+
+        stream = TrainingJobLogStream(training_job_id)
+        for record in stream.iter_logs(follow=True):
+            print(record.worker_id, record.message)
+
+    """
+
+    def __init__(
+        self,
+        training_job_id: str,
+        session: Optional[Session] = None,
+        worker_ids: Optional[List[str]] = None,
+        interval: float = 1,
+    ):
+        """TrainingJobLogStream initializer.
+
+        Args:
+            training_job_id (str): ID of the training job.
+            session (Session, optional): A PAI session instance.
+            worker_ids (List[str], optional): IDs of the workers whose logs are
+                streamed. If not provided, logs of all the instances of the job are
+                streamed, including the instances started later.
+            interval (float): Interval in seconds between the polls when there is
+                no new log.
+        """
         self.training_job_id = training_job_id
-        self.session = session
-        self.page_size = page_size
-        self._future = None
-        self._stop = False
+        self.session = session or get_default_session()
+        self.interval = interval
+        self._discover_workers = worker_ids is None
+        self._cursors: Dict[Optional[str], _WorkerLogCursor] = {
+            worker_id: _WorkerLogCursor(worker_id) for worker_id in worker_ids or []
+        }
+        self._last_discovery = 0
 
-    def _list_logs_api(self, page_number: int = 1):
+    @property
+    def worker_ids(self) -> List[Optional[str]]:
+        return list(self._cursors.keys())
+
+    def _refresh_workers(self):
+        if not self._discover_workers or (
+            self._cursors and time.time() - self._last_discovery < _LOG_WORKER_TTL
+        ):
+            return
+        self._last_discovery = time.time()
+        job = self.session.training_job_api.get(training_job_id=self.training_job_id)
+        worker_ids = [
+            ins["Name"] for ins in job.get("Instances") or [] if ins.get("Name")
+        ]
+        if not worker_ids and not self._cursors:
+            # Logs of the default worker are returned if no worker is specified.
+            worker_ids = [None]
+        elif worker_ids and None in self._cursors:
+            # The default worker is the first instance of the job, which keeps the
+            # offset of the logs fetched before the instances are discovered.
+            cursor = self._cursors.pop(None)
+            cursor.worker_id = worker_ids[0]
+            self._cursors[worker_ids[0]] = cursor
+        for worker_id in worker_ids:
+            if worker_id not in self._cursors:
+                self._cursors[worker_id] = _WorkerLogCursor(worker_id)
+
+    def _list_logs(self, cursor: _WorkerLogCursor, page_number: int) -> List[str]:
         try:
-            res = self.session.training_job_api.list_logs(
+            return self.session.training_job_api.list_logs(
                 self.training_job_id,
+                worker_id=cursor.worker_id,
                 page_number=page_number,
-                page_size=self.page_size,
-            )
-            return res
+                page_size=cursor.page_size,
+            ).items
         except TeaException as e:
             # hack: Backend service may raise an exception when the training job
             # instance is not found.
             if e.code == "TRAINING_JOB_INSTANCE_NOT_FOUND":
-                return PaginatedResult(items=[], total_count=0)
-            else:
-                raise e
+                return []
+            raise e
 
-    def _list_logs(self):
-        page_number, page_offset = 1, 0
-        # print training job logs.
-        while not self._stop:
-            res = self._list_logs_api(page_number=page_number)
-            # 1. move to next page
-            if len(res.items) == self.page_size:
-                # print new logs starting from page_offset
-                self._print_logs(logs=res.items[page_offset:])
-                page_number += 1
-                page_offset = 0
-            # 2. stay at the current page.
-            else:
-                if len(res.items) > page_offset:
-                    # print new logs starting from page_offset
-                    self._print_logs(logs=res.items[page_offset:])
-                    page_offset = len(res.items)
-                time.sleep(1)
-
-        # When _stop is True, wait and print remaining logs.
-        time.sleep(10)
+    def _fetch_worker(
+        self, cursor: _WorkerLogCursor
+    ) -> List[Tuple[datetime, TrainingJobLogRecord]]:
+        """Fetch the new logs of a worker, starting from its cursor.
+
+        Returns:
+            List[Tuple[datetime, TrainingJobLogRecord]]: The log records, with the
+                timestamps used to merge them with the logs of other workers.
+        """
+        records = []
         while True:
-            res = self._list_logs_api(page_number=page_number)
-            # There maybe more logs in the next page
-            if len(res.items) == self.page_size:
-                self._print_logs(logs=res.items[page_offset:])
-                page_number += 1
-                page_offset = 0
-            # No more logs in the next page.
-            else:
-                if len(res.items) > page_offset:
-                    self._print_logs(logs=res.items[page_offset:])
-                break
+            page_number = cursor.offset // cursor.page_size + 1
+            skip = cursor.offset % cursor.page_size
+            logs = self._list_logs(cursor, page_number=page_number)
+            for message in logs[skip:]:
+                timestamp = _parse_log_timestamp(message)
+                # Lines without timestamp follow the previous line of the worker.
+                if timestamp:
+                    cursor.last_timestamp = timestamp
+                records.append(
+                    (
+                        cursor.last_timestamp,
+                        TrainingJobLogRecord(cursor.worker_id, message, timestamp),
+                    )
+                )
+            cursor.offset += max(len(logs) - skip, 0)
+            if len(logs) < cursor.page_size:
+                if len(logs) - skip < cursor.page_size // 4:
+                    cursor.page_size = max(cursor.page_size // 2, _MIN_LOG_PAGE_SIZE)
+                return records
+            cursor.page_size = min(cursor.page_size * 2, _MAX_LOG_PAGE_SIZE)
+
+    def poll(self) -> List[TrainingJobLogRecord]:
+        """Fetch the new logs of all the workers, merged by the timestamps."""
+        self._refresh_workers()
+        cursors = list(self._cursors.values())
+        if len(cursors) == 1:
+            results = [self._fetch_worker(cursors[0])]
+        else:
+            results = list(_log_stream_executor.map(self._fetch_worker, cursors))
+        return [record for _, record in heapq.merge(*results, key=lambda x: x[0])]
+
+    def iter_logs(
+        self,
+        follow: bool = True,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Iterator[TrainingJobLogRecord]:
+        """Iterate over the logs of the training job.
+
+        Args:
+            follow (bool): Whether to keep polling the new logs. If False, only the
+                existing logs are returned.
+            stop_event (threading.Event, optional): An event that stops the
+                iteration once it is set, after the remaining logs are drained.
+
+        Yields:
+            TrainingJobLogRecord: Log records of the training job.
+        """
+        drain_deadline = None
+        while True:
+            records = self.poll()
+            yield from records
+            if not follow:
+                return
+            if stop_event is not None and stop_event.is_set():
+                # Logs of a completed job may be collected with a delay.
+                if drain_deadline is None:
+                    drain_deadline = time.time() + _LOG_DRAIN_TIMEOUT
+                elif not records or time.time() > drain_deadline:
+                    return
+            if not records:
+                time.sleep(self.interval)
+
+    async def aiter_logs(
+        self, follow: bool = True, stop_event: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[TrainingJobLogRecord]:
+        """Asynchronously iterate over the logs of the training job.
+
+        Args:
+            follow (bool): Whether to keep polling the new logs.
+            stop_event (asyncio.Event, optional): An event that stops the iteration
+                once it is set, after the remaining logs are drained.
+
+        Yields:
+            TrainingJobLogRecord: Log records of the training job.
+        """
+        loop = asyncio.get_running_loop()
+        drain_deadline = None
+        while True:
+            records = await loop.run_in_executor(None, self.poll)
+            for record in records:
+                yield record
+            if not follow:
+                return
+            if stop_event is not None and stop_event.is_set():
+                if drain_deadline is None:
+                    drain_deadline = time.time() + _LOG_DRAIN_TIMEOUT
+                elif not records or time.time() > drain_deadline:
+                    return
+            if not records:
+                await asyncio.sleep(self.interval)
+
+
+class _TrainingJobLogPrinter(object):
+    """A class used to print logs for a training job"""
+
+    executor = ThreadPoolExecutor(5)
 
-    def _print_logs(self, logs: List[str]):
-        for log in logs:
-            print(log)
+    def __init__(
+        self, training_job_id: str, page_size=10, session: Optional[Session] = None
+    ):
+        self.training_job_id = training_job_id
+        self.session = session
+        self.page_size = page_size
+        self._future = None
+        self._stop_event = threading.Event()
+
+    def _list_logs(self):
+        stream = TrainingJobLogStream(self.training_job_id, session=self.session)
+        for record in stream.iter_logs(follow=True, stop_event=self._stop_event):
+            if len(stream.worker_ids) > 1:
+                print("[{}] {}".format(record.worker_id, record.message))
+            else:
+                print(record.message)
 
     def start(self):
         if self._future:
             raise ValueError("The training job log printer is already started")
-        self._stop = False
+        self._stop_event.clear()
         self._future = self.executor.submit(self._list_logs)
 
     def stop(self, wait: bool = True):
-        self._stop = True
-        if self._future:
+        self._stop_event.set()
+        if self._future and wait:
             self._future.result()
 
 
@@ -614,13 +1166,12 @@ class _TrainingJobSubmitter(object):
         if all_jobs:
             if not self._training_jobs:
                 raise RuntimeError("Could not find any submitted job.")
-            remains = set(self._training_jobs)
-            while remains:
-                for job in self._training_jobs:
-                    if job in remains and job.is_completed():
-                        remains.remove(job)
-
-                time.sleep(interval)
+            watcher = TrainingJobWatcher(
+                session=self.session, interval=interval, labels=self.labels
+            )
+            futures = [(job, watcher.watch(job)) for job in self._training_jobs]
+            for job, fut in futures:
+                job._update_status(fut.result())
             self._generate_jobs_report()
         else:
             latest_job = self.latest_job
@@ -764,6 +1315,114 @@ class _TrainingJobSubmitter(object):
         wait: bool = True,
         show_logs: bool = False,
     ):
+        training_job_id = self._create_training_job(
+            job_name=job_name,
+            algorithm_spec=algorithm_spec,
+            algorithm_name=algorithm_name,
+            algorithm_version=algorithm_version,
+            algorithm_provider=algorithm_provider,
+            instance_count=instance_count,
+            instance_type=instance_type,
+            instance_spec=instance_spec,
+            resource_id=resource_id,
+            inputs=inputs,
+            outputs=outputs,
+            hyperparameters=hyperparameters,
+            max_run_time=max_run_time,
+            environments=environments,
+            user_vpc_config=user_vpc_config,
+            requirements=requirements,
+            experiment_config=experiment_config,
+            labels=labels,
+        )
+        training_job = TrainingJob.get(training_job_id)
+        self._training_jobs.append(training_job)
+        print(
+            f"View the job detail by accessing the console URI: {training_job.console_uri}"
+        )
+        if wait:
+            training_job.wait(show_logs=show_logs)
+        return training_job
+
+    def _submit_many(
+        self,
+        job_configs: List[Dict[str, Any]],
+        max_concurrency: int = _DEFAULT_SUBMIT_CONCURRENCY,
+    ) -> TrainingJobBatch:
+        """Create the training jobs concurrently.
+
+        Args:
+            job_configs (List[Dict[str, Any]]): Arguments of `_create_training_job`
+                for each of the training jobs.
+            max_concurrency (int): Maximum number of the concurrent create requests.
+
+        Returns:
+            TrainingJobBatch: The submitted training jobs, in the order of the given
+                job configs.
+        """
+        start = time.perf_counter()
+        job_ids = [None] * len(job_configs)
+        error = None
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = [
+                executor.submit(self._create_training_job, **config)
+                for config in job_configs
+            ]
+            for idx, fut in enumerate(futures):
+                try:
+                    job_ids[idx] = fut.result()
+                except Exception as e:
+                    error = error or e
+        submit_seconds = time.perf_counter() - start
+
+        created = [job_id for job_id in job_ids if job_id]
+        # The details of the created jobs are fetched by a list request instead of
+        # a get request per job.
+        watcher = TrainingJobWatcher(session=self.session, labels=self.labels)
+        details = watcher._list_jobs(created) if created else {}
+        batch = TrainingJobBatch(
+            [TrainingJob.model_validate(details[job_id]) for job_id in created],
+            submit_seconds=submit_seconds,
+            session=self.session,
+            labels=self.labels,
+        )
+        self._training_jobs.extend(batch.training_jobs)
+        if error:
+            logger.error(
+                "Failed to submit %d of %d training jobs, created jobs: %s",
+                len(job_configs) - len(created),
+                len(job_configs),
+                created,
+            )
+            raise error
+        print(
+            f"Submitted {len(batch)} training jobs in {submit_seconds:.2f}s "
+            f"({batch.throughput:.2f} jobs/s)."
+        )
+        return batch
+
+    def _create_training_job(
+        self,
+        job_name: str,
+        algorithm_spec: Optional[AlgorithmSpec] = None,
+        algorithm_name: Optional[str] = None,
+        algorithm_version: Optional[str] = None,
+        algorithm_provider: Optional[str] = None,
+        instance_count: int = 1,
+        instance_type: Optional[str] = None,
+        instance_spec: Optional[InstanceSpec] = None,
+        resource_id: Optional[str] = None,
+        inputs: Optional[List[Dict[str, Any]]] = None,
+        outputs: Optional[List[Dict[str, Any]]] = None,
+        hyperparameters: Optional[Dict[str, str]] = None,
+        max_run_time: Optional[int] = None,
+        environments: Optional[Dict[str, str]] = None,
+        user_vpc_config: Optional[Dict[str, str]] = None,
+        requirements: Optional[List[str]] = None,
+        experiment_config: Optional[Dict[str, Any]] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Create a training job, returns the ID of the training job."""
         session = get_default_session()
 
         if not self.resource_type or self.resource_type == ResourceType.General:
@@ -816,14 +1475,7 @@ class _TrainingJobSubmitter(object):
             environments=environments,
             settings=self.settings,
         )
-        training_job = TrainingJob.get(training_job_id)
-        self._training_jobs.append(training_job)
-        print(
-            f"View the job detail by accessing the console URI: {training_job.console_uri}"
-        )
-        if wait:
-            training_job.wait(show_logs=show_logs)
-        return training_job
+        return training_job_id
 
     @classmethod
     def _get_input_config(
@@ -907,6 +1559,16 @@ class _TrainingJobSubmitter(object):
             code_uri = source_dir
         elif not os.path.exists(source_dir):
             raise ValueError(f"Source directory {source_dir} does not exist.")
+        elif not code_dest and os.path.isdir(source_dir):
+            # Source directory is uploaded to a content-addressed path, which is
+            # reused by the jobs submitted with the same source code.
+            code_uri = upload_source_dir(
+                source_dir=source_dir,
+                oss_dir=self.session.get_storage_path_by_category(
+                    StoragePathCategory.TrainingSrc, _CODE_CACHE_DIR_NAME
+                ),
+                bucket=self.session.oss_bucket,
+            )
         else:
             code_dest = code_dest or self.session.get_storage_path_by_category(
                 StoragePathCategory.TrainingSrc, to_plain_text(job_name)
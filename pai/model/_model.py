@@ -35,10 +35,12 @@ from ..common import ProviderAlibabaPAI, git_utils
 from ..common.consts import INSTANCE_TYPE_LOCAL_GPU, ModelFormat, StoragePathCategory
 from ..common.docker_utils import ContainerRun, run_container
 from ..common.logging import get_logger
+from ..common.oss_cache import OssObjectCache
 from ..common.oss_utils import OssUriObj, download, is_oss_uri, upload
 from ..common.utils import (
     generate_repr,
     is_local_run_instance_type,
+    make_list_resource_iterator,
     random_str,
     to_plain_text,
 )
@@ -849,14 +851,17 @@ class ModelBase(object):
 
         return target_dir
 
-    def _download_model_data(self, target_dir):
+    def _download_model_data(self, target_dir, use_cache: bool = False):
         if not self.model_data:
             return
         logger.info(f"Prepare model data to local directory: {target_dir}")
         if self.model_data.startswith("oss://"):
             oss_uri = OssUriObj(self.model_data)
             oss_bucket = self.session.get_oss_bucket(oss_uri.bucket_name)
-            download(
+            # The cached files are linked to the target directory, which should be
+            # read-only for the users.
+            download_fn = OssObjectCache().materialize if use_cache else download
+            download_fn(
                 oss_path=oss_uri.object_key,
                 local_path=target_dir,
                 bucket=oss_bucket,
@@ -1170,11 +1175,11 @@ class ModelBase(object):
         work_dir = tempfile.mkdtemp()
         model_dir = os.path.join(work_dir, "model")
 
-        self._download_model_data(target_dir=model_dir)
+        self._download_model_data(target_dir=model_dir, use_cache=True)
         volumes = {
             model_dir: {
                 "bind": DefaultServiceConfig.model_path,
-                "mode": "rw",
+                "mode": "ro" if is_oss_uri(self.model_data) else "rw",
             }
         }
 
@@ -1190,6 +1195,8 @@ class ModelBase(object):
                 store_dir = os.path.join(work_dir, f"storage_{idx}")
                 os.makedirs(store_dir, exist_ok=True)
                 oss_uri = OssUriObj(storage.oss.path)
+                # OSS storage mounts are writable, the data is downloaded rather
+                # than linked from the local cache.
                 download(
                     oss_path=oss_uri.object_key,
                     local_path=store_dir,
@@ -1681,30 +1688,21 @@ class RegisteredModel(ModelBase):
                 the given criteria.
         """
         session = session or get_default_session()
-        page_size = 50
-        page_number = 1
-
-        while True:
-            result = session.model_api.list(
-                model_name=model_name,
-                provider=model_provider,
-                task=task,
-                page_size=page_size,
-                page_number=page_number,
-            ).items
-            if not result:
-                break
-
-            for item in result:
-                model_version_info = item.pop("LatestVersion", {})
-                model_info = item
-                yield cls(
-                    model_name=item["ModelName"],
-                    session=session,
-                    model_info=model_info,
-                    model_version_info=model_version_info,
-                )
-            page_number += 1
+        for item in make_list_resource_iterator(
+            session.model_api.list,
+            model_name=model_name,
+            provider=model_provider,
+            task=task,
+            page_size=50,
+        ):
+            model_version_info = item.pop("LatestVersion", {})
+            model_info = item
+            yield cls(
+                model_name=item["ModelName"],
+                session=session,
+                model_info=model_info,
+                model_version_info=model_version_info,
+            )
 
     def list_versions(
         self, model_version: Optional[str] = None
@@ -1715,26 +1713,18 @@ class RegisteredModel(ModelBase):
             model_version (str, optional): The version of the registered model. Default
                 to None.
         """
-        page_size = 50
-        page_number = 1
-
-        while True:
-            items = self.session.model_api.list_versions(
-                model_id=self.model_id,
-                page_number=page_number,
-                page_size=page_size,
-                version_name=model_version,
-            ).items
-            if not items:
-                break
-            for item in items:
-                yield RegisteredModel(
-                    model_name=self.model_name,
-                    session=self.session,
-                    model_info=self._model_info,
-                    model_version_info=item,
-                )
-            page_number += 1
+        for item in make_list_resource_iterator(
+            self.session.model_api.list_versions,
+            model_id=self.model_id,
+            page_size=50,
+            version_name=model_version,
+        ):
+            yield RegisteredModel(
+                model_name=self.model_name,
+                session=self.session,
+                model_info=self._model_info,
+                model_version_info=item,
+            )
 
     def _generate_service_name(self) -> str:
         """Generate a service name for the online prediction service."""
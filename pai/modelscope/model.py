@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Union
 from ..api.image import ImageLabel
 from ..common.logging import get_logger
 from ..common.utils import to_semantic_version
+from ..image import ImageScope, _find_images, _image_label_values
 from ..model._model import (
     DefaultServiceConfig,
     ModelBase,
@@ -220,21 +221,18 @@ class ModelScopeModel(ModelBase):
             )
 
         name = "modelscope-inference:"
-        list_images = self.session.image_api.list(
-            name=name,
-            labels=labels,
-            workspace_id=0,
-            verbose=True,
+        images = _find_images(
+            ImageScope.INFERENCE, labels=labels, name=name, session=self.session
         )
 
-        if list_images.total_count == 0:
+        if not images:
             raise ValueError(
                 "No official image found for modelscope version:"
                 f" {self.modelscope_version}. Currently supported versions are:"
                 f" {self._get_supported_ms_versions_for_inference()}"
             )
 
-        return list_images.items[0]["ImageUri"]
+        return images[0]["ImageUri"]
 
     def _get_supported_ms_versions_for_inference(self) -> List[str]:
         """Return the list of supported ModelScope versions for inference."""
@@ -247,23 +245,13 @@ class ModelScopeModel(ModelBase):
             ImageLabel.framework_version("ModelScope", "*"),
         ]
         name = "modelscope-inference:"
-        list_images = self.session.image_api.list(
-            name=name,
+        return _image_label_values(
+            ImageScope.INFERENCE,
+            label_key="system.framework.ModelScope",
             labels=labels,
-            verbose=True,
-            workspace_id=0,
-        ).items
-
-        res = []
-        for image in list_images:
-            for label in image["Labels"]:
-                if (
-                    label["Key"] == "system.framework.ModelScope"
-                    and label["Value"] not in res
-                ):
-                    res.append(label["Value"])
-        res.sort(key=lambda x: to_semantic_version(x))
-        return res
+            name=name,
+            session=self.session,
+        )
 
     def _get_latest_ms_version_for_inference(self) -> str:
         """Return the latest ModelScope version for inference."""
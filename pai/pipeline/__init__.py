@@ -16,7 +16,12 @@ from __future__ import absolute_import
 
 from .component import ContainerComponent, RegisteredComponent
 from .core import Pipeline
-from .run import PipelineRun, PipelineRunStatus
+from .run import (
+    PipelineNodeEvent,
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunStatusTracker,
+)
 from .step import PipelineStep
 from .types import PipelineArtifact, PipelineParameter, PipelineVariable
 
@@ -30,4 +35,6 @@ __all__ = [
     "PipelineStep",
     "PipelineRunStatus",
     "PipelineRun",
+    "PipelineRunStatusTracker",
+    "PipelineNodeEvent",
 ]
@@ -14,7 +14,8 @@
 
 from __future__ import absolute_import
 
-from collections import Counter, defaultdict
+import copy
+from collections import Counter, defaultdict, deque
 
 from ..common.logging import get_logger
 from ..common.yaml_utils import dump as yaml_dump
@@ -27,6 +28,36 @@ from .types.artifact import PipelineArtifact, PipelineArtifactElement
 logger = get_logger(__name__)
 
 
+class _PipelineGraph(object):
+    """Adjacency index of the steps in a pipeline."""
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.depends = {step: step.depends for step in self.steps}
+        self.dependents = defaultdict(list)
+        for step, depends in self.depends.items():
+            for depend_step in depends:
+                self.dependents[depend_step].append(step)
+
+    def topo_sort(self):
+        """Sort the steps topologically in O(V+E), raises ValueError if there is a
+        cycle dependency."""
+        in_degrees = {step: len(depends) for step, depends in self.depends.items()}
+        queue = deque(step for step in self.steps if not in_degrees[step])
+        sorted_steps = []
+        while queue:
+            step = queue.popleft()
+            sorted_steps.append(step)
+            for candidate_step in self.dependents[step]:
+                in_degrees[candidate_step] -= 1
+                if not in_degrees[candidate_step]:
+                    queue.append(candidate_step)
+
+        if len(sorted_steps) != len(self.steps):
+            raise ValueError("Cycle dependency detected, please check the input steps")
+        return sorted_steps
+
+
 class Pipeline(UnRegisteredComponent):
     """Represents pipeline instance in PAI Machine Learning pipeliner service.
 
@@ -49,11 +80,14 @@ class Pipeline(UnRegisteredComponent):
                 "Parameter steps must be a list of PipelineStep instances."
             )
 
+        self._steps_dict = None
+        self._manifests = {}
         steps, inputs, outputs, unregistered_ops = self._build_pipeline(
             steps, inputs, outputs
         )
 
         self._steps = steps
+        self._graph = _PipelineGraph(steps)
         self._unregistered_components = unregistered_ops
         super(Pipeline, self).__init__(inputs=inputs, outputs=outputs, **kwargs)
 
@@ -182,23 +216,25 @@ class Pipeline(UnRegisteredComponent):
         if isinstance(outputs, dict):
             outputs = list(outputs.values())
 
-        # find out all steps in the pipeline by topological sort.
+        # find out all steps in the pipeline by topological sort, the steps are
+        # kept in the order of discovery.
         steps = steps or []
-        visited_steps = set(
+        visited_steps = dict.fromkeys(
             steps + [output.parent for output in outputs if output.parent]
         )
-        cur_steps = visited_steps.copy()
+        cur_steps = list(visited_steps)
         while cur_steps:
-            next_steps = set()
+            next_steps = []
             for step in cur_steps:
                 for output in step.outputs.artifacts:
                     if output.repeated:
                         output.reset_count()
                 for depend in step.depends:
                     if depend not in visited_steps:
-                        next_steps.add(depend)
-                        visited_steps.add(depend)
+                        next_steps.append(depend)
+                        visited_steps[depend] = None
             cur_steps = next_steps
+        visited_steps = list(visited_steps)
 
         # infer the pipeline inputs from step inputs.
         infer_inputs = set()
@@ -268,29 +304,7 @@ class Pipeline(UnRegisteredComponent):
 
     @classmethod
     def _topo_sort(cls, steps):
-        rev_depends = defaultdict(set)
-        for step in steps:
-            for depend_step in step.depends:
-                rev_depends[depend_step].add(step)
-        # entry steps
-        visited_steps = [step for step in steps if not step.depends]
-
-        cur_steps = visited_steps
-        while cur_steps:
-            next_steps = []
-            for step in cur_steps:
-                for candidate_step in rev_depends[step]:
-                    if candidate_step in next_steps or candidate_step in visited_steps:
-                        continue
-                    if all(s in visited_steps for s in candidate_step.depends):
-                        next_steps.append(candidate_step)
-            visited_steps.extend(next_steps)
-            cur_steps = next_steps
-
-        if len(visited_steps) != len(steps):
-            raise ValueError("Cycle dependency detected, please check the input steps")
-
-        return visited_steps
+        return _PipelineGraph(steps).topo_sort()
 
     @classmethod
     def _check_steps(cls, steps):
@@ -330,23 +344,46 @@ class Pipeline(UnRegisteredComponent):
             steps: List of steps in pipeline.
         """
         used_names = set([s.name for s in steps])
-        used_names = set(used_names)
+        name_counters = {}
         for step in steps:
             step.parent = self
             if not step.name:
                 step.name = self._gen_step_name(
-                    step, used_names=used_names, search_limit=len(steps)
+                    step,
+                    used_names=used_names,
+                    search_limit=len(steps),
+                    name_counters=name_counters,
                 )
                 used_names.add(step.name)
 
     @classmethod
-    def _gen_step_name(cls, step, used_names, search_limit=100):
-        for i in range(search_limit):
-            candidate = "%s-%s" % (step.gen_name_prefix(), i)
+    def _gen_step_name(cls, step, used_names, search_limit=100, name_counters=None):
+        """Returns the first name not used, `{prefix}-{index}`.
+
+        The next index of each prefix is kept in name_counters, so that allocating
+        the names of the steps does not search from the first index each time.
+        """
+        prefix = step.gen_name_prefix()
+        name_counters = name_counters if name_counters is not None else {}
+        idx = name_counters.get(prefix, 0)
+        while idx < search_limit:
+            candidate = "%s-%s" % (prefix, idx)
+            idx += 1
             if candidate not in used_names:
+                name_counters[prefix] = idx
                 return candidate
         raise ValueError("No available name for the step")
 
+    def _invalidate_cache(self):
+        """Invalidate the cached serialization once the pipeline is changed."""
+        self._steps_dict = None
+        self._manifests = {}
+
+    def set_artifact_count(self, artifact_name, count):
+        res = super(Pipeline, self).set_artifact_count(artifact_name, count)
+        self._invalidate_cache()
+        return res
+
     @property
     def ref_name(self):
         return ""
@@ -368,7 +405,7 @@ class Pipeline(UnRegisteredComponent):
         graph = Digraph()
         for step in self.steps:
             graph.node(step.name)
-            for head in step.depends:
+            for head in self._graph.depends[step]:
                 graph.edge(head.name, step.name)
         return graph
 
@@ -382,7 +419,10 @@ class Pipeline(UnRegisteredComponent):
         if get_default_session():
             entrypoint["metadata"]["provider"] = get_default_session().provider
 
-        entrypoint["spec"]["pipelines"] = [step.to_dict() for step in self.steps]
+        if self._steps_dict is None:
+            self._steps_dict = [step.to_dict() for step in self.steps]
+        # Return a copy, the cached step dicts must not be changed by the caller.
+        entrypoint["spec"]["pipelines"] = copy.deepcopy(self._steps_dict)
         if not self._unregistered_components:
             return entrypoint
 
@@ -392,7 +432,14 @@ class Pipeline(UnRegisteredComponent):
         return res
 
     def to_manifest(self, identifier, version):
-        d = self.to_dict(identifier, version)
-        if isinstance(d, list):
-            return yaml_dump_all(d)
-        return yaml_dump(d)
+        session = get_default_session()
+        key = (identifier, version, session.provider if session else None)
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            d = self.to_dict(identifier, version)
+            if isinstance(d, list):
+                manifest = yaml_dump_all(d)
+            else:
+                manifest = yaml_dump(d)
+            self._manifests[key] = manifest
+        return manifest
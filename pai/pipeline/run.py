@@ -14,10 +14,10 @@
 
 from __future__ import absolute_import
 
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..api.base import PaginatedResult
 from ..common.logging import get_logger
@@ -27,6 +27,18 @@ from .artifact import ArchivedArtifact
 
 logger = get_logger(__name__)
 
+# Interval in seconds between the refreshes of a running pipeline (DAG) node, and
+# the max interval the refreshes slow down to while the node is idle.
+_DEFAULT_STATUS_POLL_INTERVAL = 2
+_DEFAULT_STATUS_POLL_MAX_INTERVAL = 30
+
+# Page size bounds of the log fetches of a node, and the intervals between the
+# fetches of an idle node.
+_MIN_LOG_PAGE_SIZE = 20
+_MAX_LOG_PAGE_SIZE = 500
+_LOG_POLL_INTERVAL = 1
+_LOG_POLL_MAX_INTERVAL = 10
+
 
 # TODO: review the status names of the PipelineRun.
 class PipelineRunStatus(object):
@@ -345,54 +357,37 @@ class PipelineRun(object):
         else:
             run_logger = _MockRunLogger(run_instance=self, node_id=node_id)
 
+        tracker = PipelineRunStatusTracker(
+            run_id=self.run_id,
+            node_id=node_id,
+            root_name=self.name,
+            session=self.session,
+        )
+        tracker.subscribe(run_logger.on_node_event)
         try:
-            prev_status_infos = {}
-            root_node_status = run_status
-            log_runners = []
-            while PipelineRunStatus.is_running(root_node_status):
-                curr_status_infos = self.travel_node_status_info(node_id)
-                for node_fullname, status_info in curr_status_infos.items():
-                    if (
-                        node_fullname not in prev_status_infos
-                        and status_info["status"] != PipelineRunStatus.Skipped
-                    ):
-                        log_runner = run_logger.submit(
-                            node_id=status_info["nodeId"], node_name=node_fullname
-                        )
-                        if log_runner:
-                            log_runners.append(log_runner)
-                prev_status_infos = curr_status_infos
-                root_node_status = (
-                    curr_status_infos[self.name]["status"]
-                    if self.name in curr_status_infos
-                    else root_node_status
-                )
-
-                if root_node_status == PipelineRunStatus.Failed:
+            while tracker.is_running and PipelineRunStatus.is_running(
+                tracker.root_status or run_status
+            ):
+                tracker.poll()
+                if tracker.root_status == PipelineRunStatus.Failed:
                     raise PAIException(
                         "PipelineRun failed: run_id={}, run_status_info={}".format(
-                            self.run_id, curr_status_infos
+                            self.run_id, tracker.status_infos
                         )
                     )
-                failed_nodes = {
-                    name: status_info
-                    for name, status_info in curr_status_infos.items()
-                    if PipelineRunStatus.Failed == status_info["status"]
-                }
+                failed_nodes = tracker.failed_nodes
                 if failed_nodes:
                     raise PAIException(
                         "PipelineRun failed: run_id={}, failed_nodes={}".format(
                             self.run_id, failed_nodes
                         )
                     )
-
-                time.sleep(2)
+                time.sleep(tracker.next_poll_delay())
         except (KeyboardInterrupt, PAIException) as e:
             run_logger.stop_tail()
             raise e
 
-        for log_runner in log_runners:
-            _ = log_runner.result()
+        run_logger.stop(wait=True)
 
         return self
 
@@ -403,6 +398,230 @@ class PipelineRun(object):
         pass
 
 
+class PipelineNodeEvent(object):
+    """A status transition of a node in a pipeline run."""
+
+    def __init__(
+        self,
+        name: str,
+        node_id: str,
+        node_type: Optional[str],
+        status: str,
+        previous_status: Optional[str] = None,
+        started_at: Optional[str] = None,
+        finished_at: Optional[str] = None,
+    ):
+        self.name = name
+        self.node_id = node_id
+        self.node_type = node_type
+        self.status = status
+        self.previous_status = previous_status
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    def __repr__(self):
+        return "PipelineNodeEvent(name={}, status={}, previous_status={})".format(
+            self.name, self.status, self.previous_status
+        )
+
+    def to_status_info(self) -> Dict[str, Any]:
+        return {
+            "name": self.name.rsplit(".", 1)[-1],
+            "nodeId": self.node_id,
+            "status": self.status,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+        }
+
+
+class _TrackedDag(object):
+    def __init__(self, name: str, node_id: str, depth: int, interval: float):
+        self.name = name
+        self.node_id = node_id
+        self.depth = depth
+        self.interval = interval
+        self.next_poll_at = 0
+
+
+class PipelineRunStatusTracker(object):
+    """Track the status of the nodes of a pipeline run incrementally.
+
+    Each refresh of a pipeline (DAG) node returns the status of its direct
+    children, the nested pipelines are tracked as separate subtrees. Only the
+    subtrees that are not completed are refreshed, and the refreshes of a subtree
+    slow down while the status of its nodes does not change. The status transitions
+    of the nodes are published as :class:`PipelineNodeEvent` to the subscribers.
+
+    Examples::
+
+        tracker = PipelineRunStatusTracker(run.run_id, node_id, root_name=run.name)
+        tracker.subscribe(print)
+        while tracker.is_running:
+            tracker.poll()
+            time.sleep(tracker.next_poll_delay())
+
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        node_id: str,
+        root_name: str,
+        session: Optional[Session] = None,
+        interval: float = _DEFAULT_STATUS_POLL_INTERVAL,
+        max_interval: float = _DEFAULT_STATUS_POLL_MAX_INTERVAL,
+        max_depth: int = 10,
+    ):
+        """PipelineRunStatusTracker initializer.
+
+        Args:
+            run_id (str): ID of the pipeline run.
+            node_id (str): ID of the root node of the pipeline run.
+            root_name (str): Name of the root node, used as the prefix of the name
+                of the nodes.
+            session (Session, optional): A PAI session instance used for
+                communicating with PAI service.
+            interval (float): Minimum interval in seconds between the refreshes of a
+                pipeline node.
+            max_interval (float): Maximum interval in seconds between the refreshes
+                of a pipeline node, while the status of its nodes does not change.
+            max_depth (int): Max depth of the nested pipelines to track.
+        """
+        self.run_id = run_id
+        self.root_name = root_name
+        self.session = session or get_default_session()
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.max_depth = max_depth
+        self._nodes: Dict[str, PipelineNodeEvent] = {}
+        self._dags: Dict[str, _TrackedDag] = {
+            root_name: _TrackedDag(root_name, node_id, depth=1, interval=interval)
+        }
+        # Names of the pipeline nodes that are tracked, including the completed ones.
+        self._tracked_dags = {root_name}
+        self._subscribers: List[Callable[[PipelineNodeEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[PipelineNodeEvent], None]):
+        """Register a function called with each of the node events."""
+        self._subscribers.append(callback)
+
+    @property
+    def status_infos(self) -> Dict[str, Dict[str, Any]]:
+        """Status of the tracked nodes, keyed by the full name of the nodes."""
+        return {name: node.to_status_info() for name, node in self._nodes.items()}
+
+    @property
+    def root_status(self) -> Optional[str]:
+        node = self._nodes.get(self.root_name)
+        return node.status if node else None
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True if the root node is not completed."""
+        return self.root_name in self._dags
+
+    @property
+    def failed_nodes(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: node.to_status_info()
+            for name, node in self._nodes.items()
+            if node.status == PipelineRunStatus.Failed
+        }
+
+    def next_poll_delay(self) -> float:
+        """Seconds until the next pipeline node is due to be refreshed."""
+        if not self._dags:
+            return 0
+        next_poll_at = min(dag.next_poll_at for dag in self._dags.values())
+        return max(next_poll_at - time.monotonic(), 0)
+
+    def poll(self) -> List[PipelineNodeEvent]:
+        """Refresh the pipeline nodes that are due, returns the node events."""
+        events = []
+        now = time.monotonic()
+        due = [dag for dag in self._dags.values() if dag.next_poll_at <= now]
+        while due:
+            dag = due.pop(0)
+            dag_events, new_dags = self._refresh(dag, now)
+            events.extend(dag_events)
+            # Nested pipelines found in the refresh are fetched in the same poll.
+            due.extend(new_dags)
+        for event in events:
+            for callback in self._subscribers:
+                callback(event)
+        return events
+
+    def _update_node(
+        self, name: str, info: Dict[str, Any]
+    ) -> Optional[PipelineNodeEvent]:
+        status_info = info.get("StatusInfo") or {}
+        prev = self._nodes.get(name)
+        status = status_info.get("Status")
+        if prev and prev.status == status:
+            # The node id is assigned after the node is listed, such as the nested
+            # pipelines.
+            prev.node_id = info["Metadata"]["NodeId"] or prev.node_id
+            return
+        node = self._nodes[name] = PipelineNodeEvent(
+            name=name,
+            node_id=info["Metadata"]["NodeId"],
+            node_type=info["Metadata"].get("NodeType"),
+            status=status,
+            previous_status=prev.status if prev else None,
+            started_at=status_info.get("StartedAt"),
+            finished_at=status_info.get("FinishedAt"),
+        )
+        return node
+
+    def _refresh(self, dag: _TrackedDag, now: float):
+        events, new_dags = [], []
+        detail = self.session.pipeline_run_api.get_node(
+            self.run_id, dag.node_id, depth=2
+        )
+        if not detail or "StartedAt" not in (detail.get("StatusInfo") or {}):
+            # The pipeline node is not started.
+            dag.next_poll_at = now + dag.interval
+            return events, new_dags
+
+        if dag.name == self.root_name:
+            event = self._update_node(dag.name, detail)
+            if event:
+                events.append(event)
+        for sub_pipeline in detail["Spec"].get("Pipelines") or []:
+            metadata = sub_pipeline["Metadata"]
+            name = "{}.{}".format(dag.name, metadata["Name"])
+            event = self._update_node(name, sub_pipeline)
+            if event:
+                events.append(event)
+            if (
+                metadata.get("NodeType") == "Dag"
+                and metadata.get("NodeId")
+                and name not in self._tracked_dags
+                and dag.depth < self.max_depth
+            ):
+                self._tracked_dags.add(name)
+                sub_dag = self._dags[name] = _TrackedDag(
+                    name,
+                    metadata["NodeId"],
+                    depth=dag.depth + 1,
+                    interval=self.interval,
+                )
+                new_dags.append(sub_dag)
+
+        status = detail["StatusInfo"].get("Status")
+        if status == PipelineRunStatus.Succeeded or status in (
+            PipelineRunStatus.completed_status()
+        ):
+            # The nodes of a completed pipeline do not change anymore.
+            del self._dags[dag.name]
+        else:
+            dag.interval = (
+                self.interval if events else min(dag.interval * 1.5, self.max_interval)
+            )
+            dag.next_poll_at = now + dag.interval
+        return events, new_dags
+
+
 def make_log_iterator(method: Callable, **kwargs):
     """Make an iterator from resource list API.
 
@@ -424,77 +643,166 @@ def make_log_iterator(method: Callable, **kwargs):
         for item in result.items:
             yield item
 
-        if len(result.items) == 0 or len(result.items) <= page_size:
+        if len(result.items) < page_size:
             return
         page_offset += page_size
 
 
+class _NodeLogCursor(object):
+    def __init__(self, node_id: str, node_name: str, page_size: int):
+        self.node_id = node_id
+        self.node_name = node_name
+        self.offset = 0
+        self.page_size = page_size
+        self.interval = _LOG_POLL_INTERVAL
+        self.next_fetch_at = 0
+        self.completed = False
+
+
 class _RunLogger(object):
-    executor = ThreadPoolExecutor(5)
+    """Tail the logs of the nodes of a pipeline run in a single thread.
+
+    The nodes are fetched in a round-robin manner, each from its own log offset.
+    The page size of a node grows while its pages are full, so that chatty nodes
+    get more of the fetch budget, and the fetches of idle nodes slow down. The
+    logger does not poll the run status, the completion of the nodes is given by
+    the node events of :class:`PipelineRunStatusTracker`.
+    """
 
     def __init__(self, run_instance, node_id, session):
         super(_RunLogger, self).__init__()
         self.run_instance = run_instance
         self.node_id = node_id
-        self.running_nodes = set()
         self.session = session
+        self._cursors: Dict[str, _NodeLogCursor] = {}
+        # IDs of the nodes that are tailed, including the completed ones.
+        self._submitted = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
         self._tail = True
-
-    def tail(
-        self,
-        node_id,
-        node_name,
-        page_size=100,
-        page_offset=0,
-    ):
-        if node_id in self.running_nodes:
-            return
-        self.running_nodes.add(node_id)
-
-        while True and self._tail:
-            logs = make_log_iterator(
-                self.session.pipeline_run_api.list_node_logs,
-                run_id=self.run_instance.run_id,
-                node_id=node_id,
-                page_size=page_size,
-                page_offset=page_offset,
-            )
-
-            count = 0
-            for log in logs:
-                print("%s: %s" % (node_name, log))
-                page_offset += 1
-                count += 1
-                if count % page_size == 0:
-                    time.sleep(0.5)
-
-            if count == 0:
-                status = self.run_instance.get_status()
-                if PipelineRunStatus.is_running(status):
-                    time.sleep(2)
-                else:
-                    break
+        self._draining = False
+        self._thread = None
 
     def submit(
         self,
         node_id,
         node_name,
-        page_size=100,
-        page_offset=0,
+        page_size=_MIN_LOG_PAGE_SIZE,
     ):
-        print("Add Node Logger: {}, {}".format(node_name, node_id))
-        if node_id in self.running_nodes:
-            return
-        return self.executor.submit(
-            self.tail,
-            node_id=node_id,
-            node_name=node_name,
-            page_size=page_size,
-            page_offset=page_offset,
-        )
+        """Start tailing the logs of the node."""
+        with self._lock:
+            if node_id in self._submitted:
+                return
+            self._submitted.add(node_id)
+            print("Add Node Logger: {}, {}".format(node_name, node_id))
+            self._cursors[node_id] = _NodeLogCursor(
+                node_id=node_id, node_name=node_name, page_size=page_size
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="PipelineRunLogger", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def on_node_event(self, event: PipelineNodeEvent):
+        """Handle the status transition of a node of the run."""
+        # The node id may be assigned after the first event of the node.
+        if event.node_id and event.status != PipelineRunStatus.Skipped:
+            self.submit(node_id=event.node_id, node_name=event.name)
+        if not PipelineRunStatus.is_running(event.status):
+            with self._lock:
+                cursor = self._cursors.get(event.node_id)
+                if cursor:
+                    # The remaining logs of the node are drained by the next fetch.
+                    cursor.completed = True
+            self._wakeup.set()
 
     def stop_tail(self):
+        """Stop tailing the logs immediately."""
         self._tail = False
+        self._wakeup.set()
+
+    def stop(self, wait: bool = True):
+        """Stop tailing the logs once the remaining logs of all nodes are printed."""
+        with self._lock:
+            self._draining = True
+            for cursor in self._cursors.values():
+                cursor.completed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread and wait:
+            thread.join()
+
+    def _fetch(self, cursor: _NodeLogCursor) -> int:
+        try:
+            result = self.session.pipeline_run_api.list_node_logs(
+                run_id=self.run_instance.run_id,
+                node_id=cursor.node_id,
+                page_offset=cursor.offset,
+                page_size=cursor.page_size,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to fetch the logs of node %s: %s", cursor.node_name, e
+            )
+            if cursor.completed:
+                with self._lock:
+                    self._cursors.pop(cursor.node_id, None)
+            cursor.next_fetch_at = time.monotonic() + _LOG_POLL_MAX_INTERVAL
+            return 0
+
+        logs = result.items or []
+        for log in logs:
+            print("%s: %s" % (cursor.node_name, log))
+        cursor.offset += len(logs)
+
+        if len(logs) >= cursor.page_size:
+            # Fetch the node again in the next round with a larger page.
+            cursor.page_size = min(cursor.page_size * 2, _MAX_LOG_PAGE_SIZE)
+            cursor.interval = _LOG_POLL_INTERVAL
+            cursor.next_fetch_at = 0
+        elif cursor.completed:
+            with self._lock:
+                self._cursors.pop(cursor.node_id, None)
+        else:
+            cursor.page_size = max(cursor.page_size // 2, _MIN_LOG_PAGE_SIZE)
+            cursor.interval = (
+                _LOG_POLL_INTERVAL
+                if logs
+                else min(cursor.interval * 1.5, _LOG_POLL_MAX_INTERVAL)
+            )
+            cursor.next_fetch_at = time.monotonic() + cursor.interval
+        return len(logs)
+
+    def _run(self):
+        while self._tail:
+            self._wakeup.clear()
+            with self._lock:
+                cursors = list(self._cursors.values())
+                if not cursors and self._draining:
+                    self._thread = None
+                    return
+            now = time.monotonic()
+            for cursor in cursors:
+                if not self._tail:
+                    break
+                if cursor.completed or cursor.next_fetch_at <= now:
+                    self._fetch(cursor)
+
+            with self._lock:
+                next_fetch_at = min(
+                    (
+                        0 if c.completed else c.next_fetch_at
+                        for c in self._cursors.values()
+                    ),
+                    default=now + _LOG_POLL_INTERVAL,
+                )
+            delay = next_fetch_at - time.monotonic()
+            if delay > 0:
+                self._wakeup.wait(delay)
+        with self._lock:
+            self._thread = None
 
 
 class _MockRunLogger(object):
@@ -503,11 +811,14 @@ class _MockRunLogger(object):
         self.run_instance = run_instance
         self.node_id = node_id
 
-    def tail(self, **kwargs):
+    def submit(self, *args, **kwargs):
         pass
 
-    def submit(self, *args, **kwargs):
+    def on_node_event(self, event):
         pass
 
     def stop_tail(self):
         pass
+
+    def stop(self, wait=True):
+        pass
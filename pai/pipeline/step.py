@@ -82,7 +82,9 @@ class PipelineStep(object):
         """
         from pai.pipeline.component import RegisteredComponent
 
-        self._depends = depends or set()
+        # Keep the dependencies in the order they are discovered, so that the
+        # generated manifest is stable between runs.
+        self._depends = dict.fromkeys(depends or [])
         if any([type(x) for x in self._depends if not isinstance(x, PipelineStep)]):
             raise ValueError("Invalid variable in depends, expected PipelineStep")
 
@@ -186,8 +188,14 @@ class PipelineStep(object):
         if not artifact.repeated:
             raise ValueError("artifact is not repeated: %s", artifact_name)
         artifact.count = count
+        self._on_changed()
         return self
 
+    def _on_changed(self):
+        """Invalidate the cached serialization of the pipeline using the step."""
+        if self.parent is not None:
+            self.parent._invalidate_cache()
+
     # TODO: Confirm pipeline step name restriction
     @classmethod
     def _validate_name(cls, name):
@@ -232,9 +240,9 @@ class PipelineStep(object):
             elif isinstance(input, PipelineArtifactElement) and input.artifact.parent:
                 return input.artifact.parent
 
-        input_steps = set(filter(None, [_depend_step(val) for val in values]))
-
-        self._depends = input_steps.union(self._depends)
+        input_steps = dict.fromkeys(filter(None, [_depend_step(val) for val in values]))
+        input_steps.update(self._depends)
+        self._depends = input_steps
 
     @property
     def depends(self):
@@ -247,6 +255,7 @@ class PipelineStep(object):
     @name.setter
     def name(self, value):
         self._name = value
+        self._on_changed()
 
     @classmethod
     def get_component(cls, identifier, provider, version):
@@ -264,7 +273,7 @@ class PipelineStep(object):
             )
         for step in steps:
             if step not in self._depends:
-                self._depends.add(step)
+                self._depends[step] = None
 
     @property
     def ref_name(self):
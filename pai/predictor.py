@@ -17,15 +17,34 @@ import base64
 import functools
 import json
 import posixpath
+import queue
+import socket
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from concurrent.futures import Future, ThreadPoolExecutor
 from io import IOBase
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlencode
 
 import aiohttp
+import numpy as np
 import requests
+import urllib3
 
 from .common.consts import FrameworkTypes
 from .common.docker_utils import ContainerRun
@@ -40,7 +59,7 @@ from .serializers import (
 )
 from .session import Session, get_default_session
 
-if is_package_available("openai"):
+if TYPE_CHECKING:
     from openai import OpenAI
 
 
@@ -55,6 +74,15 @@ _QUEUE_SERVICE_REQUEST_ID_HEADER = "X-Eas-Queueservice-Request-Id"
 _QUEUE_SERVICE_SINK_PATH = "sink"
 _DEFAULT_ASYNC_WORKER_COUNT = 30
 
+# Number of results fetched from the sink queue of async prediction service in a poll.
+_DEFAULT_RESULT_BATCH_SIZE = 32
+_MAX_RESULT_BATCH_SIZE = 256
+
+# Connection pool settings of the HTTP client used by the async prediction APIs.
+_DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+_DEFAULT_ASYNC_KEEPALIVE_TIMEOUT = 60
+_DEFAULT_ASYNC_DNS_CACHE_TTL = 300
+
 
 class ServiceStatus(object):
     """All EAS inference service status."""
@@ -132,13 +160,368 @@ class RawResponse(object):
         return json.loads(self.content)
 
 
-class _ServicePredictorMixin(object):
+class ServerSentEvent(object):
+    """An event of a server-sent events (text/event-stream) response."""
+
+    def __init__(
+        self,
+        data: str = "",
+        event: Optional[str] = None,
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ):
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self):
+        return "ServerSentEvent(event={}, data={!r}, id={})".format(
+            self.event, self.data, self.id
+        )
+
+    def json(self):
+        """Returns the json-decoded data of the event."""
+        return json.loads(self.data)
+
+
+class _ServerSentEventParser(object):
+    """Incremental parser of the server-sent events stream."""
+
+    def __init__(self):
+        self._buffer = b""
+        self._reset()
+
+    def _reset(self):
+        self._data: List[str] = []
+        self._event = None
+        self._id = None
+        self._retry = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Feed a chunk of the stream, and returns the completed events."""
+        lines = (self._buffer + chunk).split(b"\n")
+        self._buffer = lines.pop()
+        events = []
+        for line in lines:
+            event = self._process_line(line.rstrip(b"\r").decode("utf-8"))
+            if event:
+                events.append(event)
+        return events
+
+    def close(self) -> List[ServerSentEvent]:
+        """Flush the event at the end of the stream."""
+        events = self.feed(b"\n\n" if self._buffer else b"\n")
+        return events
+
+    def _process_line(self, line: str) -> Optional[ServerSentEvent]:
+        if not line:
+            event = None
+            if self._data:
+                event = ServerSentEvent(
+                    data="\n".join(self._data),
+                    event=self._event,
+                    id=self._id,
+                    retry=self._retry,
+                )
+            self._reset()
+            return event
+        if line.startswith(":"):
+            # Comment line, such as the keep-alive messages.
+            return None
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            self._id = value
+        elif field == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+
+def _iter_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    buffer = b""
+    for chunk in chunks:
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if buffer:
+        yield buffer.rstrip(b"\r")
+
+
+class StreamingResponse(object):
+    """Streaming response object returned by the `predictor.raw_predict` with
+    `stream=True`.
+
+    The status code and headers are available once the response headers are
+    received, and the body is read from the connection as it is consumed, so a
+    slow consumer applies backpressure to the service. The response should be
+    closed, or used as a context manager, to release the connection.
+
+    Examples::
+
+        with predictor.raw_predict(data, path="v1/completions", stream=True) as resp:
+            for event in resp.iter_events():
+                print(event.json())
+
+    """
+
+    def __init__(self, response: requests.Response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.iter_chunks()
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Iterate over the chunks of the response body as they arrive.
+
+        Args:
+            chunk_size (int, optional): The size of a chunk. By default, a chunk is
+                returned as soon as it is received from a chunked response.
+        """
+        try:
+            yield from self._response.iter_content(chunk_size=chunk_size)
+        finally:
+            self.close()
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """Iterate over the lines of the response body."""
+        return _iter_lines(self.iter_chunks())
+
+    def iter_events(self) -> Iterator[ServerSentEvent]:
+        """Iterate over the server-sent events of the response body."""
+        parser = _ServerSentEventParser()
+        for chunk in self.iter_chunks():
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def read(self) -> bytes:
+        """Read the remaining response body."""
+        return b"".join(self.iter_chunks())
+
+    def close(self):
+        """Close the response and release the connection."""
+        self._response.close()
+
+
+class AsyncStreamingResponse(object):
+    """Streaming response object returned by the `predictor.raw_predict_async` with
+    `stream=True`.
+
+    Examples::
+
+        resp = await predictor.raw_predict_async(data, stream=True)
+        async with resp:
+            async for event in resp.iter_events():
+                print(event.json())
+
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self._response = response
+        self.status_code = response.status
+        self.headers = dict(response.headers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_chunks()
+
+    async def iter_chunks(
+        self, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the chunks of the response body as they arrive.
+
+        Args:
+            chunk_size (int, optional): The maximum size of a chunk. By default, the
+                data is returned as soon as it is received.
+        """
+        try:
+            if chunk_size:
+                async for chunk in self._response.content.iter_chunked(chunk_size):
+                    yield chunk
+            else:
+                async for chunk in self._response.content.iter_any():
+                    yield chunk
+        finally:
+            self.close()
+
+    async def iter_lines(self) -> AsyncIterator[bytes]:
+        """Iterate over the lines of the response body."""
+        buffer = b""
+        async for chunk in self.iter_chunks():
+            lines = (buffer + chunk).split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if buffer:
+            yield buffer.rstrip(b"\r")
+
+    async def iter_events(self) -> AsyncIterator[ServerSentEvent]:
+        """Iterate over the server-sent events of the response body."""
+        parser = _ServerSentEventParser()
+        async for chunk in self.iter_chunks():
+            for event in parser.feed(chunk):
+                yield event
+        for event in parser.close():
+            yield event
+
+    async def read(self) -> bytes:
+        """Read the remaining response body."""
+        return b"".join([chunk async for chunk in self.iter_chunks()])
+
+    def close(self):
+        """Close the response and release the connection."""
+        self._response.release()
+
+
+class _AsyncSessionMixin(object):
+    """Manages the HTTP client shared by the async prediction calls."""
+
+    def _init_async_session(self, max_connections: int):
+        self._max_connections = max_connections
+        # HTTP client used by the async prediction APIs, which is created lazily
+        # because it is bound to the running event loop.
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
+
+    async def close_async(self):
+        """Close the HTTP client and the connection pool used by the async
+        prediction APIs.
+
+        Examples::
+
+            async with AsyncPredictor(service_name="example_service") as predictor:
+                result = await predictor.predict_async(data="YourPredictionData")
+
+        """
+        session = self._async_session
+        self._async_session, self._async_session_loop = None, None
+        if session and not session.closed:
+            await session.close()
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Returns the HTTP client shared by the async prediction calls of the
+        predictor.
+
+        The client keeps a bounded pool of keep-alive connections to the service
+        endpoint, so that requests do not pay the TCP/TLS handshake each time.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session and not self._async_session.closed:
+            if self._async_session_loop is loop:
+                return self._async_session
+            # The client is bound to an event loop that is no longer used (such as
+            # calling `asyncio.run` multiple times), the connections can not be
+            # reused in the current event loop.
+            logger.debug("Event loop changed, create a new HTTP client.")
+            self._close_stale_async_session(
+                self._async_session, self._async_session_loop
+            )
+
+        self._async_session = aiohttp.ClientSession(
+            connector=self._build_async_connector()
+        )
+        self._async_session_loop = loop
+        return self._async_session
+
+    @staticmethod
+    def _close_stale_async_session(
+        session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop
+    ):
+        """Close the HTTP client bound to an event loop other than the running one."""
+        if loop.is_running():
+            # The event loop is running in another thread, close the client in it.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        elif loop.is_closed():
+            # The connections can not be closed by the closed event loop (such as the
+            # one closed by `asyncio.run`), closing the client in the running loop
+            # releases the connector without waiting on the closed loop.
+            asyncio.ensure_future(session.close())
+        else:
+            # The connections can not be closed without running the stopped event
+            # loop, drop the client.
+            session.detach()
+
+    def _build_async_connector(self) -> aiohttp.BaseConnector:
+        return aiohttp.TCPConnector(
+            limit=self._max_connections,
+            limit_per_host=self._max_connections,
+            keepalive_timeout=_DEFAULT_ASYNC_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DEFAULT_ASYNC_DNS_CACHE_TTL,
+        )
+
+    async def _predict_many_async(
+        self,
+        predict_fn: Callable[[Any], Awaitable[Any]],
+        data: Iterable[Any],
+        concurrency: int,
+    ) -> List[Any]:
+        if concurrency < 1:
+            raise ValueError("concurrency should be a positive integer.")
+        inputs = enumerate(data)
+        results = {}
+
+        async def _worker():
+            for idx, item in inputs:
+                results[idx] = await predict_fn(item)
+
+        tasks = [asyncio.ensure_future(_worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return [results[idx] for idx in range(len(results))]
+
+    def _predict_many(
+        self,
+        predict_fn: Callable[[Any], Awaitable[Any]],
+        data: Iterable[Any],
+        concurrency: int,
+    ) -> List[Any]:
+        async def _main():
+            try:
+                return await self._predict_many_async(
+                    predict_fn, data, concurrency=concurrency
+                )
+            finally:
+                await self.close_async()
+
+        return asyncio.run(_main())
+
+
+class _ServicePredictorMixin(_AsyncSessionMixin):
     def __init__(
         self,
         service_name: str,
         session: Optional[Session] = None,
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
+        max_connections: int = _DEFAULT_ASYNC_MAX_CONNECTIONS,
     ):
         self.service_name = service_name
         self.session = session or get_default_session()
@@ -146,6 +529,7 @@ class _ServicePredictorMixin(object):
         self.endpoint_type = endpoint_type
         self.serializer = serializer or self._get_default_serializer()
         self._request_session = requests.Session()
+        self._init_async_session(max_connections)
 
     def __repr__(self):
         return "{}(service_name={}, endpoint_type={})".format(
@@ -158,6 +542,7 @@ class _ServicePredictorMixin(object):
         self._request_session.close()
 
     def refresh(self):
+        self.session.service_api.invalidate_cache()
         self._service_api_object = self.describe_service()
 
     @property
@@ -581,15 +966,14 @@ class _ServicePredictorMixin(object):
     ):
         url = self._build_url(path=path, params=params)
         headers = self._build_headers(headers)
-        async with aiohttp.ClientSession() as session:
-            return await session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                json=json,
-                **kwargs,
-            )
+        return await self._get_async_session().request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=data,
+            json=json,
+            **kwargs,
+        )
 
 
 class Predictor(PredictorBase, _ServicePredictorMixin):
@@ -610,6 +994,11 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         result = torch_predictor.predict(numpy.asarray([[22,33,44], [19,22,33]]))
         assert isinstance(result, numpy.ndarray)
 
+        # Make predictions with async API, over a shared connection pool.
+        async with Predictor(service_name="example_service") as predictor:
+            result = await predictor.predict_async(data="YourPredictionData")
+            results = await predictor.predict_many_async(inputs, concurrency=32)
+
     """
 
     def __init__(
@@ -618,6 +1007,7 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
         session: Optional[Session] = None,
+        max_connections: int = _DEFAULT_ASYNC_MAX_CONNECTIONS,
     ):
         """Construct a `Predictor` object using an existing prediction service.
 
@@ -632,12 +1022,15 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
                 response data to Python object.
             session (Session, optional): A PAI session object used for communicating
                 with PAI service.
+            max_connections (int): The maximum number of connections kept in the
+                connection pool used by the async prediction APIs (Default 100).
         """
         super(Predictor, self).__init__(
             service_name=service_name,
             session=session or get_default_session(),
             endpoint_type=endpoint_type,
             serializer=serializer,
+            max_connections=max_connections,
         )
         self._check()
 
@@ -688,8 +1081,9 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         headers: Optional[Dict[str, str]] = None,
         method: str = "POST",
         timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        stream: bool = False,
         **kwargs,
-    ) -> RawResponse:
+    ) -> Union[RawResponse, StreamingResponse]:
         """Make a prediction with the online prediction service.
 
         Args:
@@ -703,9 +1097,14 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
             method (str, optional): Request method, default to 'POST'.
             timeout(float, tuple(float, float), optional): Timeout setting for the
                 request (Default 10).
+            stream (bool): If True, returns a `StreamingResponse` once the response
+                headers are received, and the response body is read as it is
+                consumed, such as the server-sent events of LLM services
+                (Default False).
             **kwargs: Additional keyword arguments for the request.
         Returns:
-            RawResponse: Prediction response from the service.
+            RawResponse: Prediction response from the service, or a
+                `StreamingResponse` if `stream` is True.
 
         Raises:
             PredictionException: Raise if status code of the prediction response does
@@ -719,10 +1118,13 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
             path=path,
             headers=headers,
             timeout=timeout,
+            stream=stream,
             **kwargs,
         )
         if resp.status_code // 100 != 2:
             raise PredictionException(resp.status_code, resp.content)
+        if stream:
+            return StreamingResponse(resp)
 
         resp = RawResponse(
             status_code=resp.status_code,
@@ -731,6 +1133,140 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         )
         return resp
 
+    async def predict_async(self, data):
+        """Make a prediction with the online prediction service using async API.
+
+        The requests are sent using a HTTP client shared by the async prediction calls
+        of the predictor, which keeps a pool of keep-alive connections to the service.
+
+        Args:
+            data: The input data for the prediction. It will be serialized using the
+                serializer of the predictor before transmitted to the prediction
+                service.
+
+        Returns:
+            object: Prediction result.
+
+        Raises:
+            PredictionException: Raise if status code of the prediction response does
+                not equal 2xx.
+        """
+        self._post_init_serializer()
+        data = self._handle_input(data)
+        resp = await self._send_request_async(data=data)
+        content = await resp.read()
+        if resp.status // 100 != 2:
+            raise PredictionException(resp.status, content)
+        return self._handle_output(content)
+
+    async def raw_predict_async(
+        self,
+        data: Any = None,
+        path: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "POST",
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> Union[RawResponse, AsyncStreamingResponse]:
+        """Make a prediction with the online prediction service using async API.
+
+        Args:
+            data (Any): Input data to be sent to the prediction service. If it is a
+                file-like object, bytes, or string, it will be sent as the request body.
+                Otherwise, it will be treated as a JSON serializable object and sent as
+                JSON.
+            path (str, optional): Path for the request to be sent to. If it is provided,
+                it will be appended to the endpoint URL (Default None).
+            headers (dict, optional): Request headers.
+            method (str, optional): Request method, default to 'POST'.
+            timeout(float, tuple(float, float), optional): Timeout setting for the
+                request, a total timeout, or a (connect, read) tuple.
+            stream (bool): If True, returns an `AsyncStreamingResponse` once the
+                response headers are received, and the response body is read as it
+                is consumed (Default False).
+            **kwargs: Additional keyword arguments for the request.
+        Returns:
+            RawResponse: Prediction response from the service, or an
+                `AsyncStreamingResponse` if `stream` is True.
+
+        Raises:
+            PredictionException: Raise if status code of the prediction response does
+                not equal 2xx.
+        """
+        json_data, data = self._handle_raw_input(data)
+        if isinstance(timeout, tuple):
+            kwargs["timeout"] = aiohttp.ClientTimeout(
+                sock_connect=timeout[0], sock_read=timeout[1]
+            )
+        elif timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        resp = await self._send_request_async(
+            data=data,
+            json=json_data,
+            method=method,
+            path=path,
+            headers=headers,
+            **kwargs,
+        )
+        if stream and resp.status // 100 == 2:
+            return AsyncStreamingResponse(resp)
+        content = await resp.read()
+        if resp.status // 100 != 2:
+            raise PredictionException(resp.status, content)
+        return RawResponse(
+            status_code=resp.status,
+            content=content,
+            headers=dict(resp.headers),
+        )
+
+    async def predict_many_async(
+        self, data: Iterable[Any], concurrency: int = 10
+    ) -> List[Any]:
+        """Make predictions for a sequence of inputs, keeping at most `concurrency`
+        requests in flight.
+
+        Args:
+            data (Iterable[Any]): The inputs of the predictions. The iterable is
+                consumed lazily as requests complete.
+            concurrency (int): The maximum number of requests in flight (Default 10).
+                Requests are also bounded by the `max_connections` of the predictor.
+
+        Returns:
+            List[Any]: Prediction results, in the order of the inputs.
+
+        Raises:
+            PredictionException: Raise if status code of any of the prediction
+                responses does not equal 2xx, the remaining requests are cancelled.
+        """
+        return await self._predict_many_async(
+            self.predict_async, data, concurrency=concurrency
+        )
+
+    def predict_many(self, data: Iterable[Any], concurrency: int = 10) -> List[Any]:
+        """Make predictions for a sequence of inputs, keeping at most `concurrency`
+        requests in flight.
+
+        It is a blocking version of `predict_many_async`, which should not be called
+        in a running event loop, use `await predictor.predict_many_async(...)`
+        instead.
+
+        Examples::
+
+            predictor = Predictor(service_name="example_service")
+            results = predictor.predict_many(
+                [{"text": t} for t in texts], concurrency=32
+            )
+
+        Args:
+            data (Iterable[Any]): The inputs of the predictions.
+            concurrency (int): The maximum number of requests in flight (Default 10).
+
+        Returns:
+            List[Any]: Prediction results, in the order of the inputs.
+        """
+        return self._predict_many(self.predict_async, data, concurrency=concurrency)
+
     def openai(self, url_suffix: str = "v1", **kwargs) -> "OpenAI":
         """Initialize an OpenAI client from the predictor.
 
@@ -751,6 +1287,7 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
             raise ImportError(
                 "openai package is not installed, install it with `pip install openai`."
             )
+        from openai import OpenAI
 
         if url_suffix.startswith("/"):
             default_base_url = posixpath.join(self.endpoint, url_suffix[1:])
@@ -762,6 +1299,325 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         return OpenAI(base_url=base_url, api_key=api_key, **kwargs)
 
 
+class _BatchItem(object):
+    """A prediction call waiting to be merged into a batched request."""
+
+    def __init__(self, data: Any, size: int, signature: Any):
+        self.data = data
+        self.size = size
+        self.signature = signature
+        self.future = Future()
+        self.enqueued_at = time.time()
+
+
+class BatchingPredictor(PredictorBase):
+    """A predictor that merges concurrent prediction calls into batched requests.
+
+    Every call of `predict` is queued, and a background thread merges the queued
+    calls into one request to the prediction service by concatenating the inputs on
+    the batch (first) dimension. A batch is sent once it holds `max_batch_size` rows
+    or the oldest call in it has waited for `max_latency_ms`. The prediction result
+    is then split on the batch dimension and returned to each caller.
+
+    Batching is supported for predictors using `JsonSerializer`,
+    `TensorFlowSerializer` or `PyTorchSerializer`. The input of each call should
+    have a batch dimension, for example a list of rows for `JsonSerializer`, or a
+    numpy.ndarray of shape (n, ...) for `PyTorchSerializer`. Dict inputs are
+    concatenated per key, and list of tensors (the multiple inputs of
+    `PyTorchSerializer`) are concatenated per tensor.
+
+    Examples::
+
+        predictor = Predictor(service_name="example_torch_service")
+        with BatchingPredictor(predictor, max_batch_size=64, max_latency_ms=5) as p:
+            # Called concurrently from many threads, each with a single row.
+            result = p.predict(numpy.asarray([[22, 33, 44]]))
+            print(p.metrics)
+
+    """
+
+    def __init__(
+        self,
+        predictor: "Predictor",
+        max_batch_size: int = 32,
+        max_latency_ms: float = 10,
+        max_concurrent_batches: int = 4,
+    ):
+        """Construct a `BatchingPredictor` object.
+
+        Args:
+            predictor (Predictor): The predictor used to send the batched requests.
+            max_batch_size (int): The maximum number of rows in a batched request
+                (Default 32).
+            max_latency_ms (float): The maximum time in milliseconds a call waits
+                for other calls to be merged with (Default 10).
+            max_concurrent_batches (int): The maximum number of batched requests
+                in flight (Default 4).
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size should be a positive integer.")
+        serializer = predictor.serializer
+        if not isinstance(
+            serializer, (JsonSerializer, TensorFlowSerializer, PyTorchSerializer)
+        ):
+            raise ValueError(
+                "BatchingPredictor does not support the serializer:"
+                f" {type(serializer).__name__}"
+            )
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        # Sequences are inputs of multiple tensors for PyTorchSerializer, and rows of
+        # a batch for other serializers.
+        self._sequence_as_rows = not isinstance(serializer, PyTorchSerializer)
+
+        self._queue: "queue.Queue[Optional[_BatchItem]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches,
+            thread_name_prefix="pai-batching-predictor",
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._request_count = 0
+        self._batch_count = 0
+        self._row_count = 0
+        self._max_realized_batch_size = 0
+        self._last_batch_size = 0
+
+    def __repr__(self):
+        return "{}(predictor={!r}, max_batch_size={}, max_latency_ms={})".format(
+            type(self).__name__,
+            self.predictor,
+            self.max_batch_size,
+            self.max_latency_ms,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of prediction calls waiting to be batched."""
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Metrics of the batching, used for tuning `max_batch_size` and
+        `max_latency_ms`.
+
+        Returns:
+            Dict[str, Any]: A dict with the current queue depth, the number of calls,
+                batched requests and rows, and the mean, max and last realized batch
+                size in rows.
+        """
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "request_count": self._request_count,
+                "batch_count": self._batch_count,
+                "row_count": self._row_count,
+                "mean_batch_size": (
+                    self._row_count / self._batch_count if self._batch_count else 0
+                ),
+                "max_batch_size": self._max_realized_batch_size,
+                "last_batch_size": self._last_batch_size,
+            }
+
+    def predict(self, data, timeout: Optional[float] = None):
+        """Make a prediction, batched with other concurrent prediction calls.
+
+        Args:
+            data: The input data for the prediction, which should have a batch
+                dimension.
+            timeout (float, optional): The maximum time in seconds to wait for the
+                prediction result.
+
+        Returns:
+            object: Prediction result for the rows of the input data.
+
+        Raises:
+            PredictionException: Raise if status code of the batched prediction
+                response does not equal 2xx.
+        """
+        return self.submit(data).result(timeout=timeout)
+
+    def submit(self, data) -> Future:
+        """Submit a prediction call to be batched, and returns a future of the
+        prediction result."""
+        size = self._batch_size_of(data)
+        item = _BatchItem(data=data, size=size, signature=self._signature_of(data))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchingPredictor is closed.")
+            self._request_count += 1
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pai-batching-predictor",
+                    daemon=True,
+                )
+                self._thread.start()
+            # Items are queued under the lock, so that they are ahead of the stop
+            # sentinel queued by `close`.
+            self._queue.put(item)
+        return item.future
+
+    def raw_predict(self, *args, **kwargs) -> RawResponse:
+        """Make a prediction with the wrapped predictor, without batching."""
+        return self.predictor.raw_predict(*args, **kwargs)
+
+    def close(self):
+        """Send the queued prediction calls and stop the batching thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread:
+                self._queue.put(None)
+        if thread:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self):
+        pending: List[_BatchItem] = []
+        stopped = False
+        while not stopped or pending:
+            if not pending:
+                item = self._queue.get()
+                if item is None:
+                    return
+                pending.append(item)
+            # The deadline of a batch is decided by the oldest call in it.
+            deadline = pending[0].enqueued_at + self.max_latency_ms / 1000
+            rows = sum(item.size for item in pending)
+            while not stopped and rows < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.time(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                pending.append(item)
+                rows += item.size
+
+            batch, pending = self._take_batch(pending)
+            self._executor.submit(self._send_batch, batch)
+
+    def _take_batch(
+        self, items: List[_BatchItem]
+    ) -> Tuple[List[_BatchItem], List[_BatchItem]]:
+        """Take the calls of a batch, which have inputs of the same structure, from
+        the queued calls."""
+        signature = items[0].signature
+        batch, rest, rows = [], [], 0
+        for item in items:
+            if (
+                item.signature == signature
+                and (not batch or rows + item.size <= self.max_batch_size)
+                and not rest
+            ):
+                batch.append(item)
+                rows += item.size
+            else:
+                rest.append(item)
+        return batch, rest
+
+    def _send_batch(self, batch: List[_BatchItem]):
+        batch = [item for item in batch if item.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        sizes = [item.size for item in batch]
+        with self._lock:
+            self._batch_count += 1
+            self._row_count += sum(sizes)
+            self._last_batch_size = sum(sizes)
+            self._max_realized_batch_size = max(
+                self._max_realized_batch_size, self._last_batch_size
+            )
+        try:
+            if len(batch) == 1:
+                results = [self.predictor.predict(batch[0].data)]
+            else:
+                output = self.predictor.predict(
+                    self._concat([item.data for item in batch])
+                )
+                results = self._split(output, sizes)
+        except Exception as e:
+            for item in batch:
+                item.future.set_exception(e)
+        else:
+            for item, result in zip(batch, results):
+                item.future.set_result(result)
+
+    def _is_sequence(self, data) -> bool:
+        return isinstance(data, (list, tuple)) and not self._sequence_as_rows
+
+    def _signature_of(self, data):
+        if isinstance(data, dict):
+            return tuple((k, self._signature_of(v)) for k, v in sorted(data.items()))
+        elif self._is_sequence(data):
+            return tuple(self._signature_of(v) for v in data)
+        elif isinstance(data, np.ndarray):
+            return data.dtype.str, data.shape[1:]
+        return type(data).__name__
+
+    def _batch_size_of(self, data) -> int:
+        if isinstance(data, dict) or self._is_sequence(data):
+            values = list(data.values()) if isinstance(data, dict) else list(data)
+            sizes = {self._batch_size_of(v) for v in values}
+            if len(sizes) != 1:
+                raise ValueError(
+                    "Inputs should have the same non-empty batch dimension, got"
+                    f" batch sizes: {sorted(sizes)}."
+                )
+            return sizes.pop()
+        elif isinstance(data, np.ndarray) and data.ndim > 0:
+            return data.shape[0]
+        elif isinstance(data, (list, tuple)):
+            return len(data)
+        raise ValueError(
+            f"Input of type {type(data).__name__} does not have a batch dimension."
+        )
+
+    def _concat(self, values: List[Any]):
+        first = values[0]
+        if isinstance(first, dict):
+            return {k: self._concat([v[k] for v in values]) for k in first}
+        elif self._is_sequence(first):
+            return [self._concat([v[i] for v in values]) for i in range(len(first))]
+        elif isinstance(first, np.ndarray):
+            return np.concatenate(values, axis=0)
+        return [row for value in values for row in value]
+
+    def _split(self, output, sizes: List[int]) -> List[Any]:
+        if isinstance(output, dict):
+            splits = {k: self._split(v, sizes) for k, v in output.items()}
+            return [{k: v[i] for k, v in splits.items()} for i in range(len(sizes))]
+        elif self._is_sequence(output):
+            splits = [self._split(v, sizes) for v in output]
+            return [[v[i] for v in splits] for i in range(len(sizes))]
+
+        if not isinstance(output, (np.ndarray, list, tuple)) or len(output) != sum(
+            sizes
+        ):
+            raise ValueError(
+                "Prediction result can not be split on the batch dimension: expect"
+                f" {sum(sizes)} rows, got {type(output).__name__}"
+                f" {len(output) if hasattr(output, '__len__') else ''}."
+            )
+        offsets = np.cumsum(sizes)[:-1]
+        if isinstance(output, np.ndarray):
+            return np.split(output, offsets)
+        starts = [0] + offsets.tolist()
+        return [output[s : s + n] for s, n in zip(starts, sizes)]
+
+
 class WaitConfig(object):
     """WaitConfig is used to set polling configurations for waiting for asynchronous
     requests to complete."""
@@ -814,6 +1670,320 @@ class AsyncTask(object):
         return self.future.cancelled()
 
 
+class _PendingResult(object):
+    """Bookkeeping of a request waiting for its result in the sink queue."""
+
+    def __init__(self, future: Future, wait_config: WaitConfig):
+        self.future = future
+        self.interval = wait_config.interval
+        self.registered_at = time.time()
+        # Time of the next lookup of the result by the request id.
+        self.next_lookup = self.registered_at
+        self.deadline = (
+            self.registered_at + wait_config.max_attempts * wait_config.interval
+            if wait_config.max_attempts > 0
+            else None
+        )
+
+
+class _QueueResultCollector(object):
+    """Collects prediction results of the requests sent to an async prediction
+    service.
+
+    A single background thread fetches the results of all outstanding requests of a
+    predictor from the sink queue in bulk, and resolves the futures of the matching
+    requests. The number of requests sent to the queue service depends on the number
+    of polls instead of the number of outstanding requests.
+
+    The polling interval adapts to the observed queue latency: it is shortened while
+    results are flowing, and backs off exponentially (up to `WaitConfig.interval`)
+    while the queue is idle. The thread exits after it has been idle for a while,
+    and is restarted when a new request is registered.
+
+    The results are fetched from the position of the result of the first registered
+    request, which is looked up by its request id, rather than from the head of the
+    queue. The results of the requests that are still pending after `lookup_after`
+    seconds are looked up by the request ids, in case they are skipped by the
+    bulk fetch.
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Callable[[int, int, float], List[Dict[str, Any]]],
+        delete_fn: Callable[[List[int]], None],
+        lookup_fn: Callable[[str], Optional[Dict[str, Any]]],
+        batch_size: int = _DEFAULT_RESULT_BATCH_SIZE,
+        min_interval: float = 0.05,
+        idle_timeout: float = 30,
+        max_unmatched: int = 256,
+        max_errors: int = 5,
+        lookup_after: float = 10,
+    ):
+        """Initialize the collector.
+
+        Args:
+            fetch_fn (Callable): Function that fetches results from the sink queue,
+                with arguments (index, length, timeout).
+            delete_fn (Callable): Function that deletes the results by indexes from
+                the sink queue.
+            lookup_fn (Callable): Function that looks up the result of a request by
+                the request id, returns None if the result is not ready.
+            batch_size (int): The maximum number of results fetched in one poll.
+            min_interval (float): The minimum interval in seconds between polls.
+            idle_timeout (float): Seconds before the idle polling thread exits.
+            max_unmatched (int): The maximum number of recently seen results that
+                are kept for requests that are not registered yet.
+            max_errors (int): The maximum number of consecutive failed polls before
+                the pending requests are failed with the error.
+            lookup_after (float): Seconds before the result of a pending request is
+                looked up by the request id.
+        """
+        self._fetch_fn = fetch_fn
+        self._delete_fn = delete_fn
+        self._lookup_fn = lookup_fn
+        self._batch_size = batch_size
+        self._min_interval = min_interval
+        self._idle_timeout = idle_timeout
+        self._max_unmatched = max_unmatched
+        self._max_errors = max_errors
+        self._lookup_after = lookup_after
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: Dict[str, _PendingResult] = {}
+        # Results seen in the sink queue before their request is registered, which
+        # happens if the prediction completes before the request id is returned.
+        self._unmatched: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Indexes of the results matched from the unmatched results, which are
+        # deleted from the sink queue in the next poll.
+        self._unmatched_deletes: List[int] = []
+        self._thread: Optional[threading.Thread] = None
+        # Index of the next result to fetch, unknown until a result of the requests
+        # is found.
+        self._cursor: Optional[int] = None
+        self._length = batch_size
+        self._interval = min_interval
+        self._latency: Optional[float] = None
+        self._errors = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of requests waiting for the results."""
+        return len(self._pending)
+
+    def register(self, request_id: str, wait_config: WaitConfig) -> Future:
+        """Register a request and returns a future for its result.
+
+        The future resolves to the sink queue message of the result.
+        """
+        future = Future()
+        with self._lock:
+            message = self._unmatched.pop(request_id, None)
+            if message is None:
+                pending = _PendingResult(future, wait_config)
+                if self._cursor is not None:
+                    pending.next_lookup += self._lookup_after
+                self._pending[request_id] = pending
+                self._interval = self._min_interval
+            else:
+                self._unmatched_deletes.append(int(message["index"]))
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pai-queue-result-collector",
+                    daemon=True,
+                )
+                self._thread.start()
+        if message is not None:
+            future.set_result(message)
+        self._wakeup.set()
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._pending and not self._unmatched_deletes
+            if idle:
+                self._wakeup.wait(self._idle_timeout)
+                self._wakeup.clear()
+                with self._lock:
+                    if not self._pending and not self._unmatched_deletes:
+                        self._thread = None
+                        return
+
+            start = time.time()
+            try:
+                fetched, matched = self._poll()
+            except Exception as e:
+                self._on_error(e)
+                fetched, matched = 0, 0
+            else:
+                self._errors = 0
+            self._expire()
+            interval = self._next_interval(fetched, matched)
+
+            time.sleep(max(self._min_interval - (time.time() - start), 0))
+            # Wait until the next poll, or a new request is registered.
+            if self._wakeup.wait(max(interval - (time.time() - start), 0)):
+                self._wakeup.clear()
+
+    def _poll(self) -> Tuple[int, int]:
+        """Fetch a batch of results from the sink queue and resolve the futures of the
+        matching requests.
+
+        Returns:
+            Tuple[int, int]: Number of the fetched results and the matched results.
+        """
+        self._length = max(
+            self._batch_size, min(len(self._pending), _MAX_RESULT_BATCH_SIZE)
+        )
+        messages = []
+        if self._cursor is not None:
+            messages = self._fetch_fn(self._cursor, self._length, self._interval)
+        fetched = len(messages)
+        found = self._lookup()
+        matched_indexes = []
+        resolved = []
+        now = time.time()
+        with self._lock:
+            if self._cursor is None and found:
+                # Fetch from the result of the oldest request, and the results just
+                # before it, which may belong to the requests sent concurrently.
+                self._cursor = max(
+                    min(int(message["index"]) for message in found) - self._batch_size,
+                    0,
+                )
+                for pending in self._pending.values():
+                    pending.next_lookup = pending.registered_at + self._lookup_after
+            for i, message in enumerate(messages + found):
+                index = int(message["index"])
+                if i < fetched:
+                    self._cursor = max(self._cursor, index + 1)
+                elif index in matched_indexes:
+                    continue
+                request_id = message.get("tags", {}).get("requestId")
+                if not request_id:
+                    continue
+                pending = self._pending.pop(request_id, None)
+                if pending:
+                    matched_indexes.append(index)
+                    resolved.append((pending, message))
+                    latency = now - pending.registered_at
+                    self._latency = (
+                        latency
+                        if self._latency is None
+                        else 0.8 * self._latency + 0.2 * latency
+                    )
+                else:
+                    self._unmatched[request_id] = message
+                    while len(self._unmatched) > self._max_unmatched:
+                        self._unmatched.popitem(last=False)
+            delete_indexes = matched_indexes + self._unmatched_deletes
+            self._unmatched_deletes = []
+
+        try:
+            if delete_indexes:
+                self._delete_fn(delete_indexes)
+        except Exception as e:
+            logger.warning("Failed to delete prediction results: %s", e)
+        for pending, message in resolved:
+            if pending.future.set_running_or_notify_cancel():
+                pending.future.set_result(message)
+        logger.debug(
+            "Poll prediction results: index=%s fetched=%s matched=%s pending=%s",
+            self._cursor,
+            fetched,
+            len(matched_indexes),
+            len(self._pending),
+        )
+        return fetched, len(matched_indexes)
+
+    def _lookup(self) -> List[Dict[str, Any]]:
+        """Look up the results of the pending requests by the request ids.
+
+        Returns:
+            List[Dict[str, Any]]: The results found in the sink queue.
+        """
+        now = time.time()
+        with self._lock:
+            if self._cursor is None:
+                # Find the position of the results with the oldest request.
+                requests = list(self._pending.items())[:1]
+            else:
+                requests = [
+                    (request_id, pending)
+                    for request_id, pending in self._pending.items()
+                    if pending.next_lookup <= now
+                ][: self._batch_size]
+            for _, pending in requests:
+                pending.next_lookup = now + max(self._lookup_after, pending.interval)
+        messages = []
+        for request_id, _ in requests:
+            message = self._lookup_fn(request_id)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    def _on_error(self, error: Exception):
+        """Fail the pending requests if the error is not retryable, or polls keep
+        failing."""
+        self._errors += 1
+        code = getattr(error, "code", None)
+        # Client errors other than timeout and throttling, such as an invalid token,
+        # are not recovered by retrying.
+        retryable = not (
+            isinstance(code, int) and 400 <= code < 500 and code not in (408, 429)
+        )
+        if retryable and self._errors < self._max_errors:
+            logger.warning("Failed to fetch prediction results: %s", error)
+            return
+
+        logger.error("Failed to fetch prediction results: %s", error)
+        self._errors = 0
+        with self._lock:
+            failed = list(self._pending.values())
+            self._pending.clear()
+        for pending in failed:
+            if pending.future.set_running_or_notify_cancel():
+                pending.future.set_exception(error)
+
+    def _expire(self):
+        now = time.time()
+        with self._lock:
+            expired = [
+                (request_id, pending)
+                for request_id, pending in self._pending.items()
+                if pending.deadline is not None and pending.deadline < now
+            ]
+            for request_id, _ in expired:
+                del self._pending[request_id]
+        for request_id, pending in expired:
+            if pending.future.set_running_or_notify_cancel():
+                pending.future.set_exception(
+                    RuntimeError(
+                        f"Polling prediction result timeout: request_id={request_id}, "
+                        f"total_time={pending.deadline - pending.registered_at}"
+                    )
+                )
+
+    def _next_interval(self, fetched: int, matched: int) -> float:
+        with self._lock:
+            max_interval = min(
+                (p.interval for p in self._pending.values()),
+                default=self._min_interval,
+            )
+        if fetched >= self._length:
+            # More results may be waiting in the queue.
+            interval = self._min_interval
+        elif matched:
+            # Poll at a fraction of the observed latency of the queue.
+            interval = self._latency / 4
+        else:
+            interval = self._interval * 2
+        self._interval = min(max(interval, self._min_interval), max_interval)
+        return self._interval
+
+
 class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
     """A class that facilitates making predictions to asynchronous prediction service.
 
@@ -830,6 +2000,14 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         import asyncio
         result = asyncio.run(async_predictor.predict_async(data="YourPredictionData"))
 
+        # Share the connection pool between async prediction calls, and close it on
+        # exit.
+        async def main():
+            async with AsyncPredictor(service_name="example_service") as predictor:
+                return await asyncio.gather(
+                    *[predictor.predict_async(data=item) for item in items]
+                )
+
     """
 
     def __init__(
@@ -839,6 +2017,7 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
         session: Optional[Session] = None,
+        max_connections: int = _DEFAULT_ASYNC_MAX_CONNECTIONS,
     ):
         """Construct a `AsyncPredictor` object using an existing async prediction service.
 
@@ -855,6 +2034,9 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
                 response data to Python object.
             session (Session, optional): A PAI session object used for communicating
                 with PAI service.
+            max_connections (int): The maximum number of connections kept in the
+                connection pool used by `predict_async` and `raw_predict_async`
+                (Default 100).
         """
 
         super(AsyncPredictor, self).__init__(
@@ -862,6 +2044,7 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
             session=session or get_default_session(),
             endpoint_type=endpoint_type,
             serializer=serializer,
+            max_connections=max_connections,
         )
         self._max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=self._max_workers)
@@ -894,134 +2077,173 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
                 " prediction service."
             )
 
-    def _get_result(
-        self, request_id: str
-    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+    @property
+    def _result_collector(self) -> _QueueResultCollector:
+        if not hasattr(self, "_queue_result_collector"):
+            self._queue_result_collector = _QueueResultCollector(
+                fetch_fn=self._fetch_results,
+                delete_fn=self._delete_results,
+                lookup_fn=self._lookup_result,
+            )
+        return self._queue_result_collector
+
+    def _fetch_results(
+        self, index: int, length: int, timeout: float
+    ) -> List[Dict[str, Any]]:
+        """Fetch a batch of prediction results from the sink queue.
+
+        Args:
+            index (int): Index of the first result to fetch.
+            length (int): The maximum number of results to fetch.
+            timeout (float): Seconds the queue service waits for new results if there
+                is no result in the queue.
+
+        Returns:
+            List[Dict[str, Any]]: Encapsulated prediction results in the sink queue.
+        """
         resp = self._send_request(
             method="GET",
             path=_QUEUE_SERVICE_SINK_PATH,
             params={
-                "requestId": request_id,
+                "_index_": str(index),
+                "_length_": str(length),
+                "_timeout_": "{}ms".format(int(timeout * 1000)),
                 # _raw_ is false because we want to get the encapsulated prediction
                 # result in response body.
                 "_raw_": "false",
+                # Results are deleted by indexes after they are matched with the
+                # requests, results of other clients are left in the queue.
+                "_auto_delete_": "false",
             },
         )
         logger.debug(
-            "Poll prediction result: request_id=%s status_code=%s, content=%s",
-            request_id,
+            "Fetch prediction results: index=%s length=%s status_code=%s",
+            index,
+            length,
             resp.status_code,
-            resp.content,
         )
         if resp.status_code == 204:
-            # Status code 204 means could not find prediction response for the specific
-            # request id.
-            return
+            # Status code 204 means there is no prediction result in the queue.
+            return []
 
         # Raise exception if status code is not 2xx.
         if resp.status_code // 100 != 2:
-            raise RuntimeError(
-                "Pulling prediction result failed: status_code={} content={}".format(
-                    resp.status_code, resp.content.decode("utf-8")
-                )
+            raise PredictionException(
+                code=resp.status_code,
+                message="Pulling prediction result failed: status_code={} "
+                "content={}".format(resp.status_code, resp.content.decode("utf-8")),
             )
-        return self._parse_encapsulated_response(resp.json()[0])
+        return resp.json()
 
-    def _parse_encapsulated_response(self, data) -> Tuple[int, Dict[str, str], bytes]:
-        tags = data["tags"]
-        # If the status code from prediction service is not 200, a tag with
-        # key 'lastCode' will be added to the tags in response.
-        status_code = int(tags.get("lastCode", 200))
-        data = base64.b64decode(data["data"])
-        # currently, headers are not supported in async prediction service.
-        headers = dict()
-        return status_code, headers, data
+    def _lookup_result(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Look up the prediction result of a request from the sink queue.
 
-    async def _get_result_async(
-        self, request_id: str
-    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
-        resp = await self._send_request_async(
+        Args:
+            request_id (str): Request id of the prediction request.
+
+        Returns:
+            Dict[str, Any]: Encapsulated prediction result in the sink queue, or None
+                if the result is not ready.
+        """
+        resp = self._send_request(
             method="GET",
             path=_QUEUE_SERVICE_SINK_PATH,
             params={
                 "requestId": request_id,
-                # _raw_ is false because we want to get the encapsulated prediction
-                # result in response body.
                 "_raw_": "false",
+                "_auto_delete_": "false",
             },
         )
-        status_code = resp.status
-        content = await resp.read()
         logger.debug(
-            "Get prediction result: request_id=%s status_code=%s, content=%s",
+            "Look up prediction result: request_id=%s status_code=%s",
             request_id,
-            status_code,
-            content,
+            resp.status_code,
         )
-        if status_code == 204:
-            # Status code 204 means could not find prediction response for the specific
-            # request id.
+        if resp.status_code == 204:
+            # Status code 204 means the prediction result of the request is not ready.
             return
-        if status_code // 100 != 2:
-            raise RuntimeError(
-                "Pulling prediction result failed: status_code={} content={}".format(
-                    status_code, content.decode("utf-8")
-                )
+
+        if resp.status_code // 100 != 2:
+            raise PredictionException(
+                code=resp.status_code,
+                message="Pulling prediction result failed: status_code={} "
+                "content={}".format(resp.status_code, resp.content.decode("utf-8")),
             )
-        data = (await resp.json())[0]
-        return self._parse_encapsulated_response(data)
-
-    def _poll_result(
-        self, request_id: str, wait_config: WaitConfig
-    ) -> Tuple[int, Dict[str, str], bytes]:
-        # if max_attempts is negative or zero, then wait forever
-        attempts = -1 if wait_config.max_attempts <= 0 else wait_config.max_attempts
-        while attempts != 0:
-            attempts -= 1
-            result = self._get_result(request_id=request_id)
-            if not result:
-                time.sleep(wait_config.interval)
-                continue
-            status_code, headers, content = result
-            # check real prediction response
-            if status_code // 100 != 2:
-                raise PredictionException(
-                    code=status_code,
-                    message=f"Prediction failed: status_code={status_code}"
-                    f" content={content.decode()}",
-                )
-            return status_code, headers, content
+        messages = resp.json()
+        return messages[0] if messages else None
 
-        # Polling prediction result timeout.
-        raise RuntimeError(
-            f"Polling prediction result timeout: request_id={request_id}, "
-            f"total_time={wait_config.max_attempts * wait_config.interval}"
+    def _delete_results(self, indexes: List[int]):
+        """Delete the prediction results from the sink queue by indexes."""
+        resp = self._send_request(
+            method="DELETE",
+            path=_QUEUE_SERVICE_SINK_PATH,
+            params={"_indexes_": ",".join(str(index) for index in indexes)},
         )
+        if resp.status_code // 100 != 2:
+            logger.warning(
+                "Failed to delete prediction results: status_code=%s content=%s",
+                resp.status_code,
+                resp.content,
+            )
 
-    async def _poll_result_async(
-        self, request_id, wait_config: WaitConfig
-    ) -> Tuple[int, Dict[str, str], bytes]:
-        # if max_attempts is negative or zero, then wait forever
-        attempts = -1 if wait_config.max_attempts <= 0 else wait_config.max_attempts
-        while attempts != 0:
-            attempts -= 1
-            result = await self._get_result_async(request_id)
-            if not result:
-                await asyncio.sleep(wait_config.interval)
-                continue
-            status_code, headers, content = result
-            # check real prediction response
-            if status_code // 100 != 2:
-                raise PredictionException(
-                    f"Prediction failed: status_code={status_code} content={content.decode()}"
-                )
-            return status_code, headers, content
+    def _parse_encapsulated_response(self, data) -> Tuple[int, Dict[str, str], bytes]:
+        tags = data["tags"]
+        # If the status code from prediction service is not 200, a tag with
+        # key 'lastCode' will be added to the tags in response.
+        status_code = int(tags.get("lastCode", 200))
+        data = base64.b64decode(data["data"])
+        # currently, headers are not supported in async prediction service.
+        headers = dict()
+        return status_code, headers, data
 
-        # Polling prediction result timeout.
-        raise RuntimeError(
-            f"Polling prediction result timeout: request_id={request_id}, "
-            f"total_time={wait_config.max_attempts * wait_config.interval}"
-        )
+    def _handle_result(self, data) -> Tuple[int, Dict[str, str], bytes]:
+        status_code, headers, content = self._parse_encapsulated_response(data)
+        # check real prediction response
+        if status_code // 100 != 2:
+            raise PredictionException(
+                code=status_code,
+                message=f"Prediction failed: status_code={status_code}"
+                f" content={content.decode()}",
+            )
+        return status_code, headers, content
+
+    def _wait_result(
+        self,
+        request_future: Future,
+        wait_config: WaitConfig,
+        output_fn: Callable[[int, Dict[str, str], bytes], Any],
+    ) -> Future:
+        """Returns a future of the prediction result of the request.
+
+        Args:
+            request_future (Future): Future of the request id, returned by sending the
+                prediction request.
+            wait_config (WaitConfig): A config object that controls the behavior of
+                polling the prediction result.
+            output_fn (Callable): Function that transforms the prediction result.
+        """
+        future = Future()
+
+        def _on_result(result_future: Future):
+            try:
+                result = output_fn(*self._handle_result(result_future.result()))
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        def _on_sent(f: Future):
+            if not future.set_running_or_notify_cancel():
+                return
+            if f.exception():
+                future.set_exception(f.exception())
+                return
+            self._result_collector.register(
+                f.result(), wait_config=wait_config
+            ).add_done_callback(_on_result)
+
+        request_future.add_done_callback(_on_sent)
+        return future
 
     def _get_request_id(self, resp: requests.models.Response) -> str:
         if resp.status_code // 100 != 2:
@@ -1068,19 +2290,18 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
     def _predict_fn(
         self,
         data,
-    ):
-        """Make a prediction with the async prediction service."""
+    ) -> str:
+        """Send a prediction request to the async prediction service.
+
+        Returns:
+            str: Request id of the prediction request.
+        """
         # serialize input data
         data = self._handle_input(data)
         resp = self._send_request(data=data)
         request_id = self._get_request_id(resp)
-        logger.debug("Async prediction RequestId: ", request_id)
-        # poll prediction result
-        status, headers, content = self._poll_result(
-            request_id=request_id, wait_config=WaitConfig()
-        )
-
-        return self._handle_output(content)
+        logger.debug("Async prediction RequestId: %s", request_id)
+        return request_id
 
     def _wrap_callback_fn(self, cb: Callable):
         """Wrap the callback function to handle the prediction result."""
@@ -1114,7 +2335,13 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
                 result.
         """
         self._post_init_serializer()
-        future = self.executor.submit(self._predict_fn, data)
+        # The worker threads only send the requests, the prediction results are
+        # collected in bulk by the result collector of the predictor.
+        future = self._wait_result(
+            self.executor.submit(self._predict_fn, data),
+            wait_config=WaitConfig(),
+            output_fn=lambda status, headers, content: self._handle_output(content),
+        )
 
         if isinstance(callback, Callable):
             callback = [callback]
@@ -1150,9 +2377,10 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         resp = await self._send_request_async(data=data)
         request_id = await self._get_request_id_async(resp)
 
-        status_code, headers, content = await self._poll_result_async(
-            request_id=request_id, wait_config=wait_config
+        result = await asyncio.wrap_future(
+            self._result_collector.register(request_id, wait_config=wait_config)
         )
+        status_code, headers, content = self._handle_result(result)
         return self._handle_output(content)
 
     def _raw_predict_fn(self, data, method, path, headers, **kwargs):
@@ -1165,11 +2393,7 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
             method=method,
             **kwargs,
         )
-        request_id = self._get_request_id(resp)
-        status, headers, content = self._poll_result(
-            request_id, wait_config=WaitConfig()
-        )
-        return RawResponse(status, headers, content)
+        return self._get_request_id(resp)
 
     def raw_predict(
         self,
@@ -1208,8 +2432,12 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
 
         """
 
-        future = self.executor.submit(
-            self._raw_predict_fn, data, method, path, headers, **kwargs
+        future = self._wait_result(
+            self.executor.submit(
+                self._raw_predict_fn, data, method, path, headers, **kwargs
+            ),
+            wait_config=WaitConfig(),
+            output_fn=self._handle_raw_output,
         )
         cbs = [callback] if isinstance(callback, Callable) else callback
         if cbs:
@@ -1258,21 +2486,82 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
             **kwargs,
         )
         request_id = await self._get_request_id_async(resp)
-        # Polling the prediction result.
-        status_code, headers, content = await self._poll_result_async(
-            request_id=request_id, wait_config=wait_config
+        # Wait for the prediction result collected from the sink queue.
+        result = await asyncio.wrap_future(
+            self._result_collector.register(request_id, wait_config=wait_config)
         )
+        status_code, headers, content = self._handle_result(result)
         return self._handle_raw_output(status_code, headers, content)
 
 
-class LocalPredictor(PredictorBase):
-    """Perform prediction to a local service running with docker."""
+class _UnixHTTPConnection(urllib3.connection.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, *args, socket_path: str, **kwargs):
+        self.socket_path = socket_path
+        super(_UnixHTTPConnection, self).__init__(*args, **kwargs)
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+
+class _UnixHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+    def __init__(self, socket_path: str, maxsize: int):
+        super(_UnixHTTPConnectionPool, self).__init__(
+            "localhost", maxsize=maxsize, socket_path=socket_path
+        )
+
+
+class _UnixSocketAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter that sends the HTTP requests over a Unix domain socket,
+    regardless of the host of the URL."""
+
+    def __init__(self, socket_path: str, pool_maxsize: int):
+        super(_UnixSocketAdapter, self).__init__(pool_maxsize=pool_maxsize)
+        self._pool = _UnixHTTPConnectionPool(socket_path, maxsize=pool_maxsize)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def close(self):
+        super(_UnixSocketAdapter, self).close()
+        self._pool.close()
+
+
+class LocalPredictor(PredictorBase, _AsyncSessionMixin):
+    """Perform prediction to a local service running with docker.
+
+    The predictor keeps a pool of keep-alive connections to the local service, and
+    could send the requests over a Unix domain socket if the service listens on
+    one, so that the overhead of the client is small when benchmarking the service.
+
+    Examples::
+
+        predictor = LocalPredictor(port=8000)
+        result = predictor.predict(data)
+        results = predictor.predict_many(inputs, concurrency=32)
+
+        # Send the requests over the Unix domain socket exposed by the container.
+        predictor = LocalPredictor(port=8000, unix_socket="/tmp/model/server.sock")
+
+    """
 
     def __init__(
         self,
         port: int,
         container_id: Optional[str] = None,
         serializer: Optional[SerializerBase] = None,
+        max_connections: int = _DEFAULT_ASYNC_MAX_CONNECTIONS,
+        unix_socket: Optional[str] = None,
     ):
         """LocalPredictor initializer.
 
@@ -1280,15 +2569,33 @@ class LocalPredictor(PredictorBase):
             port (int): The port of the local service.
             container_id (str, optional): The container id of the local service.
             serializer (SerializerBase, optional): A serializer object that transforms.
+            max_connections (int): The maximum number of connections kept in the
+                connection pools of the predictor (Default 100).
+            unix_socket (str, optional): Path of a Unix domain socket on the host
+                that the local service listens on. If it is provided, the requests
+                are sent over the socket instead of the TCP port.
         """
         self.container_id = container_id
         self.port = port
         self.serializer = serializer or JsonSerializer()
+        self.unix_socket = unix_socket
         self._container_run = (
             self._build_container_run(container_id, port=port)
             if self.container_id
             else None
         )
+        self._request_session = requests.Session()
+        if unix_socket:
+            adapter = _UnixSocketAdapter(unix_socket, pool_maxsize=max_connections)
+        else:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=max_connections
+            )
+        self._request_session.mount("http://", adapter)
+        self._init_async_session(max_connections)
+
+    def __del__(self):
+        self._request_session.close()
 
     @classmethod
     def _build_container_run(cls, container_id, port):
@@ -1301,6 +2608,15 @@ class LocalPredictor(PredictorBase):
 
         return ContainerRun(container=container, port=port)
 
+    def _build_async_connector(self) -> aiohttp.BaseConnector:
+        if self.unix_socket:
+            return aiohttp.UnixConnector(
+                path=self.unix_socket,
+                limit=self._max_connections,
+                keepalive_timeout=_DEFAULT_ASYNC_KEEPALIVE_TIMEOUT,
+            )
+        return super(LocalPredictor, self)._build_async_connector()
+
     def predict(self, data) -> Any:
         """Perform prediction with the given data.
 
@@ -1308,8 +2624,8 @@ class LocalPredictor(PredictorBase):
             data: The data to be predicted.
         """
         request_data = self.serializer.serialize(data=data)
-        response = requests.post(
-            url="http://127.0.0.1:{port}/".format(port=self._container_run.port),
+        response = self._request_session.post(
+            url=self._build_url(),
             data=request_data,
         )
 
@@ -1321,6 +2637,56 @@ class LocalPredictor(PredictorBase):
 
         return self.serializer.deserialize(response.content)
 
+    async def predict_async(self, data) -> Any:
+        """Perform prediction with the given data using async API.
+
+        Args:
+            data: The data to be predicted.
+        """
+        request_data = self.serializer.serialize(data=data)
+        resp = await self._get_async_session().post(
+            url=self._build_url(),
+            data=request_data,
+            headers=self._build_headers(),
+        )
+        content = await resp.read()
+        if resp.status // 100 != 2:
+            raise PredictionException(code=resp.status, message=content)
+        return self.serializer.deserialize(content)
+
+    async def predict_many_async(
+        self, data: Iterable[Any], concurrency: int = 10
+    ) -> List[Any]:
+        """Make predictions for a sequence of inputs, keeping at most `concurrency`
+        requests in flight.
+
+        Args:
+            data (Iterable[Any]): The inputs of the predictions.
+            concurrency (int): The maximum number of requests in flight (Default 10).
+
+        Returns:
+            List[Any]: Prediction results, in the order of the inputs.
+        """
+        return await self._predict_many_async(
+            self.predict_async, data, concurrency=concurrency
+        )
+
+    def predict_many(self, data: Iterable[Any], concurrency: int = 10) -> List[Any]:
+        """Make predictions for a sequence of inputs, keeping at most `concurrency`
+        requests in flight.
+
+        It is a blocking version of `predict_many_async`, which should not be called
+        in a running event loop.
+
+        Args:
+            data (Iterable[Any]): The inputs of the predictions.
+            concurrency (int): The maximum number of requests in flight (Default 10).
+
+        Returns:
+            List[Any]: Prediction results, in the order of the inputs.
+        """
+        return self._predict_many(self.predict_async, data, concurrency=concurrency)
+
     def _build_headers(
         self, headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, str]:
@@ -1375,7 +2741,7 @@ class LocalPredictor(PredictorBase):
             json_data, data = data, None
         header = self._build_headers(headers=headers)
         url = self._build_url(path)
-        resp = requests.request(
+        resp = self._request_session.request(
             url=url,
             json=json_data,
             data=data,
@@ -1424,9 +2790,7 @@ class LocalPredictor(PredictorBase):
                     )
 
                 # Make a HEAD request to the server, just test for connection.
-                requests.head(
-                    f"http://127.0.0.1:{container_run.port}/",
-                )
+                self._request_session.head(self._build_url())
                 break
             except requests.ConnectionError:
                 # ConnectionError means server is not ready.
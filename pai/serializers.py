@@ -25,11 +25,23 @@ import six
 from eas_prediction import pytorch_predict_pb2 as pt_pb
 from eas_prediction import tf_request_pb2 as tf_pb
 
+from .common import proto_utils
 from .common.logging import get_logger
 from .session import Session, get_default_session
 
 logger = get_logger(__name__)
 
+# Field number of `PredictRequest.inputs` and `PredictResponse.outputs` in TensorFlow
+# processor protocol.
+_TF_REQUEST_INPUTS_FIELD = 2
+_TF_RESPONSE_OUTPUTS_FIELD = 1
+
+# Field numbers of the inputs/outputs in PyTorch processor protocol.
+_PT_REQUEST_INPUTS_FIELD = 1
+_PT_REQUEST_MAP_INPUTS_FIELD = 3
+_PT_RESPONSE_OUTPUTS_FIELD = 1
+_PT_RESPONSE_MAP_OUTPUTS_FIELD = 2
+
 
 def _is_pil_image(data) -> bool:
     try:
@@ -261,6 +273,9 @@ class TensorFlowSerializer(SerializerBase):
             for output_name in self._output_filter:
                 request.output_filter.append(output_name)
 
+        # The inputs are encoded directly from the array buffers and appended to the
+        # serialized request, the protobuf parser merges them into `inputs` map.
+        parts = [request.SerializeToString()]
         if not isinstance(data, dict):
             if not self._input_specs or len(self._input_specs) > 1:
                 raise ValueError(
@@ -285,12 +300,12 @@ class TensorFlowSerializer(SerializerBase):
                     if input_spec and input_spec.data_type is not None
                     else self._np_dtype_to_tf_dtype(value.dtype.type)
                 )
-                self._put_value(
-                    request=request,
-                    name=input_spec.name,
-                    data_type=data_type,
-                    shape=value.shape,
-                    data=np.ravel(value).tolist(),
+                parts.extend(
+                    self._put_value(
+                        name=input_spec.name,
+                        data_type=data_type,
+                        value=value,
+                    )
                 )
         else:
             input_specs_dict = (
@@ -314,15 +329,15 @@ class TensorFlowSerializer(SerializerBase):
                     and len([dim for dim in input_spec.shape if dim == -1]) == 1
                 ):
                     value = value.reshape(input_spec.shape)
-                self._put_value(
-                    request=request,
-                    name=input_spec.name,
-                    data_type=data_type,
-                    shape=value.shape,
-                    data=np.ravel(value).tolist(),
+                parts.extend(
+                    self._put_value(
+                        name=name,
+                        data_type=data_type,
+                        value=value,
+                    )
                 )
 
-        return request.SerializeToString()
+        return b"".join(parts)
 
     def _init_from_signature_def(self, signature_def):
         """Build TensorFlowSerializer from signature def.
@@ -365,19 +380,17 @@ class TensorFlowSerializer(SerializerBase):
             self._output_filter = [spec.name for spec in output_specs]
 
     def deserialize(self, data: bytes):
-        response = tf_pb.PredictResponse()
-        response.ParseFromString(data)
-        output_names = response.outputs.keys()
         results = {}
-        for name in output_names:
-            results[name] = self._get_value(
-                response=response,
-                name=name,
-            )
+        for name, output in proto_utils.iter_map_entries(
+            data, field_number=_TF_RESPONSE_OUTPUTS_FIELD
+        ):
+            results[name] = self._get_value(output)
         return results
 
     def _np_dtype_to_tf_dtype(self, np_dtype):
         rev_map = {value: key for key, value in self.NUMPY_DATA_TYPE_MAPPING.items()}
+        # Bytes array, such as encoded images, are sent as DT_STRING.
+        rev_map[np.bytes_] = "DT_STRING"
         if np_dtype not in rev_map:
             raise ValueError(
                 f"Numpy dtype {np_dtype} is not supported in TensorFlowSerializer."
@@ -393,66 +406,46 @@ class TensorFlowSerializer(SerializerBase):
             )
         return self.NUMPY_DATA_TYPE_MAPPING.get(data_type_name)
 
-    def _put_value(
-        self, request: tf_pb.PredictRequest, name: str, data_type, shape, data
-    ):
-        request.inputs[name].dtype = data_type
-        request.inputs[name].array_shape.dim.extend(shape)
-
-        integer_types = [
-            tf_pb.DT_INT8,
-            tf_pb.DT_INT16,
-            tf_pb.DT_INT32,
-            tf_pb.DT_UINT8,
-            tf_pb.DT_UINT16,
-            tf_pb.DT_QINT8,
-            tf_pb.DT_QINT16,
-            tf_pb.DT_QINT32,
-            tf_pb.DT_QUINT8,
-            tf_pb.DT_QUINT16,
-        ]
-        if data_type == tf_pb.DT_FLOAT:
-            request.inputs[name].float_val.extend(data)
-        elif data_type == tf_pb.DT_DOUBLE:
-            request.inputs[name].double_val.extend(data)
-        elif data_type in integer_types:
-            request.inputs[name].int_val.extend(data)
-        elif data_type == tf_pb.DT_INT64:
-            request.inputs[name].int64_val.extend(data)
-        elif data_type == tf_pb.DT_BOOL:
-            request.inputs[name].bool_val.extend(data)
-        elif data_type == tf_pb.DT_STRING:
-            request.inputs[name].string_val.extend(data)
-        else:
+    def _put_value(self, name: str, data_type, value: np.ndarray) -> List:
+        """Encode the input value as an entry of `PredictRequest.inputs`.
+
+        Numeric values are written from the contiguous buffer of the array into packed
+        repeated fields, without converting each element to a Python object.
+
+        Returns:
+            List: Parts of the serialized `inputs` map entry.
+        """
+        try:
+            proto_utils.value_field_for_data_type(data_type)
+        except ValueError:
             raise ValueError(
                 f"Not supported input data type for TensorFlow PredictRequest: {data_type}"
             )
+        return proto_utils.encode_map_entry(
+            _TF_REQUEST_INPUTS_FIELD,
+            key=name,
+            value_parts=proto_utils.encode_array_proto(
+                data_type=data_type, shape=value.shape, value=value
+            ),
+        )
 
-    def _get_value(self, response: tf_pb.PredictResponse, name):
-        output = response.outputs[name]
+    def _get_value(self, output: bytes):
+        """Decode a serialized ArrayProto in the prediction response.
 
-        if (
-            name not in response.outputs
-            or tf_pb.DT_INVALID == response.outputs[name].dtype
-        ):
+        Float and double values are returned as read-only views on the response
+        buffer, use `numpy.ndarray.copy` to get a writable array.
+        """
+        data_type, shape, values = proto_utils.decode_array_proto(output)
+        if data_type == tf_pb.DT_INVALID:
             return
-        np_dtype = self._tf_dtype_to_np_dtype(response.outputs[name].dtype)
-        shape = list(output.array_shape.dim)
-
-        if output.dtype == tf_pb.DT_FLOAT:
-            return np.asarray(output.float_val, np_dtype).reshape(shape)
-        elif output.dtype in (tf_pb.DT_INT8, tf_pb.DT_INT16, tf_pb.DT_INT32):
-            return np.asarray(output.int_val, np_dtype).reshape(shape)
-        elif output.dtype == tf_pb.DT_INT64:
-            return np.asarray(output.int64_val, np_dtype).reshape(shape)
-        elif output.dtype == tf_pb.DT_DOUBLE:
-            return np.asarray(output.double_val, np_dtype).reshape(shape)
-        elif output.dtype == tf_pb.DT_STRING:
-            return np.asarray(output.string_val, np_dtype).reshape(shape)
-        elif output.dtype == tf_pb.DT_BOOL:
-            return np.asarray(output.bool_val, np_dtype).reshape(shape)
-        else:
-            raise ValueError(f"Not support data_type: {output.dtype}")
+        np_dtype = self._tf_dtype_to_np_dtype(data_type)
+        if data_type == tf_pb.DT_STRING:
+            try:
+                values = [v.decode("utf-8") for v in values]
+            except UnicodeDecodeError:
+                # Binary string values, such as encoded images.
+                np_dtype = np.object_
+        return np.asarray(values, np_dtype).reshape(shape)
 
 
 class PyTorchSerializer(SerializerBase):
@@ -496,8 +489,30 @@ class PyTorchSerializer(SerializerBase):
             )
         return self.NUMPY_DATA_TYPE_MAPPING.get(data_type_name)
 
-    def serialize(self, data: Union[np.ndarray, List, Tuple]) -> bytes:
+    def serialize(
+        self, data: Union[np.ndarray, List, Tuple, Dict[str, Any], pt_pb.PredictRequest]
+    ) -> bytes:
+        """Serialize the input data to a PyTorch processor PredictRequest.
+
+        Args:
+            data: Input data of the prediction. A numpy array (or a PIL image, bytes,
+                str) is sent as the single input of the request. A list or tuple is
+                sent as multiple inputs, with each item as the input at its index. A
+                dictionary is sent as named inputs (`map_inputs`).
+
+        Returns:
+            bytes: Serialized PredictRequest.
+        """
+        if isinstance(data, pt_pb.PredictRequest):
+            return data.SerializeToString()
+
         request = pt_pb.PredictRequest()
+        if self._output_filter:
+            request.output_filter.extend(self._output_filter)
+        # The inputs are encoded directly from the array buffers and appended to the
+        # serialized request, the protobuf parser merges them into the request.
+        parts = [request.SerializeToString()]
+
         if _is_pil_image(data):
             data = np.asarray(data)
         elif isinstance(data, (bytes, str)):
@@ -506,89 +521,88 @@ class PyTorchSerializer(SerializerBase):
         if isinstance(data, np.ndarray):
             # if input data type is np.ndarray, we assume there is only one input data
             # for the prediction request.
-            self._put_value(
-                request,
-                index=0,
-                shape=data.shape,
-                data_type=self._np_dtype_to_torch_dtype(data.dtype.type),
-                data=np.ravel(data).tolist(),
-            )
+            parts.extend(self._put_value(value=data))
         elif isinstance(data, (List, Tuple)):
-            # if input data type is List or Tuple, we assume there is multi input data.
-            # for the prediction request.
-            for idx, item in enumerate(data):
-                if not isinstance(item, np.ndarray):
-                    item = np.asarray(item)
-                if not item:
-                    continue
-                self._put_value(
-                    request,
-                    index=0,
-                    shape=item.shape,
-                    data_type=self._np_dtype_to_torch_dtype(item.dtype.type),
-                    data=np.ravel(item).tolist(),
-                )
+            # if input data type is List or Tuple, we assume there is multi input data
+            # for the prediction request, each item is the input at its index.
+            for item in data:
+                parts.extend(self._put_value(value=np.asarray(item)))
+        elif isinstance(data, dict):
+            for name, item in data.items():
+                parts.extend(self._put_value(value=np.asarray(item), name=name))
         else:
             raise ValueError(
-                "PyTorchSerializer accept List, Tuple as input request data."
+                "PyTorchSerializer accept np.ndarray, List, Tuple or Dict as input"
+                " request data."
             )
-        return request.SerializeToString()
+        return b"".join(parts)
 
     def deserialize(self, data: bytes):
-        resp = pt_pb.PredictResponse()
-        resp.ParseFromString(data)
-        if len(resp.outputs) > 1:
-            results = []
-            for idx in range(resp.outputs):
-                results.append(self._get_value(resp, idx))
-            return results
-        elif len(resp.outputs) == 1:
-            return self._get_value(resp, index=0)
-
-    def _put_value(
-        self, request: pt_pb.PredictRequest, index: int, shape, data_type, data
-    ):
-        while len(request.inputs) < index + 1:
-            request.inputs.add()
-        request.inputs[index].dtype = data_type
-        request.inputs[index].array_shape.dim.extend(shape)
-        if data_type == pt_pb.DT_FLOAT:
-            request.inputs[index].float_val.extend(data)
-        elif data_type == pt_pb.DT_DOUBLE:
-            request.inputs[index].double_val.extend(data)
-        elif data_type in (
-            pt_pb.DT_INT8,
-            pt_pb.DT_INT16,
-            pt_pb.DT_INT32,
-            pt_pb.DT_UINT8,
+        """Deserialize the PyTorch processor PredictResponse.
+
+        Returns:
+            The output array if the model has a single output, a list of arrays if the
+            model has multiple outputs, or a dictionary of arrays if the model returns
+            named outputs (`map_outputs`).
+        """
+        outputs = []
+        map_outputs = {}
+        for field_number, _, value in proto_utils.iter_fields(data):
+            if field_number == _PT_RESPONSE_OUTPUTS_FIELD:
+                outputs.append(self._get_value(value))
+        for name, value in proto_utils.iter_map_entries(
+            data, field_number=_PT_RESPONSE_MAP_OUTPUTS_FIELD
         ):
-            request.inputs[index].int_val.extend(data)
-        elif data_type == pt_pb.DT_INT64:
-            request.inputs[index].int64_val.extend(data)
-        else:
-            raise ValueError(f"Not supported PyTorch request data type: {data_type}")
+            map_outputs[name] = self._get_value(value)
 
-    def _get_value(self, response: pt_pb.PredictResponse, index: int):
-        output = response.outputs[index]
-        if output.dtype == pt_pb.DT_INVALID:
-            return
+        if len(outputs) > 1:
+            return outputs
+        elif len(outputs) == 1:
+            return outputs[0]
+        elif map_outputs:
+            return map_outputs
+
+    def _put_value(self, value: np.ndarray, name: Optional[str] = None) -> List:
+        """Encode the input value as an item of `PredictRequest.inputs`, or an entry
+        of `PredictRequest.map_inputs` if name is given.
 
-        np_dtype = self._torch_dtype_to_numpy_dtype(output.dtype)
-        shape = list(output.array_shape.dim)
-        if output.dtype == pt_pb.DT_FLOAT:
-            return np.asarray(output.float_val, np_dtype).reshape(shape)
-        elif output.dtype in (
+        Returns:
+            List: Parts of the serialized input field.
+        """
+        data_type = self._np_dtype_to_torch_dtype(value.dtype.type)
+        if data_type not in (
+            pt_pb.DT_FLOAT,
+            pt_pb.DT_DOUBLE,
             pt_pb.DT_INT8,
             pt_pb.DT_INT16,
             pt_pb.DT_INT32,
             pt_pb.DT_UINT8,
+            pt_pb.DT_INT64,
         ):
-            return np.asarray(output.int_val, np_dtype).reshape(shape)
-        elif output.dtype == pt_pb.DT_INT64:
-            return np.asarray(output.int64_val, np_dtype).reshape(shape)
-        elif output.dtype == pt_pb.DT_DOUBLE:
-            return np.asarray(output.double_val, np_dtype).reshape(shape)
-        else:
-            raise ValueError(
-                f"Not supported PyTorch response data type: {output.dtype}"
+            raise ValueError(f"Not supported PyTorch request data type: {data_type}")
+
+        array_parts = proto_utils.encode_array_proto(
+            data_type=data_type, shape=value.shape, value=value
+        )
+        if name is None:
+            return proto_utils.encode_length_delimited(
+                _PT_REQUEST_INPUTS_FIELD, array_parts
             )
+        return proto_utils.encode_map_entry(
+            _PT_REQUEST_MAP_INPUTS_FIELD, key=name, value_parts=array_parts
+        )
+
+    def _get_value(self, output: bytes):
+        """Decode a serialized ArrayProto in the prediction response.
+
+        Float and double values are returned as read-only views on the response
+        buffer, use `numpy.ndarray.copy` to get a writable array.
+        """
+        data_type, shape, values = proto_utils.decode_array_proto(output)
+        if data_type == pt_pb.DT_INVALID:
+            return
+
+        if data_type == pt_pb.DT_STRING:
+            raise ValueError(f"Not supported PyTorch response data type: {data_type}")
+        np_dtype = self._torch_dtype_to_numpy_dtype(data_type)
+        return np.asarray(values, np_dtype).reshape(shape)
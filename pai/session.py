@@ -17,6 +17,7 @@ from __future__ import absolute_import
 import json
 import os.path
 import posixpath
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional, Tuple, Union
 
@@ -30,12 +31,11 @@ from Tea.exceptions import TeaException
 from .api.api_container import ResourceAPIsContainerMixin
 from .api.base import ServiceName
 from .api.client_factory import ClientFactory
-from .api.workspace import WorkspaceAPI, WorkspaceConfigKeys
-from .common.consts import DEFAULT_CONFIG_PATH, PAI_VPC_ENDPOINT, Network
+from .common.consts import DEFAULT_CONFIG_PATH, Network
 from .common.logging import get_logger
+from .common.network_utils import get_default_oss_endpoint, is_vpc_network
 from .common.oss_utils import CredentialProviderWrapper, OssUriObj
-from .common.utils import is_domain_connectable, make_list_resource_iterator
-from .libs.alibabacloud_pai_dsw20220101.models import GetInstanceRequest
+from .common.utils import make_list_resource_iterator
 
 logger = get_logger(__name__)
 
@@ -189,14 +189,7 @@ def _init_default_session_from_env() -> Optional["Session"]:
     workspace_id = os.getenv("PAI_AI_WORKSPACE_ID")
     workspace_id = os.getenv("PAI_WORKSPACE_ID", workspace_id)
 
-    network = (
-        Network.VPC
-        if is_domain_connectable(
-            PAI_VPC_ENDPOINT.format(region_id),
-            timeout=1,
-        )
-        else Network.PUBLIC
-    )
+    network = Network.VPC if is_vpc_network(region_id) else Network.PUBLIC
 
     if dsw_instance_id and not workspace_id:
         logger.debug("Getting workspace id by dsw instance id: %s", dsw_instance_id)
@@ -290,6 +283,12 @@ class Session(ResourceAPIsContainerMixin):
         self._workspace_id = str(workspace_id)
         self._oss_bucket_name = oss_bucket_name
         self._oss_endpoint = oss_endpoint
+        # OSS buckets are cached by (bucket_name, endpoint), and share the
+        # credentials and the HTTP connection pool of the session.
+        self._oss_buckets: Dict[Tuple[str, str], oss2.Bucket] = {}
+        self._oss_auth = None
+        self._oss_http_session = None
+        self._oss_lock = threading.Lock()
 
         header = kwargs.pop("header", None)
         network = kwargs.pop("network", None)
@@ -370,24 +369,22 @@ class Session(ResourceAPIsContainerMixin):
             self._oss_endpoint = self._get_default_oss_endpoint()
 
     def _get_oss_auth(self):
-        auth = oss2.ProviderAuth(
-            credentials_provider=CredentialProviderWrapper(
-                config=self._credential_config,
+        if self._oss_auth is None:
+            self._oss_auth = oss2.ProviderAuth(
+                credentials_provider=CredentialProviderWrapper(
+                    config=self._credential_config,
+                )
             )
-        )
-        return auth
+        return self._oss_auth
 
     @property
     def oss_bucket(self):
         """A OSS2 bucket instance used by the session."""
         if not self._oss_bucket_name or not self._oss_endpoint:
             self._init_oss_config()
-        oss_bucket = oss2.Bucket(
-            auth=self._get_oss_auth(),
-            endpoint=self._oss_endpoint,
-            bucket_name=self._oss_bucket_name,
+        return self.get_oss_bucket(
+            bucket_name=self._oss_bucket_name, endpoint=self._oss_endpoint
         )
-        return oss_bucket
 
     def save_config(self, config_path=None):
         """Save the configuration of the session to a local file."""
@@ -422,18 +419,9 @@ class Session(ResourceAPIsContainerMixin):
         )
 
     def _get_default_oss_endpoint(self) -> str:
-        """Returns a default OSS endpoint."""
-
-        # OSS Endpoint document:
-        # https://help.aliyun.com/document_detail/31837.html
-        internet_endpoint = "oss-{}.aliyuncs.com".format(self.region_id)
-        internal_endpoint = "oss-{}-internal.aliyuncs.com".format(self.region_id)
-
-        return (
-            internet_endpoint
-            if is_domain_connectable(internal_endpoint)
-            else internet_endpoint
-        )
+        """Returns a default OSS endpoint, which is the internal endpoint if it is
+        connectable from the host."""
+        return get_default_oss_endpoint(self.region_id)
 
     def get_oss_bucket(self, bucket_name: str, endpoint: str = None) -> oss2.Bucket:
         """Get a OSS bucket using the credentials of the session.
@@ -442,16 +430,27 @@ class Session(ResourceAPIsContainerMixin):
             bucket_name (str): The name of the bucket.
             endpoint (str): Endpoint of the bucket.
 
+        The bucket instances are reused by the session, and share the credentials
+        and the HTTP connection pool.
+
         Returns:
             :class:`oss2.Bucket`: A OSS bucket instance.
 
         """
         endpoint = endpoint or self._oss_endpoint or self._get_default_oss_endpoint()
-        oss_bucket = oss2.Bucket(
-            auth=self._get_oss_auth(),
-            endpoint=endpoint,
-            bucket_name=bucket_name,
-        )
+        key = (bucket_name, endpoint)
+        with self._oss_lock:
+            oss_bucket = self._oss_buckets.get(key)
+            if oss_bucket is None:
+                if self._oss_http_session is None:
+                    self._oss_http_session = oss2.Session()
+                oss_bucket = oss2.Bucket(
+                    auth=self._get_oss_auth(),
+                    endpoint=endpoint,
+                    bucket_name=bucket_name,
+                    session=self._oss_http_session,
+                )
+                self._oss_buckets[key] = oss_bucket
         return oss_bucket
 
     @classmethod
@@ -532,6 +531,8 @@ class Session(ResourceAPIsContainerMixin):
     def get_default_oss_storage(
         workspace_id: str, cred: CredentialClient, region_id: str, network: Network
     ) -> Tuple[Optional[str], Optional[str]]:
+        from .api.workspace import WorkspaceAPI, WorkspaceConfigKeys
+
         acs_ws_client = ClientFactory.create_client(
             service_name=ServiceName.PAI_WORKSPACE,
             credential_client=cred,
@@ -578,6 +579,8 @@ class Session(ResourceAPIsContainerMixin):
         dsw_instance_id: str, cred: CredentialClient, region_id: str, network: Network
     ) -> Optional[str]:
         """Get workspace id by dsw instance id"""
+        from .libs.alibabacloud_pai_dsw20220101.models import GetInstanceRequest
+
         dsw_client = ClientFactory.create_client(
             service_name=ServiceName.PAI_DSW,
             credential_client=cred,
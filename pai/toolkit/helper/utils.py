@@ -36,10 +36,11 @@ from prompt_toolkit.widgets import Label, RadioList
 from ...api.base import ServiceName
 from ...api.client_factory import ClientFactory
 from ...api.workspace import WorkspaceAPI, WorkspaceConfigKeys
-from ...common.consts import DEFAULT_NETWORK_TYPE, PAI_VPC_ENDPOINT, Network
+from ...common.consts import DEFAULT_NETWORK_TYPE, Network
 from ...common.logging import get_logger
+from ...common.network_utils import is_vpc_network
 from ...common.oss_utils import CredentialProviderWrapper, OssUriObj
-from ...common.utils import is_domain_connectable, make_list_resource_iterator
+from ...common.utils import make_list_resource_iterator
 from ...libs.alibabacloud_pai_dsw20220101.client import Client as DswClient
 from ...libs.alibabacloud_pai_dsw20220101.models import GetInstanceRequest
 from ...session import Session
@@ -112,9 +113,7 @@ class UserProfile(object):
             self.network = Network.from_string(DEFAULT_NETWORK_TYPE)
         else:
             self.network = (
-                Network.VPC
-                if is_domain_connectable(PAI_VPC_ENDPOINT.format(self.region_id))
-                else Network.PUBLIC
+                Network.VPC if is_vpc_network(self.region_id) else Network.PUBLIC
             )
         self._caller_identify = self._get_caller_identity()
 
@@ -0,0 +1,119 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+import time
+
+from mock import patch
+
+from pai.common import code_cache
+from tests.unit import BaseUnitTestCase
+from tests.unit.test_oss_utils import InMemoryOssBucket
+
+
+class CodeCacheBucket(InMemoryOssBucket):
+    def put_object(self, key, data):
+        self.objects[key] = data.encode() if isinstance(data, str) else data
+
+
+class TestCodeCache(BaseUnitTestCase):
+    def setUp(self):
+        super(TestCodeCache, self).setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        cache_patch = patch(
+            "pai.common.code_cache.DEFAULT_CACHE_DIR",
+            os.path.join(self.temp_dir.name, "cache"),
+        )
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+        self.source_dir = os.path.join(self.temp_dir.name, "src")
+        self._write_files(
+            {
+                ".paiignore": "# comments\n*.pyc\n/data/\nlogs/\n!logs/keep.txt\n",
+                "train.py": "print('hello')",
+                "utils/__init__.py": "",
+                "utils/__pycache__/helper.cpython-38.pyc": "bytecode",
+                "data/train.csv": "1,2,3",
+                "nested/data/config.json": "{}",
+                "logs/run.log": "log",
+            }
+        )
+
+    def _write_files(self, files):
+        for name, content in files.items():
+            path = os.path.join(self.source_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+            # Files are modified before the racy window of the manifest.
+            mtime = time.time() - 10
+            os.utime(path, (mtime, mtime))
+
+    def test_list_source_files(self):
+        self.assertListEqual(
+            code_cache.list_source_files(self.source_dir),
+            [
+                ".paiignore",
+                "nested/data/config.json",
+                "train.py",
+                "utils/__init__.py",
+            ],
+        )
+
+    def test_compute_source_digest(self):
+        with patch(
+            "pai.common.code_cache._hash_file", wraps=code_cache._hash_file
+        ) as hash_file:
+            digest, files = code_cache.compute_source_digest(self.source_dir)
+            self.assertEqual(hash_file.call_count, len(files))
+            # Digests of the unchanged files are loaded from the local manifest.
+            self.assertEqual(
+                code_cache.compute_source_digest(self.source_dir)[0], digest
+            )
+            self.assertEqual(hash_file.call_count, len(files))
+
+            # Ignored files do not change the digest.
+            self._write_files({"data/train.csv": "4,5,6"})
+            self.assertEqual(
+                code_cache.compute_source_digest(self.source_dir)[0], digest
+            )
+
+            with open(os.path.join(self.source_dir, "train.py"), "w") as f:
+                f.write("print('world')")
+            new_digest, _ = code_cache.compute_source_digest(self.source_dir)
+            self.assertNotEqual(new_digest, digest)
+            self.assertEqual(hash_file.call_count, len(files) + 1)
+
+    def test_upload_source_dir(self):
+        bucket = CodeCacheBucket()
+        uris = [
+            code_cache.upload_source_dir(self.source_dir, "pai/code_cache", bucket)
+            for _ in range(50)
+        ]
+        digest, files = code_cache.compute_source_digest(self.source_dir)
+
+        self.assertEqual(len(set(uris)), 1)
+        self.assertEqual(uris[0], f"oss://mock_bucket/pai/code_cache/{digest}/")
+        self.assertSetEqual(
+            set(bucket.objects),
+            {f"pai/code_cache/{digest}/{f}" for f in files}
+            | {f"pai/code_cache/{digest}.complete"},
+        )
+
+        self._write_files({"train.py": "print('world')"})
+        uri = code_cache.upload_source_dir(self.source_dir, "pai/code_cache", bucket)
+        self.assertNotEqual(uri, uris[0])
@@ -0,0 +1,218 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+from mock import patch
+
+from pai import image
+from pai.api.base import PaginatedResult
+from pai.api.image import ImageLabel
+from pai.image import ImageScope, list_images, retrieve
+from tests.unit import BaseUnitTestCase
+
+
+def _make_image(idx, repo, tag, chip_type, **labels):
+    labels = dict(
+        labels,
+        **{
+            "system.official": "true",
+            "system.supported.dlc": "true",
+            "system.chipType": chip_type,
+        },
+    )
+    return {
+        "ImageId": "image-{}".format(idx),
+        "Name": "{}:{}".format(repo, tag),
+        "ImageUri": "dsw-registry.cn-hangzhou.cr.aliyuncs.com/pai/{}:{}".format(
+            repo, tag
+        ),
+        "Labels": [{"Key": k, "Value": v} for k, v in labels.items()],
+        "GmtCreateTime": "2024-01-01T00:00:00Z",
+    }
+
+
+class MockImageAPI(object):
+    def __init__(self, images):
+        self.images = images
+        self.requests = []
+
+    def list(self, labels=None, page_number=1, page_size=50, **kwargs):
+        self.requests.append((page_number, page_size))
+        start = (page_number - 1) * page_size
+        return PaginatedResult(
+            items=self.images[start : start + page_size],
+            total_count=len(self.images),
+        )
+
+
+class TestImageCatalog(BaseUnitTestCase):
+    def setUp(self):
+        super(TestImageCatalog, self).setUp()
+        images = [
+            _make_image(
+                0, "pytorch-training", "2.1-gpu-py310-cu121-ubuntu22.04", "GPU"
+            ),
+            _make_image(
+                1, "pytorch-training", "1.12-gpu-py39-cu113-ubuntu20.04", "GPU"
+            ),
+            _make_image(2, "pytorch-training", "1.12-cpu-py39-ubuntu20.04", "CPU"),
+            _make_image(
+                3,
+                "huggingface-pytorch-training",
+                "4.37.2-gpu-py310-cu121-ubuntu22.04",
+                "GPU",
+                **{"system.framework.Transformers": "4.37.2"},
+            ),
+            _make_image(4, "tensorflow-training", "2.3-cpu-py36-ubuntu18.04", "CPU"),
+        ]
+        images += [
+            _make_image(
+                i, "xgboost-training", "1.{}-cpu-py36-ubuntu18.04".format(i), "CPU"
+            )
+            for i in range(5, 250)
+        ]
+        self.api = MockImageAPI(images)
+        self.session = SimpleNamespace(region_id="cn-hangzhou", image_api=self.api)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patches = [
+            patch(
+                "pai.image.DEFAULT_CONFIG_PATH",
+                os.path.join(self.temp_dir.name, "config.json"),
+            ),
+            patch.dict(image._image_catalogs, clear=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_retrieve(self):
+        img = retrieve(
+            "PyTorch", "latest", accelerator_type="GPU", session=self.session
+        )
+        self.assertEqual(img.framework_version, "2.1")
+        img = retrieve("pytorch", "1.12", session=self.session)
+        self.assertEqual(img.image_uri, self.api.images[2]["ImageUri"])
+        self.assertEqual(img.accelerator_type, "CPU")
+        self.assertEqual(
+            len(list_images("XGBoost", session=self.session)),
+            245,
+        )
+        # The catalog is fetched by a single listing.
+        self.assertEqual(len(self.api.requests), 1 + 3)
+
+        for _ in range(10):
+            retrieve("TensorFlow", "2.3", session=self.session)
+        self.assertEqual(len(self.api.requests), 4)
+
+        # The following processes read the catalog from disk.
+        image._image_catalogs.clear()
+        retrieve("TensorFlow", "2.3", session=self.session)
+        self.assertEqual(len(self.api.requests), 4)
+
+        images = image._get_image_catalog(ImageScope.TRAINING, self.session).find(
+            labels=[
+                ImageLabel.DEVICE_TYPE_GPU,
+                ImageLabel.framework_version("Transformers", "*"),
+            ]
+        )
+        self.assertListEqual([img["ImageId"] for img in images], ["image-3"])
+
+    def test_find_images_refresh(self):
+        labels = [ImageLabel.framework_version("Transformers", "*")]
+        self.assertListEqual(
+            image._image_label_values(
+                ImageScope.TRAINING,
+                "system.framework.Transformers",
+                labels,
+                session=self.session,
+            ),
+            ["4.37.2"],
+        )
+        self.api.images.insert(
+            0,
+            _make_image(
+                1000,
+                "huggingface-pytorch-training",
+                "4.40.0-gpu-py310-cu121-ubuntu22.04",
+                "GPU",
+                **{"system.framework.Transformers": "4.40.0"},
+            ),
+        )
+
+        # A lookup miss refreshes the catalog to find the newly released images.
+        with patch(
+            "pai.image.time.time",
+            return_value=time.time() + image._IMAGE_CATALOG_MIN_REFRESH_INTERVAL + 1,
+        ):
+            images = image._find_images(
+                ImageScope.TRAINING,
+                [ImageLabel.framework_version("Transformers", "4.40.0")],
+                session=self.session,
+            )
+            self.assertListEqual([img["ImageId"] for img in images], ["image-1000"])
+            self.assertListEqual(
+                image._image_label_values(
+                    ImageScope.TRAINING,
+                    "system.framework.Transformers",
+                    labels,
+                    session=self.session,
+                ),
+                ["4.37.2", "4.40.0"],
+            )
+
+    def test_retrieve_not_found(self):
+        with self.assertRaisesRegex(RuntimeError, "supported versions"):
+            retrieve("PyTorch", "0.4", session=self.session)
+        with self.assertRaisesRegex(RuntimeError, "Not found any image"):
+            retrieve("OneFlow", "latest", session=self.session)
+        # Misses refresh the catalog at most once in the refresh interval.
+        self.assertEqual(len(self.api.requests), 4)
+
+        with patch(
+            "pai.image.time.time",
+            return_value=time.time() + image._IMAGE_CATALOG_MIN_REFRESH_INTERVAL + 1,
+        ):
+            with self.assertRaises(RuntimeError):
+                retrieve("PyTorch", "0.4", session=self.session)
+        self.assertEqual(len(self.api.requests), 8)
+
+    def test_conditional_refresh(self):
+        retrieve("PyTorch", "latest", session=self.session)
+        image._image_catalogs.clear()
+        expired = time.time() + image._DEFAULT_IMAGE_CATALOG_TTL + 1
+
+        # Only the fingerprint is fetched if the catalog is unchanged.
+        with patch("pai.image.time.time", return_value=expired):
+            retrieve("PyTorch", "latest", session=self.session)
+        self.assertEqual(len(self.api.requests), 5)
+        self.assertEqual(self.api.requests[-1], (1, 1))
+
+        image._image_catalogs.clear()
+        self.api.images.insert(
+            0,
+            _make_image(1000, "pytorch-training", "2.2-cpu-py310-ubuntu22.04", "CPU"),
+        )
+        with patch(
+            "pai.image.time.time",
+            return_value=expired + image._DEFAULT_IMAGE_CATALOG_TTL,
+        ):
+            img = retrieve("PyTorch", "latest", session=self.session)
+        self.assertEqual(img.framework_version, "2.2")
+        self.assertEqual(len(self.api.requests), 5 + 2 + 3)
@@ -0,0 +1,114 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+from types import SimpleNamespace
+
+from mock import patch
+
+from pai.job import LocalTrainingJob
+from tests.unit import BaseUnitTestCase
+
+
+class TestLocalTrainingJob(BaseUnitTestCase):
+    def setUp(self):
+        super(TestLocalTrainingJob, self).setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        root = self.temp_dir.name
+
+        self.source_dir = os.path.join(root, "src")
+        os.makedirs(os.path.join(self.source_dir, "utils"))
+        for path in ["train.py", "utils/data.py"]:
+            with open(os.path.join(self.source_dir, path), "w") as f:
+                f.write("print('hello')")
+        self.train_dir = os.path.join(root, "train")
+        os.makedirs(self.train_dir)
+        self.test_file = os.path.join(root, "test.csv")
+        with open(self.test_file, "w") as f:
+            f.write("a,b")
+
+        p = patch("pai.job._local_training_job.run_container")
+        self.run_container = p.start()
+        self.addCleanup(p.stop)
+
+    def _run(self, **kwargs):
+        estimator = SimpleNamespace(
+            source_dir=self.source_dir,
+            hyperparameters={"lr": 0.1},
+            command="python train.py",
+            image_uri="training-image",
+        )
+        job = LocalTrainingJob(
+            estimator=estimator,
+            inputs={
+                "train": self.train_dir,
+                "test": self.test_file,
+                "eval": self.train_dir,
+            },
+            instance_type="local",
+            temp_dir=os.path.join(self.temp_dir.name, "job"),
+            **kwargs,
+        )
+        job.run()
+        return job, self.run_container.call_args.kwargs["volumes"]
+
+    def test_mount_inputs(self):
+        job, volumes = self._run()
+        self.assertDictEqual(
+            volumes[self.train_dir], {"bind": "/ml/input/data/train", "mode": "ro"}
+        )
+        self.assertDictEqual(
+            volumes[self.test_file],
+            {"bind": "/ml/input/data/test/test.csv", "mode": "ro"},
+        )
+        # A host path used by multiple channels is copied for the other channels.
+        eval_path = os.path.join(job.tmp_dir, "input/data/eval")
+        self.assertDictEqual(
+            volumes[eval_path], {"bind": "/ml/input/data/eval", "mode": "rw"}
+        )
+
+        # Source code is copied to the writable working directory.
+        user_code_dir = os.path.join(job.tmp_dir, "user_code")
+        self.assertDictEqual(
+            volumes[user_code_dir], {"bind": "/ml/usercode/", "mode": "rw"}
+        )
+        self.assertFalse(
+            os.path.samefile(
+                os.path.join(user_code_dir, "utils/data.py"),
+                os.path.join(self.source_dir, "utils/data.py"),
+            )
+        )
+        env = self.run_container.call_args.kwargs["environment_variables"]
+        self.assertEqual(env["PAI_INPUT_TEST"], "/ml/input/data/test/test.csv")
+
+    def test_copy_inputs(self):
+        job, volumes = self._run(copy_inputs=True)
+        input_volumes = {
+            k: v for k, v in volumes.items() if v["bind"].startswith("/ml/input/data/")
+        }
+        self.assertEqual(len(input_volumes), 3)
+        for host_path, volume in input_volumes.items():
+            self.assertTrue(host_path.startswith(job.tmp_dir))
+            self.assertEqual(volume["mode"], "rw")
+        self.assertTrue(
+            os.path.exists(os.path.join(job.tmp_dir, "input/data/test/test.csv"))
+        )
+        self.assertFalse(
+            os.path.samefile(
+                os.path.join(job.tmp_dir, "user_code/train.py"),
+                os.path.join(self.source_dir, "train.py"),
+            )
+        )
@@ -0,0 +1,79 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+import time
+
+from mock import patch
+
+from pai.common import network_utils
+from tests.unit import BaseUnitTestCase
+
+
+class TestNetworkProbe(BaseUnitTestCase):
+    def setUp(self):
+        super(TestNetworkProbe, self).setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patches = [
+            patch(
+                "pai.common.network_utils.DEFAULT_CONFIG_PATH",
+                os.path.join(self.temp_dir.name, "config.json"),
+            ),
+            patch.dict(network_utils._probe_results, clear=True),
+            patch(
+                "pai.common.network_utils.is_domain_connectable",
+                side_effect=lambda domain, timeout: "internal" in domain,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_probe_once(self):
+        connectable = network_utils.is_domain_connectable
+        for _ in range(5):
+            self.assertFalse(network_utils.is_vpc_network("cn-hangzhou"))
+            self.assertEqual(
+                network_utils.get_default_oss_endpoint("cn-hangzhou"),
+                "oss-cn-hangzhou-internal.aliyuncs.com",
+            )
+        self.assertEqual(connectable.call_count, 2)
+
+        # Results are reused by the other processes on the same host.
+        network_utils._probe_results.clear()
+        self.assertFalse(network_utils.is_vpc_network("cn-hangzhou"))
+        self.assertEqual(connectable.call_count, 2)
+
+        network_utils.is_vpc_network("cn-shanghai")
+        self.assertEqual(connectable.call_count, 4)
+
+    def test_probe_cache_expire(self):
+        network_utils.is_vpc_network("cn-hangzhou")
+        network_utils._probe_results.clear()
+        with patch(
+            "pai.common.network_utils.time.time",
+            return_value=time.time() + network_utils._DEFAULT_PROBE_CACHE_TTL + 1,
+        ):
+            network_utils.is_vpc_network("cn-hangzhou")
+        self.assertEqual(network_utils.is_domain_connectable.call_count, 4)
+
+        # Results are keyed by the network identity of the host.
+        network_utils._probe_results.clear()
+        with patch(
+            "pai.common.network_utils._host_network_identity", return_value="other"
+        ):
+            network_utils.is_vpc_network("cn-hangzhou")
+        self.assertEqual(network_utils.is_domain_connectable.call_count, 6)
@@ -0,0 +1,152 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import io
+import os
+import tarfile
+import tempfile
+from types import SimpleNamespace
+
+import oss2
+
+from pai.common.oss_cache import OssObjectCache
+from tests.unit import BaseUnitTestCase
+from tests.unit.test_oss_utils import InMemoryOssBucket
+
+
+class ListableOssBucket(InMemoryOssBucket):
+    """An in-memory OSS bucket that lists the objects with the ETags."""
+
+    def __init__(self, objects):
+        super(ListableOssBucket, self).__init__()
+        self.objects = dict(objects)
+        self.downloads = []
+
+    def _etag(self, key):
+        return hashlib.md5(self.objects[key]).hexdigest().upper()
+
+    def get_object_to_file(self, key, filename, progress_callback=None):
+        with self.lock:
+            self.downloads.append(key)
+        super(ListableOssBucket, self).get_object_to_file(key, filename)
+
+    def get_object_meta(self, key):
+        if key not in self.objects:
+            raise oss2.exceptions.NoSuchKey(404, {}, "", {})
+        return SimpleNamespace(
+            content_length=len(self.objects[key]), etag=self._etag(key)
+        )
+
+    def list_objects_v2(self, prefix, **kwargs):
+        return SimpleNamespace(
+            object_list=[
+                SimpleNamespace(key=key, etag=self._etag(key), size=len(data))
+                for key, data in sorted(self.objects.items())
+                if key.startswith(prefix)
+            ],
+            prefix_list=[],
+            is_truncated=False,
+            next_continuation_token="",
+        )
+
+
+class TestOssObjectCache(BaseUnitTestCase):
+    def setUp(self):
+        super(TestOssObjectCache, self).setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.bucket = ListableOssBucket(
+            {
+                "data/train.csv": b"1,2,3",
+                "data/nested/test.csv": b"4,5,6",
+                "data/model.bin": b"0" * 1024,
+            }
+        )
+
+    def _cache(self, **kwargs):
+        return OssObjectCache(
+            cache_dir=os.path.join(self.temp_dir.name, "cache"), **kwargs
+        )
+
+    def _local_path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_materialize(self):
+        local_path = self._local_path("run-1")
+        self._cache().materialize("data/", local_path, bucket=self.bucket)
+        with open(os.path.join(local_path, "nested/test.csv"), "rb") as f:
+            self.assertEqual(f.read(), b"4,5,6")
+        self.assertEqual(len(self.bucket.downloads), 3)
+
+        # Unchanged objects are linked from the cache without downloading.
+        local_path = self._local_path("run-2")
+        self._cache().materialize("data", local_path, bucket=self.bucket)
+        self.assertEqual(len(self.bucket.downloads), 3)
+        self.assertEqual(
+            os.stat(os.path.join(local_path, "train.csv")).st_nlink,
+            3,
+        )
+
+        # Changed objects are downloaded again.
+        self.bucket.objects["data/train.csv"] = b"7,8,9"
+        local_path = self._local_path("run-3")
+        self._cache().materialize("data/", local_path, bucket=self.bucket)
+        self.assertListEqual(self.bucket.downloads[3:], ["data/train.csv"])
+        with open(os.path.join(local_path, "train.csv"), "rb") as f:
+            self.assertEqual(f.read(), b"7,8,9")
+
+        # Single object is materialized to the local directory.
+        dest = self._cache().materialize(
+            "data/model.bin", self._local_path("run-4"), bucket=self.bucket
+        )
+        self.assertEqual(dest, os.path.join(self._local_path("run-4"), "model.bin"))
+        self.assertEqual(len(self.bucket.downloads), 4)
+
+    def test_un_tar(self):
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            info = tarfile.TarInfo("model/config.json")
+            info.size = 2
+            tar.addfile(info, io.BytesIO(b"{}"))
+        self.bucket.objects["model.tar.gz"] = buf.getvalue()
+
+        for name in ["run-1", "run-2"]:
+            local_path = self._local_path(name)
+            self._cache().materialize(
+                "model.tar.gz", local_path, bucket=self.bucket, un_tar=True
+            )
+            self.assertTrue(
+                os.path.isfile(os.path.join(local_path, "model/config.json"))
+            )
+        self.assertListEqual(self.bucket.downloads, ["model.tar.gz"])
+
+    def test_evict(self):
+        cache = self._cache(max_size=1030)
+        cache.materialize("data/model.bin", self._local_path("run-1"), self.bucket)
+        cache.materialize("data/train.csv", self._local_path("run-2"), self.bucket)
+        model_path = cache._object_path(
+            self.bucket.bucket_name,
+            "data/model.bin",
+            self.bucket._etag("data/model.bin"),
+        )
+        os.utime(model_path, (0, 0))
+
+        # The least recently used objects are evicted to fit the size budget.
+        cache.materialize("data/nested/", self._local_path("run-3"), self.bucket)
+        self.assertFalse(os.path.exists(model_path))
+        cache.materialize("data/train.csv", self._local_path("run-4"), self.bucket)
+        self.assertEqual(len(self.bucket.downloads), 3)
+        cache.materialize("data/model.bin", self._local_path("run-5"), self.bucket)
+        self.assertEqual(len(self.bucket.downloads), 4)
@@ -0,0 +1,260 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gzip
+import io
+import os
+import tempfile
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+import oss2
+from alibabacloud_credentials.client import Client as CredentialClient
+from alibabacloud_credentials.models import Config as CredentialConfig
+from alibabacloud_credentials.provider.refreshable import (
+    Credentials as RefreshableCredentials,
+)
+from alibabacloud_credentials_api import ICredentialsProvider
+from mock import patch
+
+from pai.common import oss_utils
+from tests.unit import BaseUnitTestCase
+
+
+class InMemoryOssBucket(object):
+    """An OSS bucket stores the objects in memory."""
+
+    bucket_name = "mock_bucket"
+
+    def __init__(self, failures=None):
+        self.objects = {}
+        self.uploads = {}
+        # Number of failed attempts of the object keys before the success.
+        self.failures = dict(failures or {})
+        self.lock = threading.Lock()
+
+    def _maybe_fail(self, key):
+        with self.lock:
+            if self.failures.get(key):
+                self.failures[key] -= 1
+                raise oss2.exceptions.RequestError(ConnectionError("reset by peer"))
+
+    def put_object_from_file(self, key, filename, progress_callback=None):
+        self._maybe_fail(key)
+        with open(filename, "rb") as f:
+            self.objects[key] = f.read()
+        progress_callback(len(self.objects[key]), len(self.objects[key]))
+
+    def get_object_to_file(self, key, filename, progress_callback=None):
+        self._maybe_fail(key)
+        with open(filename, "wb") as f:
+            f.write(self.objects[key])
+
+    def put_object(self, key, data):
+        self.objects[key] = data
+
+    def get_object(self, key, progress_callback=None):
+        return io.BytesIO(self.objects[key])
+
+    def init_multipart_upload(self, key):
+        upload_id = uuid.uuid4().hex
+        self.uploads[upload_id] = {}
+        return SimpleNamespace(upload_id=upload_id)
+
+    def upload_part(self, key, upload_id, part_number, data):
+        self.uploads[upload_id][part_number] = data
+        return SimpleNamespace(etag=str(part_number))
+
+    def complete_multipart_upload(self, key, upload_id, parts):
+        uploaded = self.uploads.pop(upload_id)
+        self.objects[key] = b"".join(uploaded[p.part_number] for p in parts)
+
+    def object_exists(self, key):
+        return key in self.objects
+
+    def get_object_meta(self, key):
+        return SimpleNamespace(content_length=len(self.objects[key]))
+
+    def list_objects(self, prefix):
+        return [
+            SimpleNamespace(key=key, size=len(data))
+            for key, data in sorted(self.objects.items())
+            if key.startswith(prefix)
+        ]
+
+
+class TestOssTransfer(BaseUnitTestCase):
+    def setUp(self):
+        super(TestOssTransfer, self).setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.join(self.temp_dir.name, "source")
+        self.files = {
+            "config.json": b"{}",
+            "tokenizer/vocab.txt": b"hello\nworld\n",
+            "shards/model-00001.safetensors": os.urandom(4096),
+            "shards/model-00002.safetensors": os.urandom(1024 * 1024),
+        }
+        for name, data in self.files.items():
+            path = os.path.join(self.source_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        sleep_patch = patch("pai.common.oss_utils.time.sleep")
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _fake_resumable_upload(self, bucket, key, filename, **kwargs):
+        bucket.put_object_from_file(key, filename, kwargs["progress_callback"])
+
+    @patch("pai.common.oss_utils._DEFAULT_MULTIPART_THRESHOLD", 64 * 1024)
+    def test_upload_directory(self):
+        bucket = InMemoryOssBucket(failures={"model/config.json": 2})
+        with patch(
+            "oss2.resumable_upload", side_effect=self._fake_resumable_upload
+        ) as resumable_upload:
+            uri = oss_utils.upload(
+                self.source_dir, "model", bucket=bucket, max_workers=4
+            )
+
+        self.assertEqual(uri, "oss://mock_bucket/model/")
+        self.assertDictEqual(
+            bucket.objects, {"model/" + k: v for k, v in self.files.items()}
+        )
+        # Only the object larger than the threshold is uploaded in parts.
+        self.assertEqual(resumable_upload.call_count, 1)
+        self.assertEqual(
+            resumable_upload.call_args.kwargs["key"],
+            "model/shards/model-00002.safetensors",
+        )
+
+    def test_download_directory(self):
+        bucket = InMemoryOssBucket(failures={"model/tokenizer/vocab.txt": 1})
+        bucket.objects = {"model/" + k: v for k, v in self.files.items()}
+        bucket.objects["model/empty_dir/"] = b""
+        local_dir = os.path.join(self.temp_dir.name, "local")
+
+        with patch(
+            "oss2.ObjectIteratorV2", lambda bucket, prefix: bucket.list_objects(prefix)
+        ):
+            oss_utils.download("model/", local_dir, bucket=bucket)
+
+        for name, data in self.files.items():
+            with open(os.path.join(local_dir, name), "rb") as f:
+                self.assertEqual(f.read(), data)
+
+    @patch("pai.common.oss_utils._DEFAULT_STREAMING_PART_SIZE", 256 * 1024)
+    @patch("pai.common.oss_utils._DEFAULT_COMPRESS_CHUNK_SIZE", 64 * 1024)
+    def test_upload_download_tar_gz(self):
+        bucket = InMemoryOssBucket()
+        with patch.object(
+            bucket, "complete_multipart_upload", wraps=bucket.complete_multipart_upload
+        ) as complete_multipart_upload:
+            uri = oss_utils.upload(
+                self.source_dir, "model/", bucket=bucket, is_tar=True
+            )
+
+        self.assertEqual(uri, "oss://mock_bucket/model/source.tar.gz")
+        # The archive is compressed in chunks and uploaded in parts.
+        self.assertGreater(len(complete_multipart_upload.call_args.args[2]), 1)
+        self.assertGreater(
+            len(gzip.decompress(bucket.objects["model/source.tar.gz"])),
+            sum(len(data) for data in self.files.values()),
+        )
+
+        local_dir = os.path.join(self.temp_dir.name, "local")
+        oss_utils.download("model/source.tar.gz", local_dir, bucket=bucket, un_tar=True)
+        for name, data in self.files.items():
+            with open(os.path.join(local_dir, name), "rb") as f:
+                self.assertEqual(f.read(), data)
+
+    def test_transfer_error(self):
+        bucket = InMemoryOssBucket(failures={"model/config.json": 3})
+        with self.assertRaises(oss2.exceptions.RequestError):
+            oss_utils.upload(self.source_dir, "model/", bucket=bucket)
+
+        def _put_object(key, filename, progress_callback=None):
+            raise oss2.exceptions.ServerError(403, {}, b"", {"Code": "AccessDenied"})
+
+        bucket = InMemoryOssBucket()
+        with patch.object(
+            bucket, "put_object_from_file", side_effect=_put_object
+        ) as put_object:
+            with self.assertRaises(oss2.exceptions.ServerError):
+                oss_utils.upload(
+                    os.path.join(self.source_dir, "config.json"),
+                    "model/",
+                    bucket=bucket,
+                )
+        # Client errors are not retried.
+        self.assertEqual(put_object.call_count, 1)
+
+
+class _StsCredentialsProvider(ICredentialsProvider):
+    """A credentials provider that issues STS credentials of the given duration."""
+
+    def __init__(self, duration=None):
+        self.duration = duration
+        self.count = 0
+
+    def get_credentials(self) -> RefreshableCredentials:
+        self.count += 1
+        return RefreshableCredentials(
+            access_key_id="id-{}".format(self.count),
+            access_key_secret="secret",
+            security_token="token",
+            expiration=int(time.time()) + self.duration if self.duration else None,
+            provider_name="sts",
+        )
+
+    def get_provider_name(self) -> str:
+        return "sts"
+
+
+class TestCredentialProviderWrapper(BaseUnitTestCase):
+    def _make_provider(self, duration=None):
+        provider = oss_utils.CredentialProviderWrapper(
+            config=CredentialConfig(
+                type="access_key",
+                access_key_id="access_key_id",
+                access_key_secret="access_key_secret",
+            ),
+            refresh_interval=600,
+        )
+        sts_provider = _StsCredentialsProvider(duration=duration)
+        provider.client = CredentialClient(provider=sts_provider)
+        return provider
+
+    def test_reuse_credentials(self):
+        provider = self._make_provider()
+        with patch("pai.common.oss_utils.time.time", return_value=1000):
+            for _ in range(10):
+                credentials = provider.get_credentials()
+        self.assertEqual(credentials.access_key_id, "id-1")
+        self.assertEqual(provider.client.cloud_credential.provider.count, 1)
+
+        with patch("pai.common.oss_utils.time.time", return_value=1000 + 600):
+            self.assertEqual(provider.get_credentials().access_key_id, "id-2")
+
+    def test_refresh_before_expiration(self):
+        provider = self._make_provider(duration=300)
+        now = time.time()
+        with patch("pai.common.oss_utils.time.time", return_value=now):
+            provider.get_credentials()
+        with patch("pai.common.oss_utils.time.time", return_value=now + 60):
+            self.assertEqual(provider.get_credentials().access_key_id, "id-1")
+        with patch("pai.common.oss_utils.time.time", return_value=now + 150):
+            self.assertEqual(provider.get_credentials().access_key_id, "id-2")
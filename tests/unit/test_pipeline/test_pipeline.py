@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from mock import patch
+
 from pai.pipeline import Pipeline
 from pai.pipeline.component import ContainerComponent
 from pai.pipeline.types import (
@@ -189,3 +191,91 @@ class TestPipelineBuild(BaseUnitTestCase):
             output_param_case["spec"]["withParam"],
             "{{pipelines.stepOutput.outputs.parameters.outputParam}}",
         )
+
+
+class TestPipelineGraph(BaseUnitTestCase):
+    def setUp(self):
+        super(TestPipelineGraph, self).setUp()
+        self.op = ContainerComponent(
+            image_uri="python:3",
+            inputs=[PipelineParameter(name="foo", default="hello")],
+            outputs=[PipelineParameter(name="outputParam")],
+            command="echo hello",
+        )
+        p = patch("pai.pipeline.core.get_default_session", return_value=None)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_topo_sort(self):
+        fan_out = [self.op.as_step() for _ in range(1000)]
+        source = self.op.as_step(name="source")
+        for step in fan_out:
+            step.after(source)
+        merge = self.op.as_step(
+            name="merge", inputs={"foo": fan_out[-1].outputs["outputParam"]}
+        )
+        merge.after(*fan_out)
+
+        pipeline = Pipeline(steps=[merge])
+        steps = pipeline.steps
+        self.assertEqual(len(steps), 1002)
+        self.assertEqual(steps[0], source)
+        self.assertEqual(steps[-1], merge)
+        # Unnamed steps are named with the index of the same prefix.
+        self.assertSetEqual(
+            {step.name for step in fan_out},
+            {"%s-%d" % (self.op.name, i) for i in range(1000)},
+        )
+
+        a, b, c = [self.op.as_step(name=name) for name in ["a", "b", "c"]]
+        b.after(a)
+        c.after(b)
+        a.after(c)
+        with self.assertRaisesRegex(ValueError, "Cycle dependency"):
+            Pipeline(steps=[a, b, c])
+
+    def test_manifest_cache(self):
+        step1 = self.op.as_step(name="step1")
+        step2 = self.op.as_step(
+            name="step2", inputs={"foo": step1.outputs["outputParam"]}
+        )
+        pipeline = Pipeline(steps=[step1, step2])
+
+        manifest = pipeline.to_manifest(identifier="test", version="v1")
+        self.assertIs(pipeline.to_manifest(identifier="test", version="v1"), manifest)
+        self.assertNotEqual(
+            pipeline.to_manifest(identifier="test", version="v2"), manifest
+        )
+
+        # The cache is invalidated once the step is changed.
+        step2.name = "step3"
+        self.assertIn("step3", pipeline.to_manifest(identifier="test", version="v1"))
+        self.assertListEqual(
+            [
+                step["metadata"]["name"]
+                for step in pipeline.to_dict()[-1]["spec"]["pipelines"]
+            ],
+            ["step1", "step3"],
+        )
+
+        # Changing the returned step dicts does not change the later results.
+        pipeline.to_dict()[-1]["spec"]["pipelines"][0]["metadata"]["name"] = "foo"
+        self.assertEqual(
+            pipeline.to_dict()[-1]["spec"]["pipelines"][0]["metadata"]["name"],
+            "step1",
+        )
+
+    def test_depends_order(self):
+        steps = [self.op.as_step(name="step%d" % i) for i in range(10)]
+        merge = self.op.as_step(
+            name="merge", inputs={"foo": steps[0].outputs["outputParam"]}
+        )
+        merge.after(*steps[1:])
+        self.assertListEqual(merge.depends, steps)
+
+        pipeline = Pipeline(steps=[merge])
+        self.assertListEqual(pipeline.steps, steps + [merge])
+        self.assertListEqual(
+            pipeline.to_dict()[-1]["spec"]["pipelines"][-1]["spec"]["dependencies"],
+            ["step%d" % i for i in range(10)],
+        )
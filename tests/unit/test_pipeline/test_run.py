@@ -0,0 +1,258 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+from types import SimpleNamespace
+
+from mock import patch
+
+from pai.api.base import PaginatedResult
+from pai.pipeline import PipelineNodeEvent, PipelineRunStatus, PipelineRunStatusTracker
+from pai.pipeline.run import _RunLogger
+from tests.unit import BaseUnitTestCase
+
+
+class MockPipelineRunAPI(object):
+    """A pipeline run API serves the nodes of a pipeline run tree."""
+
+    def __init__(self, nodes):
+        # node_id => (name, node_type, status, children node_ids)
+        self.nodes = nodes
+        self.requests = []
+        # Nodes listed without the node id.
+        self.unassigned = set()
+
+    def _node_info(self, node_id):
+        name, node_type, status, _ = self.nodes[node_id]
+        if node_id in self.unassigned:
+            node_id = ""
+        return {
+            "Metadata": {"Name": name, "NodeId": node_id, "NodeType": node_type},
+            "StatusInfo": {"Status": status, "StartedAt": "2024-01-01T00:00:00Z"},
+        }
+
+    def get_node(self, run_id, node_id, depth=2):
+        self.requests.append(node_id)
+        info = self._node_info(node_id)
+        info["Spec"] = {
+            "Pipelines": [
+                self._node_info(child_id) for child_id in self.nodes[node_id][3]
+            ]
+        }
+        return info
+
+    def set_status(self, status, *node_ids):
+        for node_id in node_ids:
+            name, node_type, _, children = self.nodes[node_id]
+            self.nodes[node_id] = (name, node_type, status, children)
+
+
+class TestPipelineRunStatusTracker(BaseUnitTestCase):
+    def setUp(self):
+        super(TestPipelineRunStatusTracker, self).setUp()
+        running = PipelineRunStatus.Running
+        self.steps = ["step-%d" % i for i in range(100)]
+        nodes = {
+            "root": ("root", "Dag", running, ["a", "sub", "c"]),
+            "a": ("a", "Container", running, []),
+            "sub": ("sub", "Dag", running, self.steps),
+            "c": ("c", "Container", "Initialized", []),
+        }
+        nodes.update({step: (step, "Container", running, []) for step in self.steps})
+        self.api = MockPipelineRunAPI(nodes)
+        self.clock = [1000.0]
+        p = patch("pai.pipeline.run.time.monotonic", side_effect=lambda: self.clock[0])
+        p.start()
+        self.addCleanup(p.stop)
+
+    def _make_tracker(self):
+        return PipelineRunStatusTracker(
+            run_id="run-1",
+            node_id="root",
+            root_name="run",
+            session=SimpleNamespace(pipeline_run_api=self.api),
+            interval=2,
+            max_interval=10,
+        )
+
+    def _tick(self, tracker):
+        self.clock[0] += tracker.next_poll_delay()
+        return tracker.poll()
+
+    def test_poll_incremental(self):
+        tracker = self._make_tracker()
+        events = []
+        tracker.subscribe(events.append)
+
+        self._tick(tracker)
+        self.assertEqual(len(events), 1 + 3 + 100)
+        self.assertListEqual(self.api.requests, ["root", "sub"])
+        self.assertIn("run.sub.step-99", tracker.status_infos)
+        self.assertEqual(tracker.root_status, PipelineRunStatus.Running)
+
+        # The completed subtree is fetched a last time, then is not polled.
+        self.api.set_status(PipelineRunStatus.Succeeded, "sub", *self.steps)
+        del events[:]
+        self._tick(tracker)
+        self.assertEqual(len(events), 101)
+        self.assertTrue(
+            all(e.previous_status == PipelineRunStatus.Running for e in events)
+        )
+        for _ in range(5):
+            self._tick(tracker)
+        self.assertEqual(self.api.requests.count("sub"), 2)
+        self.assertEqual(self.api.requests.count("root"), 7)
+
+        self.api.set_status(PipelineRunStatus.Failed, "c")
+        self._tick(tracker)
+        self.assertListEqual(list(tracker.failed_nodes), ["run.c"])
+
+        self.api.set_status(PipelineRunStatus.Failed, "root")
+        self._tick(tracker)
+        self.assertFalse(tracker.is_running)
+        self.assertEqual(tracker.root_status, PipelineRunStatus.Failed)
+
+    def test_late_node_id(self):
+        self.api.set_status("Pending", "sub")
+        self.api.unassigned.add("sub")
+        tracker = self._make_tracker()
+        self._tick(tracker)
+        self.assertListEqual(self.api.requests, ["root"])
+        self.assertEqual(tracker.status_infos["run.sub"]["nodeId"], "")
+
+        # The nested pipeline is tracked once its node id is assigned, while the
+        # status is not changed.
+        self.api.unassigned.clear()
+        self._tick(tracker)
+        self.assertListEqual(self.api.requests, ["root", "root", "sub"])
+        self.assertEqual(tracker.status_infos["run.sub"]["nodeId"], "sub")
+
+        self.api.set_status(PipelineRunStatus.Failed, "sub", "step-1")
+        for _ in range(3):
+            self._tick(tracker)
+        self.assertListEqual(list(tracker.failed_nodes), ["run.sub", "run.sub.step-1"])
+        # The completed nested pipeline is not tracked again.
+        self.assertEqual(self.api.requests.count("sub"), 2)
+
+    def test_poll_interval(self):
+        tracker = self._make_tracker()
+        intervals = []
+        for _ in range(8):
+            before = self.clock[0]
+            self._tick(tracker)
+            intervals.append(self.clock[0] - before)
+        # The refreshes slow down while the nodes are idle.
+        self.assertListEqual(intervals[:4], [0, 2, 3, 4.5])
+        self.assertEqual(intervals[-1], 10)
+
+        self.api.set_status(PipelineRunStatus.Succeeded, "a")
+        self._tick(tracker)
+        self.assertEqual(tracker.next_poll_delay(), 2)
+
+
+class MockNodeLogAPI(object):
+    def __init__(self, logs):
+        self.logs = logs
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def list_node_logs(self, run_id, node_id, page_offset, page_size):
+        with self.lock:
+            self.requests.append((node_id, page_offset, page_size))
+            items = self.logs[node_id][page_offset : page_offset + page_size]
+        return PaginatedResult(items=list(items), total_count=len(items))
+
+
+class TestRunLogger(BaseUnitTestCase):
+    def _event(self, node_id, status, previous_status=None):
+        return PipelineNodeEvent(
+            name="run.%s" % node_id,
+            node_id=node_id,
+            node_type="Container",
+            status=status,
+            previous_status=previous_status,
+        )
+
+    def test_tail_nodes(self):
+        logs = {"node-%d" % i: ["log %d" % j for j in range(3)] for i in range(200)}
+        logs["chatty"] = ["log %d" % j for j in range(5000)]
+        api = MockNodeLogAPI(logs)
+        run_logger = _RunLogger(
+            run_instance=SimpleNamespace(run_id="run-1"),
+            node_id="root",
+            session=SimpleNamespace(pipeline_run_api=api),
+        )
+
+        printed = []
+        with patch("pai.pipeline.run.print", create=True, side_effect=printed.append):
+            for node_id in logs:
+                run_logger.on_node_event(
+                    self._event(node_id, PipelineRunStatus.Running)
+                )
+            # Logs are appended after the nodes are tailed.
+            with api.lock:
+                logs["node-0"].append("log 3")
+            for node_id in logs:
+                run_logger.on_node_event(
+                    self._event(
+                        node_id,
+                        PipelineRunStatus.Succeeded,
+                        previous_status=PipelineRunStatus.Running,
+                    )
+                )
+            run_logger.stop(wait=True)
+
+        lines = [line for line in printed if not line.startswith("Add Node Logger")]
+        self.assertEqual(len(lines), 200 * 3 + 1 + 5000)
+        self.assertListEqual(
+            [line for line in lines if line.startswith("run.node-0:")],
+            ["run.node-0: log %d" % j for j in range(4)],
+        )
+        self.assertListEqual(
+            [line for line in lines if line.startswith("run.chatty:")],
+            ["run.chatty: log %d" % j for j in range(5000)],
+        )
+        # The page size of the chatty node grows.
+        chatty = [r for r in api.requests if r[0] == "chatty"]
+        self.assertLess(len(chatty), 5000 / 100)
+        self.assertIsNone(run_logger._thread)
+        self.assertDictEqual(run_logger._cursors, {})
+
+    def test_tail_late_node_id(self):
+        api = MockNodeLogAPI({"node-0": ["log 0", "log 1"]})
+        run_logger = _RunLogger(
+            run_instance=SimpleNamespace(run_id="run-1"),
+            node_id="root",
+            session=SimpleNamespace(pipeline_run_api=api),
+        )
+
+        printed = []
+        with patch("pai.pipeline.run.print", create=True, side_effect=printed.append):
+            event = self._event("node-0", PipelineRunStatus.Running)
+            event.node_id = ""
+            run_logger.on_node_event(event)
+            run_logger.on_node_event(
+                self._event(
+                    "node-0",
+                    PipelineRunStatus.Failed,
+                    previous_status=PipelineRunStatus.Running,
+                )
+            )
+            run_logger.stop(wait=True)
+
+        self.assertListEqual(
+            [line for line in printed if not line.startswith("Add Node Logger")],
+            ["run.node-0: log 0", "run.node-0: log 1"],
+        )
+        self.assertTrue(all(request[0] == "node-0" for request in api.requests))
@@ -0,0 +1,616 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from mock import MagicMock, patch
+
+from pai.exception import PredictionException
+from pai.predictor import (
+    AsyncPredictor,
+    BatchingPredictor,
+    LocalPredictor,
+    Predictor,
+    ServiceType,
+    WaitConfig,
+    _QueueResultCollector,
+)
+from pai.serializers import BytesSerializer, JsonSerializer, PyTorchSerializer
+
+
+def _service_api_object(endpoint: str, service_type: str = ServiceType.Standard):
+    return {
+        "ServiceName": "test_service",
+        "InternetEndpoint": endpoint,
+        "IntranetEndpoint": endpoint,
+        "AccessToken": "test_token",
+        "Status": "Running",
+        "ServiceConfig": json.dumps({"metadata": {"type": service_type}}),
+    }
+
+
+class MockQueueService(object):
+    """A local HTTP server that mimics the EAS queue service API."""
+
+    def __init__(self):
+        self.sink = {}
+        self.next_index = 1
+        self.peers = set()
+        self.request_count = 0
+
+        self.app = web.Application()
+        self.app.router.add_post("/", self.handle_predict)
+        self.app.router.add_get("/sink", self.handle_sink)
+        self.app.router.add_delete("/sink", self.handle_delete)
+        # Result of a request sent by another client.
+        self._put_result(uuid.uuid4().hex, b"other")
+
+    def _record(self, request: web.Request):
+        self.request_count += 1
+
+    def _put_result(self, request_id: str, data: bytes, status_code: int = 200):
+        tags = {"requestId": request_id}
+        if status_code != 200:
+            tags["lastCode"] = str(status_code)
+        self.sink[self.next_index] = {
+            "index": self.next_index,
+            "tags": tags,
+            "data": base64.b64encode(data).decode(),
+        }
+        self.next_index += 1
+
+    async def handle_predict(self, request: web.Request):
+        self._record(request)
+        self.peers.add(request.transport.get_extra_info("peername"))
+        request_id = uuid.uuid4().hex
+        data = await request.read()
+        self._put_result(request_id, data, 500 if data == b"error" else 200)
+        return web.Response(headers={"X-Eas-Queueservice-Request-Id": request_id})
+
+    async def handle_sink(self, request: web.Request):
+        self._record(request)
+        if "requestId" in request.query:
+            items = [
+                item
+                for item in self.sink.values()
+                if item["tags"]["requestId"] == request.query["requestId"]
+            ]
+            if not items:
+                return web.Response(status=204)
+            return web.json_response(items)
+        index = int(request.query["_index_"])
+        length = int(request.query["_length_"])
+        items = [self.sink[idx] for idx in sorted(self.sink) if idx >= index]
+        if not items:
+            return web.Response(status=204)
+        return web.json_response(items[:length])
+
+    async def handle_delete(self, request: web.Request):
+        self._record(request)
+        for index in request.query["_indexes_"].split(","):
+            del self.sink[int(index)]
+        return web.Response()
+
+
+class TestAsyncPredictor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = MockQueueService()
+        self.server = TestServer(self.service.app, host="127.0.0.1")
+        await self.server.start_server()
+        endpoint = str(self.server.make_url("/"))
+        self.describe_patch = patch.object(
+            AsyncPredictor,
+            "describe_service",
+            return_value=_service_api_object(endpoint, ServiceType.Async),
+        )
+        self.describe_patch.start()
+
+    async def asyncTearDown(self):
+        self.describe_patch.stop()
+        await self.server.close()
+
+    def _make_predictor(self, **kwargs):
+        return AsyncPredictor(
+            service_name="test_service",
+            serializer=BytesSerializer(),
+            session=object(),
+            **kwargs,
+        )
+
+    async def test_predict_async_reuse_connections(self):
+        async with self._make_predictor(max_connections=2) as predictor:
+            results = await asyncio.gather(
+                *[
+                    predictor.predict_async(
+                        f"request-{i}".encode(), wait_config=WaitConfig(interval=1)
+                    )
+                    for i in range(20)
+                ]
+            )
+            self.assertListEqual(results, [f"request-{i}".encode() for i in range(20)])
+            resp = await predictor.raw_predict_async(
+                b"raw", wait_config=WaitConfig(interval=1)
+            )
+            self.assertEqual(resp.content, b"raw")
+
+        self.assertLessEqual(len(self.service.peers), 2)
+        self.assertIsNone(predictor._async_session)
+
+    async def test_collect_results_in_bulk(self):
+        predictor = self._make_predictor(max_workers=4)
+        tasks = [predictor.predict(f"request-{i}".encode()) for i in range(50)]
+        error_task = predictor.raw_predict(b"error")
+        results = await asyncio.gather(
+            *[asyncio.wrap_future(task.future) for task in tasks]
+        )
+
+        self.assertListEqual(results, [f"request-{i}".encode() for i in range(50)])
+        with self.assertRaises(PredictionException):
+            await asyncio.wrap_future(error_task.future)
+        # Results are fetched and deleted in bulk rather than polled per request.
+        self.assertLess(self.service.request_count, 51 + 25)
+        # Results of other clients are left in the sink queue.
+        self.assertEqual(len(self.service.sink), 1)
+
+
+class TestQueueResultCollector(unittest.TestCase):
+    def _make_collector(self, fetch_fn, **kwargs):
+        kwargs.setdefault("lookup_fn", lambda request_id: None)
+        return _QueueResultCollector(
+            fetch_fn=fetch_fn, delete_fn=lambda indexes: None, **kwargs
+        )
+
+    def test_fetch_error(self):
+        calls = []
+
+        def fetch_fn(index, length, timeout):
+            calls.append(index)
+            raise RuntimeError("connection reset")
+
+        def lookup_fn(request_id):
+            if request_id == "r0":
+                return {"index": 5, "tags": {"requestId": "r0"}}
+
+        collector = self._make_collector(
+            fetch_fn, lookup_fn=lookup_fn, min_interval=0.01, max_errors=3
+        )
+        self.assertEqual(
+            collector.register("r0", WaitConfig()).result(timeout=5)["index"], 5
+        )
+        future = collector.register("r1", WaitConfig(interval=0.01))
+        with self.assertRaisesRegex(RuntimeError, "connection reset"):
+            future.result(timeout=5)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(collector.pending_count, 0)
+
+    def test_client_error(self):
+        def lookup_fn(request_id):
+            raise PredictionException(code=401, message="invalid token")
+
+        collector = self._make_collector(
+            lambda index, length, timeout: [], lookup_fn=lookup_fn, min_interval=0.01
+        )
+        futures = [collector.register(r, WaitConfig()) for r in ["r1", "r2"]]
+        for future in futures:
+            with self.assertRaisesRegex(PredictionException, "invalid token"):
+                future.result(timeout=5)
+
+    def test_lookup_result(self):
+        sink = {}
+        fetched = []
+
+        def fetch_fn(index, length, timeout):
+            fetched.append(index)
+            return [sink[i] for i in sorted(sink) if i >= index][:length]
+
+        def lookup_fn(request_id):
+            for message in sink.values():
+                if message["tags"]["requestId"] == request_id:
+                    return message
+
+        def put(index, request_id):
+            sink[index] = {"index": index, "tags": {"requestId": request_id}}
+
+        # Results of other requests in the queue are not fetched.
+        for i in range(1000):
+            put(i, "other-%d" % i)
+        put(1000, "r0")
+        collector = _QueueResultCollector(
+            fetch_fn=fetch_fn,
+            delete_fn=lambda indexes: [sink.pop(i) for i in indexes],
+            lookup_fn=lookup_fn,
+            batch_size=8,
+            min_interval=0.01,
+            lookup_after=0.2,
+        )
+        self.assertEqual(
+            collector.register("r0", WaitConfig()).result(timeout=5)["index"], 1000
+        )
+        self.assertGreaterEqual(min(fetched or [992]), 992)
+
+        # A result arrives before the request is registered, and is evicted from
+        # the recently seen results by the results of other requests.
+        put(1001, "r1")
+        for i in range(1002, 1300):
+            put(i, "other-%d" % i)
+        future = collector.register("r2", WaitConfig(interval=0.01))
+        put(1300, "r2")
+        self.assertEqual(future.result(timeout=5)["index"], 1300)
+        self.assertEqual(
+            collector.register("r1", WaitConfig(interval=0.01)).result(timeout=5)[
+                "index"
+            ],
+            1001,
+        )
+
+
+class MockStandardService(object):
+    """A local HTTP server that echoes the request body."""
+
+    def __init__(self):
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        # Set by the client to receive the rest of the streaming response.
+        self.stream_released = asyncio.Event()
+
+        self.app = web.Application()
+        self.app.router.add_post("/", self.handle_predict)
+        self.app.router.add_post("/stream", self.handle_stream)
+
+    async def handle_stream(self, request: web.Request):
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await resp.write(b': keep-alive\n\nid: 1\ndata: {"token": "hello"}\n\n')
+        await self.stream_released.wait()
+        await resp.write(b"event: done\r\ndata: line1\r\n")
+        await resp.write(b"data: line2\r\n\r\ndata: [DONE]")
+        await resp.write_eof()
+        return resp
+
+    async def handle_predict(self, request: web.Request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            data = await request.read()
+            await asyncio.sleep(0.01)
+            if data == b"error":
+                return web.Response(status=500, body=b"internal error")
+            return web.Response(body=data)
+        finally:
+            self.in_flight -= 1
+
+
+class TestPredictor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = MockStandardService()
+        self.server = TestServer(self.service.app, host="127.0.0.1")
+        await self.server.start_server()
+        endpoint = str(self.server.make_url("/"))
+        self.describe_patch = patch.object(
+            Predictor,
+            "describe_service",
+            return_value=_service_api_object(endpoint),
+        )
+        self.describe_patch.start()
+
+    async def asyncTearDown(self):
+        self.describe_patch.stop()
+        await self.server.close()
+
+    def _make_predictor(self, **kwargs):
+        return Predictor(
+            service_name="test_service",
+            serializer=BytesSerializer(),
+            session=object(),
+            **kwargs,
+        )
+
+    async def test_predict_async(self):
+        async with self._make_predictor() as predictor:
+            self.assertEqual(await predictor.predict_async(b"hello"), b"hello")
+            resp = await predictor.raw_predict_async({"x": 1}, timeout=10)
+            self.assertEqual(resp.json(), {"x": 1})
+            with self.assertRaises(PredictionException):
+                await predictor.predict_async(b"error")
+
+    async def test_raw_predict_stream(self):
+        loop = asyncio.get_running_loop()
+        predictor = self._make_predictor()
+
+        def _consume():
+            with predictor.raw_predict(b"", path="stream", stream=True) as resp:
+                self.assertEqual(resp.headers["Content-Type"], "text/event-stream")
+                events = resp.iter_events()
+                # The first event is received before the response completes.
+                first = next(events)
+                loop.call_soon_threadsafe(self.service.stream_released.set)
+                return [first] + list(events)
+
+        events = await loop.run_in_executor(None, _consume)
+        self.assertEqual(events[0].json(), {"token": "hello"})
+        self.assertEqual(events[0].id, "1")
+        self.assertEqual(events[1].event, "done")
+        self.assertEqual(events[1].data, "line1\nline2")
+        self.assertEqual(events[2].data, "[DONE]")
+
+        self.service.stream_released.clear()
+        async with predictor:
+            resp = await predictor.raw_predict_async(b"", path="stream", stream=True)
+            async with resp:
+                self.assertEqual(resp.status_code, 200)
+                events = []
+                async for event in resp.iter_events():
+                    events.append(event)
+                    self.service.stream_released.set()
+            self.assertListEqual(
+                [e.data for e in events],
+                ['{"token": "hello"}', "line1\nline2", "[DONE]"],
+            )
+
+            with self.assertRaises(PredictionException):
+                await predictor.raw_predict_async(b"error", stream=True)
+
+    async def test_predict_many(self):
+        inputs = [f"request-{i}".encode() for i in range(40)]
+        async with self._make_predictor(max_connections=8) as predictor:
+            results = await predictor.predict_many_async(
+                (x for x in inputs), concurrency=4
+            )
+            self.assertListEqual(results, inputs)
+            self.assertLessEqual(self.service.max_in_flight, 4)
+            self.assertLessEqual(len(self.service.peers), 4)
+
+            with self.assertRaises(PredictionException):
+                await predictor.predict_many_async(inputs[:5] + [b"error"])
+
+        # Blocking version runs in its own event loop.
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: predictor.predict_many(inputs, concurrency=8)
+        )
+        self.assertListEqual(results, inputs)
+        self.assertIsNone(predictor._async_session)
+
+
+class TestLocalPredictor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = MockStandardService()
+        self.runner = web.AppRunner(self.service.app)
+        await self.runner.setup()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "server.sock")
+        self.tcp_site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await self.tcp_site.start()
+        await web.UnixSite(self.runner, self.socket_path).start()
+        self.port = self.tcp_site._server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+        self.temp_dir.cleanup()
+
+    async def _run_sync(self, fn):
+        return await asyncio.get_running_loop().run_in_executor(None, fn)
+
+    async def test_predict(self):
+        predictor = LocalPredictor(port=self.port, serializer=BytesSerializer())
+        inputs = [f"request-{i}".encode() for i in range(20)]
+        results = await self._run_sync(lambda: [predictor.predict(x) for x in inputs])
+        self.assertListEqual(results, inputs)
+        resp = await self._run_sync(lambda: predictor.raw_predict({"x": 1}))
+        self.assertEqual(resp.json(), {"x": 1})
+        # Requests reuse the keep-alive connection.
+        self.assertEqual(len(self.service.peers), 1)
+
+        async with predictor:
+            self.assertEqual(await predictor.predict_async(b"hello"), b"hello")
+            results = await predictor.predict_many_async(inputs, concurrency=4)
+            self.assertListEqual(results, inputs)
+            self.assertLessEqual(self.service.max_in_flight, 4)
+            with self.assertRaises(PredictionException):
+                await predictor.predict_async(b"error")
+
+        results = await self._run_sync(lambda: predictor.predict_many(inputs))
+        self.assertListEqual(results, inputs)
+
+    async def test_predict_unix_socket(self):
+        predictor = LocalPredictor(
+            port=self.port, serializer=BytesSerializer(), unix_socket=self.socket_path
+        )
+        # The TCP port is not used.
+        await self.tcp_site.stop()
+        self.assertEqual(await self._run_sync(lambda: predictor.predict(b"a")), b"a")
+        resp = await self._run_sync(lambda: predictor.raw_predict(b"b"))
+        self.assertEqual(resp.content, b"b")
+        with self.assertRaises(PredictionException):
+            await self._run_sync(lambda: predictor.predict(b"error"))
+
+        async with predictor:
+            self.assertListEqual(
+                await predictor.predict_many_async([b"c", b"d"]), [b"c", b"d"]
+            )
+
+
+class TestAsyncSessionLoopChange(unittest.TestCase):
+    def setUp(self):
+        self.service = MockStandardService()
+        self.server_loop = asyncio.new_event_loop()
+        self.server_thread = threading.Thread(target=self.server_loop.run_forever)
+        self.server_thread.start()
+        self.server = TestServer(self.service.app, host="127.0.0.1")
+        self._run_in_server_loop(self.server.start_server())
+        self.predictor = LocalPredictor(
+            port=self.server.port, serializer=BytesSerializer()
+        )
+
+    def tearDown(self):
+        self._run_in_server_loop(self.server.close())
+        self.server_loop.call_soon_threadsafe(self.server_loop.stop)
+        self.server_thread.join()
+        self.server_loop.close()
+
+    def _run_in_server_loop(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.server_loop).result()
+
+    async def _predict(self):
+        self.assertEqual(await self.predictor.predict_async(b"hello"), b"hello")
+        return self.predictor._async_session
+
+    def test_close_session_of_closed_loop(self):
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter("always")
+            session = asyncio.run(self._predict())
+            connector = session.connector
+            self.assertIsNot(asyncio.run(self._predict()), session)
+            self.assertTrue(session.closed)
+            self.assertTrue(connector.closed)
+            asyncio.run(self.predictor.close_async())
+        self.assertFalse([r for r in records if "Unclosed" in str(r.message)])
+
+    def test_close_session_of_running_loop(self):
+        session = self._run_in_server_loop(self._predict())
+        connector = session.connector
+        self.assertIsNot(asyncio.run(self._predict()), session)
+        self._run_in_server_loop(asyncio.sleep(0))
+        self.assertTrue(connector.closed)
+        asyncio.run(self.predictor.close_async())
+
+
+class TestBatchingPredictor(unittest.TestCase):
+    def _make_predictor(self, serializer, predict_fn):
+        predictor = MagicMock(spec=Predictor)
+        predictor.serializer = serializer
+        predictor.batches = []
+        lock = threading.Lock()
+
+        def _predict(data):
+            with lock:
+                predictor.batches.append(data)
+            return predict_fn(data)
+
+        predictor.predict.side_effect = _predict
+        return predictor
+
+    def test_batch_json_rows(self):
+        predictor = self._make_predictor(
+            JsonSerializer(), lambda rows: {"outputs": [sum(r) for r in rows]}
+        )
+        with BatchingPredictor(
+            predictor, max_batch_size=8, max_latency_ms=50
+        ) as batching_predictor, ThreadPoolExecutor(16) as executor:
+            results = list(
+                executor.map(lambda i: batching_predictor.predict([[i, i]]), range(32))
+            )
+            metrics = batching_predictor.metrics
+
+        self.assertListEqual(results, [{"outputs": [2 * i]} for i in range(32)])
+        self.assertLess(len(predictor.batches), 32)
+        self.assertTrue(all(len(batch) <= 8 for batch in predictor.batches))
+        self.assertEqual(metrics["request_count"], 32)
+        self.assertEqual(metrics["row_count"], 32)
+        self.assertEqual(metrics["batch_count"], len(predictor.batches))
+        self.assertLessEqual(metrics["max_batch_size"], 8)
+
+    def test_batch_pytorch_multiple_inputs(self):
+        predictor = self._make_predictor(
+            PyTorchSerializer(), lambda inputs: [inputs[0] * 2, inputs[1] + 1]
+        )
+        with BatchingPredictor(
+            predictor, max_batch_size=64, max_latency_ms=50
+        ) as batching_predictor:
+            futures = [
+                batching_predictor.submit(
+                    [np.full((2, 3), i, dtype=np.float32), np.array([i, i])]
+                )
+                for i in range(10)
+            ]
+            results = [f.result() for f in futures]
+
+        self.assertEqual(len(predictor.batches), 1)
+        self.assertEqual(predictor.batches[0][0].shape, (20, 3))
+        for i, (x, y) in enumerate(results):
+            self.assertTrue(np.array_equal(x, np.full((2, 3), 2 * i)))
+            self.assertListEqual(y.tolist(), [i + 1, i + 1])
+
+    def test_batch_latency(self):
+        predictor = self._make_predictor(JsonSerializer(), lambda data: data)
+        with BatchingPredictor(
+            predictor, max_batch_size=8, max_latency_ms=300
+        ) as batching_predictor:
+            first = batching_predictor.submit([[1]])
+            time.sleep(0.1)
+            start = time.time()
+            # Inputs of other structure are left to the next batch.
+            second = batching_predictor.submit({"x": [[2]]})
+            self.assertEqual(first.result(), [[1]])
+            self.assertEqual(second.result(), {"x": [[2]]})
+            # The deadline of the next batch is decided by its oldest call.
+            self.assertLess(time.time() - start, 0.45)
+        self.assertEqual(len(predictor.batches), 2)
+
+    def test_close_concurrent_submit(self):
+        predictor = self._make_predictor(JsonSerializer(), lambda data: data)
+        batching_predictor = BatchingPredictor(predictor, max_latency_ms=1)
+        futures = []
+
+        def _submit():
+            for i in range(200):
+                try:
+                    futures.append(batching_predictor.submit([[i]]))
+                except RuntimeError:
+                    return
+
+        threads = [threading.Thread(target=_submit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        batching_predictor.close()
+        for t in threads:
+            t.join()
+        # Calls submitted before the predictor is closed are all resolved.
+        for fut in futures:
+            self.assertEqual(len(fut.result(timeout=5)), 1)
+
+    def test_batch_error(self):
+        def _predict(rows):
+            raise PredictionException(code=500, message="internal error")
+
+        with BatchingPredictor(
+            self._make_predictor(JsonSerializer(), _predict)
+        ) as batching_predictor:
+            futures = [batching_predictor.submit([[i]]) for i in range(4)]
+            for f in futures:
+                with self.assertRaises(PredictionException):
+                    f.result()
+            with self.assertRaises(ValueError):
+                batching_predictor.submit("no batch dimension")
+            # Prediction result does not match the rows of the batch.
+            with self.assertRaises(ValueError):
+                batching_predictor._split([1, 2], [1, 2])
+
+        with self.assertRaises(ValueError):
+            BatchingPredictor(self._make_predictor(BytesSerializer(), lambda x: x))
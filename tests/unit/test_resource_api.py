@@ -0,0 +1,81 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from types import SimpleNamespace
+
+from mock import MagicMock, patch
+
+from pai.api.base import _TTLCache
+from pai.api.job import JobAPI
+from pai.api.service import ServiceAPI
+from tests.unit import BaseUnitTestCase
+
+
+class _Body(object):
+    def __init__(self, data):
+        self.data = data
+
+    def to_map(self):
+        return dict(self.data)
+
+
+class TestResourceAPICache(BaseUnitTestCase):
+    def _make_client(self):
+        client = MagicMock()
+        client.describe_service_with_options.side_effect = (
+            lambda cluster_id, service_name, headers, runtime: SimpleNamespace(
+                body=_Body({"ServiceName": service_name, "Status": "Running"})
+            )
+        )
+        return client
+
+    def test_cache_describe(self):
+        client = self._make_client()
+        api = ServiceAPI(region_id="cn-hangzhou", acs_client=client)
+
+        for _ in range(5):
+            self.assertEqual(api.get("service_a")["ServiceName"], "service_a")
+        api.get("service_b")
+        self.assertEqual(client.describe_service_with_options.call_count, 2)
+        self.assertDictEqual(api.cache_stats, {"hits": 4, "misses": 2, "size": 2})
+
+        # Actions that modify the services invalidate the cache.
+        api.stop("service_a")
+        api.get("service_a")
+        self.assertEqual(client.describe_service_with_options.call_count, 3)
+
+        api.invalidate_cache()
+        api.get("service_a")
+        self.assertEqual(client.describe_service_with_options.call_count, 4)
+
+    def test_cache_expire(self):
+        client = self._make_client()
+        api = ServiceAPI(region_id="cn-hangzhou", acs_client=client)
+        with patch("pai.api.base.time.monotonic", return_value=1000):
+            api.get("service_a")
+            api.get("service_a")
+        with patch(
+            "pai.api.base.time.monotonic", return_value=1000 + api.cache_ttl + 1
+        ):
+            api.get("service_a")
+        self.assertEqual(client.describe_service_with_options.call_count, 2)
+
+    def test_cache_opt_in(self):
+        self.assertIsNone(JobAPI(workspace_id="1", acs_client=MagicMock()).cache_stats)
+
+        cache = _TTLCache(ttl=60, max_size=2)
+        for key in ["a", "b", "c"]:
+            cache.put(key, key.upper())
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.get("c"), (True, "C"))
@@ -0,0 +1,165 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from eas_prediction import pytorch_predict_pb2 as pt_pb
+from eas_prediction import tf_request_pb2 as tf_pb
+
+from pai.common import proto_utils
+from pai.serializers import PyTorchSerializer, TensorFlowIOSpec, TensorFlowSerializer
+from tests.unit import BaseUnitTestCase
+
+
+class TestProtoUtils(BaseUnitTestCase):
+    def test_varint_array(self):
+        cases = [
+            np.array([], dtype=np.int64),
+            np.array([0, 1, 127], dtype=np.int32),
+            np.array([128, 300, -1, -(2**31), 2**31 - 1], dtype=np.int32),
+            np.array([-(2**63), 2**63 - 1, 1 << 40, 0], dtype=np.int64),
+        ]
+        for values in cases:
+            with self.subTest(values=values):
+                encoded = proto_utils.encode_varint_array(values)
+                expected = b"".join(
+                    proto_utils.encode_varint(int(v)) for v in values.tolist()
+                )
+                self.assertEqual(encoded, expected)
+                decoded = proto_utils.decode_varint_array(encoded).view(np.int64)
+                self.assertListEqual(decoded.tolist(), values.tolist())
+
+    def test_decode_truncated_varint(self):
+        with self.assertRaises(ValueError):
+            proto_utils.decode_varint_array(b"\x80\x80")
+
+
+class TestTensorFlowSerializer(BaseUnitTestCase):
+    def test_serialize(self):
+        serializer = TensorFlowSerializer()
+        data = {
+            "float": np.arange(12, dtype=np.float32).reshape(3, 4),
+            "double": np.array([0.5, -1.25]),
+            "int": np.array([-1, 300, 2**31 - 1], dtype=np.int32),
+            "int64": np.array([-(2**63), 2**63 - 1, 7]),
+            "bool": np.array([True, False]),
+            "string": np.array(["hello", "你好"]),
+            "empty": np.zeros((0, 2), dtype=np.float32),
+        }
+
+        request = tf_pb.PredictRequest()
+        request.ParseFromString(serializer.serialize(data))
+
+        self.assertSetEqual(set(request.inputs.keys()), set(data.keys()))
+        self.assertEqual(list(request.inputs["float"].array_shape.dim), [3, 4])
+        self.assertEqual(request.inputs["float"].dtype, tf_pb.DT_FLOAT)
+        self.assertListEqual(
+            list(request.inputs["float"].float_val), data["float"].ravel().tolist()
+        )
+        self.assertListEqual(list(request.inputs["double"].double_val), [0.5, -1.25])
+        self.assertListEqual(list(request.inputs["int"].int_val), data["int"].tolist())
+        self.assertListEqual(
+            list(request.inputs["int64"].int64_val), data["int64"].tolist()
+        )
+        self.assertListEqual(list(request.inputs["bool"].bool_val), [True, False])
+        self.assertListEqual(
+            list(request.inputs["string"].string_val),
+            ["hello".encode(), "你好".encode()],
+        )
+        self.assertEqual(list(request.inputs["empty"].array_shape.dim), [0, 2])
+
+    def test_serialize_with_input_spec(self):
+        serializer = TensorFlowSerializer()
+        serializer._input_specs = [
+            TensorFlowIOSpec(name="x", shape=[-1, 2], data_type=tf_pb.DT_FLOAT)
+        ]
+        serializer._output_filter = ["y"]
+
+        request = tf_pb.PredictRequest()
+        request.ParseFromString(serializer.serialize([1, 2, 3, 4]))
+
+        self.assertListEqual(list(request.output_filter), ["y"])
+        self.assertEqual(list(request.inputs["x"].array_shape.dim), [2, 2])
+        self.assertListEqual(list(request.inputs["x"].float_val), [1, 2, 3, 4])
+
+    def test_deserialize(self):
+        response = tf_pb.PredictResponse()
+        response.outputs["float"].dtype = tf_pb.DT_FLOAT
+        response.outputs["float"].array_shape.dim.extend([2, 2])
+        response.outputs["float"].float_val.extend([1.0, 2.0, 3.0, 4.0])
+        response.outputs["int"].dtype = tf_pb.DT_INT32
+        response.outputs["int"].array_shape.dim.extend([3])
+        response.outputs["int"].int_val.extend([-3, 0, 1000])
+        response.outputs["int64"].dtype = tf_pb.DT_INT64
+        response.outputs["int64"].array_shape.dim.extend([1])
+        response.outputs["int64"].int64_val.extend([-(2**40)])
+        response.outputs["string"].dtype = tf_pb.DT_STRING
+        response.outputs["string"].array_shape.dim.extend([2])
+        response.outputs["string"].string_val.extend([b"a", "你好".encode()])
+
+        results = TensorFlowSerializer().deserialize(response.SerializeToString())
+
+        self.assertEqual(results["float"].dtype, np.float32)
+        self.assertListEqual(results["float"].tolist(), [[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(results["int"].dtype, np.int32)
+        self.assertListEqual(results["int"].tolist(), [-3, 0, 1000])
+        self.assertListEqual(results["int64"].tolist(), [-(2**40)])
+        self.assertListEqual(results["string"].tolist(), ["a", "你好"])
+
+
+class TestPyTorchSerializer(BaseUnitTestCase):
+    def test_serialize_multiple_inputs(self):
+        serializer = PyTorchSerializer()
+        data = [
+            np.arange(6, dtype=np.float32).reshape(2, 3),
+            np.array([-1, 2**40], dtype=np.int64),
+        ]
+
+        request = pt_pb.PredictRequest()
+        request.ParseFromString(serializer.serialize(data))
+
+        self.assertEqual(len(request.inputs), 2)
+        self.assertEqual(request.inputs[0].dtype, pt_pb.DT_FLOAT)
+        self.assertEqual(list(request.inputs[0].array_shape.dim), [2, 3])
+        self.assertListEqual(list(request.inputs[0].float_val), list(range(6)))
+        self.assertEqual(request.inputs[1].dtype, pt_pb.DT_INT64)
+        self.assertListEqual(list(request.inputs[1].int64_val), [-1, 2**40])
+
+    def test_serialize_map_inputs(self):
+        request = pt_pb.PredictRequest()
+        request.ParseFromString(
+            PyTorchSerializer().serialize({"x": np.array([1.5, 2.5])})
+        )
+
+        self.assertEqual(len(request.inputs), 0)
+        self.assertListEqual(list(request.map_inputs["x"].double_val), [1.5, 2.5])
+
+    def test_deserialize(self):
+        response = pt_pb.PredictResponse()
+        output = response.outputs.add()
+        output.dtype = pt_pb.DT_FLOAT
+        output.array_shape.dim.extend([2, 2])
+        output.float_val.extend([1.0, 2.0, 3.0, 4.0])
+        serializer = PyTorchSerializer()
+
+        result = serializer.deserialize(response.SerializeToString())
+        self.assertEqual(result.dtype, np.float32)
+        self.assertListEqual(result.tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+        output = response.outputs.add()
+        output.dtype = pt_pb.DT_INT32
+        output.array_shape.dim.extend([1])
+        output.int_val.append(-7)
+        results = serializer.deserialize(response.SerializeToString())
+        self.assertEqual(len(results), 2)
+        self.assertListEqual(results[1].tolist(), [-7])
@@ -13,9 +13,13 @@
 #  limitations under the License.
 
 import json
+import subprocess
+import sys
 import tempfile
 from unittest.case import TestCase
 
+from alibabacloud_credentials.models import Config as CredentialConfig
+
 from pai.session import Session
 
 
@@ -35,3 +39,39 @@ class TestSession(TestCase):
             res = json.load(f)
 
         self.assertEqual(res, d)
+
+    def test_reuse_oss_bucket(self):
+        s = Session(
+            region_id="cn-hangzhou",
+            workspace_id="workspace_id",
+            oss_bucket_name="test-bucket",
+            oss_endpoint="oss-cn-hangzhou.aliyuncs.com",
+            credential_config=CredentialConfig(
+                type="access_key",
+                access_key_id="access_key_id",
+                access_key_secret="access_key_secret",
+            ),
+        )
+        bucket = s.oss_bucket
+        self.assertIs(s.oss_bucket, bucket)
+        self.assertIs(s.get_oss_bucket("test-bucket"), bucket)
+
+        other_bucket = s.get_oss_bucket("other-bucket")
+        self.assertIsNot(other_bucket, bucket)
+        self.assertIsNot(
+            s.get_oss_bucket("other-bucket", "oss-cn-shanghai.aliyuncs.com"),
+            other_bucket,
+        )
+        # Buckets share the credentials and the HTTP connection pool.
+        self.assertIs(other_bucket.auth, bucket.auth)
+        self.assertIs(other_bucket.session, bucket.session)
+
+    def test_lazy_import(self):
+        script = (
+            "import sys, pai, pai.predictor\n"
+            "assert not [m for m in sys.modules if m.startswith('pai.libs.')]\n"
+            "session = pai.Session(region_id='cn-hangzhou', network='public')\n"
+            "assert session.service_api.__class__.__name__ == 'ServiceAPI'\n"
+            "assert 'pai.libs.alibabacloud_eas20210701.client' in sys.modules\n"
+        )
+        subprocess.check_call([sys.executable, "-c", script])
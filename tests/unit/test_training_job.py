@@ -0,0 +1,443 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from mock import patch
+
+from pai.api.base import PaginatedResult
+from pai.estimator import Estimator
+from pai.job import (
+    TrainingJob,
+    TrainingJobBatch,
+    TrainingJobLogStream,
+    TrainingJobStatus,
+    TrainingJobWatcher,
+)
+from tests.unit import BaseUnitTestCase
+
+
+class MockTrainingJobAPI(object):
+    """A training job API, the status of a job moves to the next one on each
+    request that returns the job."""
+
+    def __init__(self, job_statuses):
+        self.job_statuses = {k: list(v) for k, v in job_statuses.items()}
+        self.list_count = 0
+        self.get_count = 0
+        self.lock = threading.Lock()
+
+    def _next(self, job_id):
+        statuses = self.job_statuses[job_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return {"TrainingJobId": job_id, "Status": status}
+
+    def get(self, training_job_id):
+        with self.lock:
+            self.get_count += 1
+            return self._next(training_job_id)
+
+    def list(self, page_number=1, page_size=20, labels=None, **kwargs):
+        with self.lock:
+            self.list_count += 1
+            job_ids = sorted(self.job_statuses)
+            start = (page_number - 1) * page_size
+            items = [self._next(k) for k in job_ids[start : start + page_size]]
+            return PaginatedResult(items=items, total_count=len(job_ids))
+
+
+class TestTrainingJobWatcher(BaseUnitTestCase):
+    def _make_watcher(self, api, **kwargs):
+        session = SimpleNamespace(training_job_api=api)
+        return TrainingJobWatcher(
+            session=session, interval=0.01, max_interval=0.05, **kwargs
+        )
+
+    def test_watch_jobs(self):
+        running = [TrainingJobStatus.Running] * 3
+        api = MockTrainingJobAPI(
+            {
+                "job-{:03d}".format(i): running[: i % 4] + [TrainingJobStatus.Succeed]
+                for i in range(200)
+            }
+        )
+        api.job_statuses["job-007"] = running + [TrainingJobStatus.Failed]
+        watcher = self._make_watcher(api)
+
+        completed = []
+        futures = {
+            job_id: watcher.watch(job_id, callback=completed.append)
+            for job_id in sorted(api.job_statuses)
+        }
+        for job_id, fut in futures.items():
+            job = fut.result(timeout=5)
+            self.assertIsInstance(job, TrainingJob)
+            self.assertEqual(job.training_job_id, job_id)
+        self.assertEqual(futures["job-007"].result().status, TrainingJobStatus.Failed)
+        self.assertEqual(len(completed), 200)
+        self.assertListEqual(watcher.pending_jobs, [])
+        # The completed jobs are not kept by the watcher.
+        self.assertDictEqual(watcher._futures, {})
+        self.assertDictEqual(watcher._statuses, {})
+
+        # A cancelled job is not watched anymore.
+        api.job_statuses["job-running"] = [TrainingJobStatus.Running]
+        fut = watcher.watch("job-running")
+        fut.cancel()
+        for _ in range(100):
+            if watcher._thread is None:
+                break
+            time.sleep(0.01)
+        self.assertIsNone(watcher._thread)
+        self.assertDictEqual(watcher._futures, {})
+        self.assertDictEqual(watcher._statuses, {})
+
+        # All the jobs are refreshed by a single listing (2 pages) per tick, the
+        # first tick may see only part of the jobs.
+        self.assertLessEqual(api.list_count, (4 + 1) * 2)
+        self.assertLessEqual(api.get_count, 1)
+
+    def test_list_recent_jobs(self):
+        api = MockTrainingJobAPI(
+            {"job-{:04d}".format(i): [TrainingJobStatus.Succeed] for i in range(1000)}
+        )
+        jobs = self._make_watcher(api)._list_jobs(["job-0000", "job-0001"])
+        self.assertSetEqual(set(jobs), {"job-0000", "job-0001"})
+        # The pages are not prefetched once the watched jobs are found.
+        self.assertEqual(api.list_count, 1)
+        self.assertEqual(api.get_count, 0)
+
+    def test_fallback_to_get(self):
+        api = MockTrainingJobAPI(
+            {
+                "job-a": [TrainingJobStatus.Running, TrainingJobStatus.Succeed],
+                "job-b": [TrainingJobStatus.Succeed],
+            }
+        )
+        watcher = self._make_watcher(api)
+        # A job that is not in the listed jobs is refreshed by a get request.
+        api_list = api.list
+        api.list = lambda **kwargs: PaginatedResult(
+            items=[
+                i for i in api_list(**kwargs).items if i["TrainingJobId"] != "job-a"
+            ],
+            total_count=1,
+        )
+        futures = [watcher.watch("job-a"), watcher.watch("job-b")]
+        self.assertListEqual(
+            [fut.result(timeout=5).status for fut in futures],
+            [TrainingJobStatus.Succeed] * 2,
+        )
+        self.assertGreaterEqual(api.get_count, 1)
+
+    def test_adaptive_interval(self):
+        api = MockTrainingJobAPI(
+            {"job-a": [TrainingJobStatus.Running] * 10 + [TrainingJobStatus.Succeed]}
+        )
+        watcher = self._make_watcher(api)
+        with patch("pai.job._training_job.time.sleep") as sleep:
+            watcher.watch("job-a").result(timeout=5)
+        intervals = [c.args[0] for c in sleep.call_args_list]
+        # The interval is reset when the status changes, and grows to the max
+        # interval while the status is unchanged.
+        self.assertEqual(intervals[0], 0.01)
+        self.assertEqual(intervals[1], 0.015)
+        self.assertEqual(intervals[-1], 0.01)
+        self.assertIn(0.05, intervals)
+
+
+class FailingTrainingJobAPI(MockTrainingJobAPI):
+    """A training job API that fails after the given number of get requests."""
+
+    def __init__(self, job_statuses, get_before_failure=0):
+        super(FailingTrainingJobAPI, self).__init__(job_statuses)
+        self.get_before_failure = get_before_failure
+
+    def get(self, training_job_id):
+        with self.lock:
+            if self.get_count >= self.get_before_failure:
+                raise RuntimeError("Forbidden")
+        return super(FailingTrainingJobAPI, self).get(training_job_id)
+
+    def list(self, **kwargs):
+        raise RuntimeError("Forbidden")
+
+
+class _Session(object):
+    def __init__(self, training_job_api):
+        self.training_job_api = training_job_api
+
+
+class TestTrainingJobWatcherFailure(BaseUnitTestCase):
+    def test_watch_fail(self):
+        api = FailingTrainingJobAPI(
+            {"job-a": [TrainingJobStatus.Running], "job-b": [TrainingJobStatus.Running]}
+        )
+        watcher = TrainingJobWatcher(
+            session=_Session(api), interval=0.01, max_interval=0.05
+        )
+        completed = []
+        futures = [
+            watcher.watch(job_id, callback=completed.append)
+            for job_id in api.job_statuses
+        ]
+        for fut in futures:
+            with self.assertRaisesRegex(RuntimeError, "Forbidden"):
+                fut.result(timeout=5)
+        self.assertListEqual(completed, [])
+        self.assertListEqual(watcher.pending_jobs, [])
+
+    def test_wait_fail(self):
+        api = FailingTrainingJobAPI(
+            {"job-a": [TrainingJobStatus.Running]}, get_before_failure=2
+        )
+        job = TrainingJob.model_validate(
+            {"TrainingJobId": "job-a", "Status": TrainingJobStatus.Running}
+        )
+        with patch(
+            "pai.job._training_job.get_default_session", return_value=_Session(api)
+        ):
+            with self.assertRaisesRegex(RuntimeError, "Forbidden"):
+                job.wait(interval=0.01, show_logs=False)
+
+
+class MockTrainingJobCreateAPI(MockTrainingJobAPI):
+    """A training job API that creates the jobs concurrently."""
+
+    def __init__(self, fail_jobs=None):
+        super(MockTrainingJobCreateAPI, self).__init__({})
+        self.created = {}
+        self.fail_jobs = fail_jobs or set()
+        self.active = 0
+        self.max_active = 0
+
+    def create(self, job_name, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.02)
+            if job_name in self.fail_jobs:
+                raise RuntimeError("Failed to create job: %s" % job_name)
+            with self.lock:
+                job_id = "job-%03d" % len(self.created)
+                self.created[job_id] = dict(job_name=job_name, **kwargs)
+                self.job_statuses[job_id] = [TrainingJobStatus.Succeed]
+            return job_id
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _next(self, job_id):
+        item = super(MockTrainingJobCreateAPI, self)._next(job_id)
+        item["TrainingJobName"] = self.created[job_id]["job_name"]
+        return item
+
+
+class TestEstimatorFitMany(BaseUnitTestCase):
+    def setUp(self):
+        super(TestEstimatorFitMany, self).setUp()
+        self.api = MockTrainingJobCreateAPI()
+        session = SimpleNamespace(training_job_api=self.api)
+        for target in [
+            "pai.estimator.get_default_session",
+            "pai.job._training_job.get_default_session",
+        ]:
+            p = patch(target, return_value=session)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _make_estimator(self):
+        return Estimator(
+            image_uri="training-image",
+            command="python train.py",
+            instance_type="ecs.c6.large",
+            hyperparameters={"lr": 0.1, "epochs": 10},
+            output_path="oss://test-bucket/output/",
+        )
+
+    def test_fit_many(self):
+        est = self._make_estimator()
+        hps = [{"lr": 0.1 / (i + 1)} for i in range(20)]
+        batch = est.fit_many(hps, max_concurrency=4, job_name="sweep")
+
+        self.assertIsInstance(batch, TrainingJobBatch)
+        self.assertEqual(len(batch), 20)
+        self.assertGreater(batch.throughput, 0)
+        self.assertLessEqual(self.api.max_active, 4)
+        self.assertGreater(self.api.max_active, 1)
+        # Details of the jobs are fetched by list requests.
+        self.assertEqual(self.api.get_count, 0)
+
+        created = sorted(self.api.created.values(), key=lambda c: c["job_name"])
+        self.assertEqual(len({c["job_name"] for c in created}), 20)
+        self.assertEqual(
+            len({c["output_channels"][0]["OutputUri"] for c in created}), 20
+        )
+        for job in batch:
+            idx = int(job.training_job_name.rsplit("-", 1)[1])
+            config = self.api.created[job.training_job_id]
+            self.assertDictEqual(
+                config["hyperparameters"], {"lr": hps[idx]["lr"], "epochs": 10}
+            )
+        self.assertListEqual(est._training_jobs, batch.training_jobs)
+
+        batch.wait(interval=0.01)
+        self.assertListEqual(
+            [job.status for job in batch], [TrainingJobStatus.Succeed] * 20
+        )
+        self.assertListEqual(batch.failed_jobs, [])
+
+    def test_fit_many_error(self):
+        est = self._make_estimator()
+        self.api.fail_jobs.add("sweep-3")
+        with self.assertRaises(RuntimeError):
+            est.fit_many([{"lr": i} for i in range(5)], job_name="sweep")
+        # Jobs created before the error are tracked by the estimator.
+        self.assertEqual(len(est._training_jobs), 4)
+
+        est.instance_type = "local"
+        with self.assertRaises(ValueError):
+            est.fit_many([{"lr": 0.1}])
+
+
+class MockTrainingJobLogAPI(object):
+    """A training job API that serves the logs of multiple workers."""
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.requests = []
+
+    def get(self, training_job_id):
+        return {"Instances": [{"Name": worker_id} for worker_id in self.logs]}
+
+    def list_logs(self, training_job_id, worker_id, page_number, page_size):
+        self.requests.append((worker_id, page_number, page_size))
+        start = (page_number - 1) * page_size
+        items = self.logs[worker_id][start : start + page_size]
+        return PaginatedResult(items=list(items), total_count=len(items))
+
+
+class TestTrainingJobLogStream(BaseUnitTestCase):
+    def _log(self, second, worker_id, i):
+        return "2024-01-01 00:{:02d}:{:02d} {} line {}".format(
+            second // 60, second % 60, worker_id, i
+        )
+
+    def test_poll_merge_workers(self):
+        api = MockTrainingJobLogAPI(
+            {
+                "worker-0": [self._log(2 * i, "worker-0", i) for i in range(500)],
+                "worker-1": [self._log(2 * i + 1, "worker-1", i) for i in range(300)],
+            }
+        )
+        stream = TrainingJobLogStream(
+            "job-1", session=SimpleNamespace(training_job_api=api)
+        )
+        records = stream.poll()
+        self.assertEqual(len(records), 800)
+        timestamps = [r.timestamp for r in records]
+        self.assertListEqual(timestamps, sorted(timestamps))
+        self.assertListEqual(
+            [r.message for r in records if r.worker_id == "worker-1"],
+            api.logs["worker-1"],
+        )
+        # Page size grows while the pages are full.
+        self.assertLess(len(api.requests), 800 / 20)
+        self.assertEqual(max(r[2] for r in api.requests), 100)
+
+        # New logs are fetched from the cursor of the worker.
+        api.logs["worker-1"].append("Traceback (most recent call last):")
+        api.logs["worker-0"].append(self._log(1200, "worker-0", 500))
+        self.assertListEqual(
+            [r.message for r in stream.poll()],
+            ["Traceback (most recent call last):", self._log(1200, "worker-0", 500)],
+        )
+        self.assertListEqual(stream.poll(), [])
+
+        # Lines without timestamp at the start of a poll follow the previous line
+        # of the worker.
+        api.logs["worker-1"].append(self._log(1300, "worker-1", 301))
+        stream.poll()
+        api.logs["worker-1"].append("ValueError: invalid value")
+        api.logs["worker-0"].append(self._log(1250, "worker-0", 501))
+        self.assertListEqual(
+            [r.message for r in stream.poll()],
+            [self._log(1250, "worker-0", 501), "ValueError: invalid value"],
+        )
+
+    def test_discover_workers_later(self):
+        api = MockTrainingJobLogAPI({"worker-0": ["line 0"], "worker-1": ["line 1"]})
+        instances = []
+        api.get = lambda training_job_id: {"Instances": list(instances)}
+        list_logs = api.list_logs
+        # Logs of the default worker are returned if no worker is specified.
+        api.list_logs = lambda job_id, worker_id, **kwargs: list_logs(
+            job_id, worker_id or "worker-0", **kwargs
+        )
+        stream = TrainingJobLogStream(
+            "job-1", session=SimpleNamespace(training_job_api=api)
+        )
+        self.assertListEqual([r.message for r in stream.poll()], ["line 0"])
+        self.assertListEqual(stream.worker_ids, [None])
+
+        instances.extend([{"Name": "worker-0"}, {"Name": "worker-1"}])
+        api.logs["worker-0"].append("line 2")
+        with patch("pai.job._training_job._LOG_WORKER_TTL", 0):
+            records = stream.poll()
+        # Logs of the default worker are not fetched twice.
+        self.assertListEqual(sorted(r.message for r in records), ["line 1", "line 2"])
+        self.assertListEqual(stream.worker_ids, ["worker-0", "worker-1"])
+        self.assertListEqual(stream.poll(), [])
+
+    def test_iter_logs(self):
+        api = MockTrainingJobLogAPI({"worker-0": ["line 0", "line 1"]})
+        stream = TrainingJobLogStream(
+            "job-1", session=SimpleNamespace(training_job_api=api), interval=0.01
+        )
+        self.assertListEqual(
+            [r.message for r in stream.iter_logs(follow=False)], ["line 0", "line 1"]
+        )
+
+        stop_event = threading.Event()
+        messages = []
+        api.logs["worker-0"].append("line 2")
+        for record in stream.iter_logs(follow=True, stop_event=stop_event):
+            messages.append(record.message)
+            if record.message == "line 2":
+                stop_event.set()
+                # Logs produced before the stream stops are drained.
+                api.logs["worker-0"].append("line 3")
+        self.assertListEqual(messages, ["line 2", "line 3"])
+
+
+class TestTrainingJobLogStreamAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_aiter_logs(self):
+        api = MockTrainingJobLogAPI({"worker-0": ["line 0"], "worker-1": ["line 1"]})
+        stream = TrainingJobLogStream(
+            "job-1", session=SimpleNamespace(training_job_api=api), interval=0.01
+        )
+        stop_event = asyncio.Event()
+        records = []
+        async for record in stream.aiter_logs(stop_event=stop_event):
+            records.append(record)
+            stop_event.set()
+        self.assertSetEqual(
+            {(r.worker_id, r.message) for r in records},
+            {("worker-0", "line 0"), ("worker-1", "line 1")},
+        )
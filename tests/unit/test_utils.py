@@ -17,9 +17,17 @@
 from __future__ import absolute_import, print_function
 
 import os
+import threading
+import time
 
+from pai.api.base import PaginatedResult
 from pai.common.oss_utils import is_oss_uri
-from pai.common.utils import generate_repr, is_filesystem_uri, is_odps_table_uri
+from pai.common.utils import (
+    generate_repr,
+    is_filesystem_uri,
+    is_odps_table_uri,
+    make_list_resource_iterator,
+)
 from tests.test_data import SCRIPT_DIR_PATH
 from tests.unit import BaseUnitTestCase
 from tests.unit.utils import extract_odps_table_info, file_checksum
@@ -197,3 +205,68 @@ class TestUtils(BaseUnitTestCase):
             with self.subTest(tc=tc):
                 result = is_filesystem_uri(tc["arguments"]["uri"])
                 self.assertEqual(result, tc["expected"])
+
+
+class MockListAPI(object):
+    """A paginated list API with a fixed latency."""
+
+    def __init__(self, total_count, latency=0.05, paginated=True):
+        self.items = list(range(total_count))
+        self.latency = latency
+        self.paginated = paginated
+        self.pages = []
+        self.concurrency = 0
+        self.max_concurrency = 0
+        self._lock = threading.Lock()
+
+    def list(self, page_number=1, page_size=10):
+        with self._lock:
+            self.pages.append(page_number)
+            self.concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self.concurrency)
+        time.sleep(self.latency)
+        with self._lock:
+            self.concurrency -= 1
+        start = (page_number - 1) * page_size
+        items = self.items[start : start + page_size]
+        if self.paginated:
+            return PaginatedResult(items=items, total_count=len(self.items))
+        return items
+
+
+class TestListResourceIterator(BaseUnitTestCase):
+    def test_prefetch_pages(self):
+        api = MockListAPI(total_count=205)
+        start = time.time()
+        items = list(make_list_resource_iterator(api.list, page_size=10))
+        self.assertListEqual(items, api.items)
+        self.assertEqual(sorted(api.pages), list(range(1, 22)))
+        self.assertEqual(api.max_concurrency, 8)
+        # 1 request for the first page, and 20 pages fetched by 8 workers.
+        self.assertLess(time.time() - start, 8 * api.latency)
+
+        api = MockListAPI(total_count=205)
+        items = list(
+            make_list_resource_iterator(api.list, page_size=10, prefetch_pages=64)
+        )
+        self.assertListEqual(items, api.items)
+        self.assertEqual(api.max_concurrency, 20)
+
+    def test_serial_fallback(self):
+        for api, kwargs in [
+            (MockListAPI(total_count=35, latency=0, paginated=False), {}),
+            (MockListAPI(total_count=35, latency=0), {"prefetch_pages": 1}),
+        ]:
+            items = list(make_list_resource_iterator(api.list, page_size=10, **kwargs))
+            self.assertListEqual(items, api.items)
+            self.assertListEqual(api.pages, [1, 2, 3, 4])
+            self.assertEqual(api.max_concurrency, 1)
+
+    def test_early_stop(self):
+        api = MockListAPI(total_count=1000, latency=0.01)
+        it = make_list_resource_iterator(api.list, page_size=10, prefetch_pages=4)
+        self.assertListEqual([next(it) for _ in range(15)], list(range(15)))
+        it.close()
+        time.sleep(0.05)
+        # Only the pages in the prefetch window are fetched.
+        self.assertLessEqual(len(api.pages), 1 + 4 + 1)